@@ -21,6 +21,7 @@ kubectl apply -f k8s/service-grpc.yaml
 echo "Applying Application Deployments..."
 kubectl apply -f k8s/deployment-api.yaml
 kubectl apply -f k8s/deployment-worker.yaml
+kubectl apply -f k8s/deployment-outbox-relay.yaml
 kubectl apply -f k8s/deployment-mcp.yaml
 kubectl apply -f k8s/deployment-market-data.yaml
 kubectl apply -f k8s/deployment-order-service.yaml
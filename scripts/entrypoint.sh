@@ -14,6 +14,10 @@ case "$1" in
     echo "Starting Celery Worker..."
     exec celery -A src.infrastructure.celery_app worker --loglevel=info
     ;;
+  outbox-relay)
+    echo "Starting Outbox Relay (API-side events to Celery)..."
+    exec python -m src.infrastructure.outbox
+    ;;
   mcp)
     echo "Starting MCP Server (AI Agent)..."
     # Runs in SSE mode by default for Docker networking
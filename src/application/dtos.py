@@ -2,6 +2,8 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional, Dict, Any
 
+from src.domain.risk import DEFAULT_ACCOUNT
+
 # 1. Base Schema (Shared fields)
 class OrderBase(BaseModel):
     symbol: str = Field(..., min_length=3, max_length=5, description="Asset Symbol (e.g. BTC)")
@@ -13,6 +15,8 @@ class OrderBase(BaseModel):
 class OrderCreate(OrderBase):
     # Optional metadata user might send
     metadata: Optional[Dict[str, Any]] = None
+    # Risk limits (positions, exposure) are kept per account
+    account_id: str = Field(DEFAULT_ACCOUNT, min_length=1, max_length=64)
 
     @field_validator('quantity', 'price')
     @classmethod
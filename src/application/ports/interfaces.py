@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set
 from src.domain.entities import Order
+from src.domain.events import DomainEvent
 
 # 1. The Repository Port
 # The Use Case says: "I need a place to store Orders. I don't care if it's SQL or RAM."
@@ -10,14 +11,55 @@ class OrderRepository(ABC):
         """Mark an order to be saved."""
         pass
 
+    async def add_many(self, orders: List[Order]) -> None:
+        """Save a batch of orders. Adapters should override this with a bulk insert."""
+        for order in orders:
+            await self.add(order)
+
     @abstractmethod
     async def get_by_id(self, order_id: str) -> Optional[Order]:
         pass
 
+    async def existing_ids(self, order_ids: List[str]) -> Set[str]:
+        """The given IDs that are already stored. Adapters should override this with one query."""
+        return {order_id for order_id in order_ids if await self.get_by_id(order_id) is not None}
+
+    @abstractmethod
+    async def list_page(self, after_id: Optional[str] = None, limit: int = 100) -> List[Order]:
+        """
+        Keyset pagination in ID order, which is creation order (src.domain.ids):
+        the orders after `after_id`. Pass the last ID of a page to get the next
+        one, or `id_floor(t)` to start at a point in time.
+        """
+        pass
+
+# Transactional outbox: events are stored with the change that caused them and
+# published afterwards by a relay, so a broker outage can neither lose them nor slow the order path.
+class OutboxRepository(ABC):
+    @abstractmethod
+    async def add(self, event: DomainEvent) -> None:
+        """Store an event in the current transaction."""
+        pass
+
+    async def add_many(self, events: List[DomainEvent]) -> None:
+        for event in events:
+            await self.add(event)
+
+    @abstractmethod
+    async def claim(self, topic_prefix: str, limit: int) -> List[DomainEvent]:
+        """Oldest unpublished events whose topic starts with the prefix, locked for this transaction."""
+        pass
+
+    @abstractmethod
+    async def remove(self, event_ids: List[int]) -> None:
+        """Delete published events."""
+        pass
+
 # 2. The Unit of Work Port
 # The Use Case says: "I need a transaction boundary."
 class AbstractUnitOfWork(ABC):
     orders: OrderRepository  # The UoW provides access to the Repos
+    outbox: OutboxRepository
 
     async def __aenter__(self) -> 'AbstractUnitOfWork':
         return self
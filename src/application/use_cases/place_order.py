@@ -1,73 +1,93 @@
-import uuid
+from typing import Optional
+
 import structlog
 from src.domain.entities import Order
 from src.application.ports.interfaces import AbstractUnitOfWork, ExchangeClient
 from src.application.dtos import OrderCreate, OrderResponse
+from src.domain.events import DomainEvent
+from src.domain.ids import new_order_id
+from src.domain.risk import RiskEngine
 from src.domain.services import SymbolRegistry
-from src.application.tasks import handle_order_created
+
+# Outbox topic = Celery task run for every new order (relayed by src.infrastructure.outbox)
+ORDER_CREATED_TASK = "tasks.handle_order_created"
 
 logger = structlog.get_logger()
 
 class PlaceOrderUseCase:
-    def __init__(self, uow: AbstractUnitOfWork, exchange: ExchangeClient):
+    def __init__(self, uow: AbstractUnitOfWork, exchange: ExchangeClient, risk: Optional[RiskEngine] = None):
         # Dependency Injection: We depend on the Abstract UoW, not a specific DB
         self.uow = uow
         self.exchange = exchange
+        # Pre-trade limits, checked in memory before anything is written
+        self.risk = risk
 
     async def execute(self, data: OrderCreate) -> OrderResponse:
         """
         1. Open Transaction
-        2. Create Domain Entity
-        3. Add to Repo
+        2. Pre-trade risk check, then Create Domain Entity
+        3. Add to Repo (and the order_created event to the outbox)
         4. Commit
         """
         logger.info("placing_order", symbol=data.symbol, side=data.side, qty=data.quantity)
 
-        async with self.uow:
-            # VALIDATION via Domain Service
-            SymbolRegistry.validate(data.symbol)
-
-            # Use the Adapter to get external data
-            # We fetch the "Real" market price to store as metadata or validate spread
-            market_price = await self.exchange.get_current_price(data.symbol)
-
-            if data.metadata is None:
-                data.metadata = {}
-            data.metadata["market_price_snapshot"] = market_price
-
-            # Create the Domain Entity (Pure Python)
-            # Business Logic: Generate ID here, not in DB
-            new_order = Order(
-                order_id=str(uuid.uuid4()),
-                symbol=data.symbol,
-                quantity=data.quantity,
-                price=data.price,
-                side=data.side,
-                metadata=data.metadata
-            )
-
-            # Persist using the Repository inside the UoW
-            # Note: We use .add(), not .save(). It's not in the DB yet.
-            await self.uow.orders.add(new_order)
-
-            # request_id auto-added by middleware
-            #logger.info("order_created", order_id=new_order.order_id, price=new_order.price)
-
-            # Commit happens automatically on __exit__
-            # If line 2 failed, Commit would never happen.
-
-            # Return DTO
-            #return OrderResponse.model_validate(new_order)
-
-        # 3. Event Publishing (Fire and Forget)
-        # We prefer doing this AFTER the transaction is committed.
-        # .delay(): sends the message to RabbitMQ
-        handle_order_created.delay(
-            order_id=new_order.order_id,
-            symbol=new_order.symbol,
-            price=new_order.price
-        )
-
-        logger.info("domain_event_published", event_type="order_created", order_id=new_order.order_id)
+        reserved = False
+        try:
+            async with self.uow:
+                # VALIDATION via Domain Service
+                SymbolRegistry.validate(data.symbol)
+
+                # Use the Adapter to get external data
+                # We fetch the "Real" market price to store as metadata or validate spread
+                market_price = await self.exchange.get_current_price(data.symbol)
+
+                if data.metadata is None:
+                    data.metadata = {}
+                data.metadata["market_price_snapshot"] = market_price
+
+                # RISK: order size, position/exposure and fat-finger band; raises RiskLimitExceededError
+                if self.risk is not None:
+                    self.risk.check(data.account_id, data.symbol, data.side, data.quantity, data.price, market_price)
+                    # Counts towards the account's exposure from now on, unless the commit fails
+                    self.risk.reserve(data.account_id, data.symbol, data.side, data.quantity, data.price)
+                    reserved = True
+
+                # Create the Domain Entity (Pure Python)
+                # Business Logic: Generate ID here, not in DB (time-sortable, see src.domain.ids)
+                new_order = Order(
+                    order_id=new_order_id(),
+                    symbol=data.symbol,
+                    quantity=data.quantity,
+                    price=data.price,
+                    side=data.side,
+                    metadata=data.metadata
+                )
+
+                # Persist using the Repository inside the UoW
+                # Note: We use .add(), not .save(). It's not in the DB yet.
+                await self.uow.orders.add(new_order)
+
+                # The event is stored in the same transaction: it exists if and only if the order does.
+                # The outbox relay sends it to the worker; this request never waits on the broker.
+                await self.uow.outbox.add(DomainEvent(ORDER_CREATED_TASK, {
+                    "order_id": new_order.order_id,
+                    "symbol": new_order.symbol,
+                    "price": new_order.price
+                }))
+
+                # request_id auto-added by middleware
+                #logger.info("order_created", order_id=new_order.order_id, price=new_order.price)
+
+                # Commit happens automatically on __exit__
+                # If line 2 failed, Commit would never happen.
+
+                # Return DTO
+                #return OrderResponse.model_validate(new_order)
+        except BaseException:
+            if reserved:
+                self.risk.release(data.account_id, data.symbol, data.side, data.quantity, data.price)
+            raise
+
+        logger.info("domain_event_stored", event_type="order_created", order_id=new_order.order_id)
 
         return OrderResponse.model_validate(new_order)
\ No newline at end of file
@@ -0,0 +1,177 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Generator, Iterable, List, Optional
+
+from src.domain.market_data import Tick
+
+
+class Bar:
+    """
+    OHLCV candle produced by a BarAggregator.
+    Uses __slots__ because long backtests produce millions of bars.
+    """
+    __slots__ = ['symbol', 'resolution', 'open', 'high', 'low', 'close',
+                 'volume', 'dollar_volume', 'tick_count', 'start', 'end']
+
+    def __init__(self, symbol: str, resolution: str, tick: Tick):
+        self.symbol = symbol
+        self.resolution = resolution
+        self.open = tick.price
+        self.high = tick.price
+        self.low = tick.price
+        self.close = tick.price
+        self.volume = tick.volume
+        self.dollar_volume = tick.price * tick.volume
+        self.tick_count = 1
+        self.start = tick.timestamp
+        self.end = tick.timestamp
+
+    def add(self, tick: Tick) -> None:
+        price = tick.price
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += tick.volume
+        self.dollar_volume += price * tick.volume
+        self.tick_count += 1
+        self.end = tick.timestamp
+
+    def __repr__(self):
+        return (f"Bar({self.symbol}, {self.resolution}, O={self.open} H={self.high} "
+                f"L={self.low} C={self.close} V={self.volume})")
+
+
+class BarAggregator(ABC):
+    """
+    The Aggregator Interface.
+    Keeps one open Bar per symbol, so memory is constant regardless of stream length.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._open_bars: Dict[str, Bar] = {}
+
+    @abstractmethod
+    def update(self, tick: Tick) -> Optional[Bar]:
+        """
+        Feeds one tick. Returns a completed Bar when this tick closes one.
+        """
+        pass
+
+    def flush(self) -> List[Bar]:
+        """Closes and returns every partially built bar (end of stream)."""
+        bars = list(self._open_bars.values())
+        self._open_bars.clear()
+        return bars
+
+
+class TimeBarAggregator(BarAggregator):
+    """
+    Closes a bar when a tick falls into a new time bucket.
+    Buckets are aligned to the epoch, e.g. every full minute for interval_ms=60_000.
+    """
+
+    def __init__(self, interval_ms: int):
+        if interval_ms <= 0:
+            raise ValueError("interval_ms must be positive")
+        super().__init__(f"TIME_{interval_ms}ms")
+        self.interval_ms = interval_ms
+
+    def update(self, tick: Tick) -> Optional[Bar]:
+        bar = self._open_bars.get(tick.symbol)
+        if bar is None:
+            self._open_bars[tick.symbol] = Bar(tick.symbol, self.name, tick)
+            return None
+
+        if tick.timestamp // self.interval_ms == bar.start // self.interval_ms:
+            bar.add(tick)
+            return None
+
+        # New bucket: the open bar is complete, this tick starts the next one
+        self._open_bars[tick.symbol] = Bar(tick.symbol, self.name, tick)
+        return bar
+
+
+class ThresholdBarAggregator(BarAggregator):
+    """
+    Base for activity-driven bars: closes a bar once a running metric
+    reaches the threshold. The closing tick belongs to the bar it completes.
+    """
+
+    def __init__(self, name: str, threshold: float):
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        super().__init__(name)
+        self.threshold = threshold
+
+    @abstractmethod
+    def measure(self, bar: Bar) -> float:
+        pass
+
+    def update(self, tick: Tick) -> Optional[Bar]:
+        bar = self._open_bars.get(tick.symbol)
+        if bar is None:
+            bar = Bar(tick.symbol, self.name, tick)
+            self._open_bars[tick.symbol] = bar
+        else:
+            bar.add(tick)
+
+        if self.measure(bar) >= self.threshold:
+            del self._open_bars[tick.symbol]
+            return bar
+        return None
+
+
+class TickBarAggregator(ThresholdBarAggregator):
+    """Closes a bar every N ticks."""
+
+    def __init__(self, ticks: int):
+        super().__init__(f"TICK_{ticks}", ticks)
+
+    def measure(self, bar: Bar) -> float:
+        return bar.tick_count
+
+
+class VolumeBarAggregator(ThresholdBarAggregator):
+    """Closes a bar once the traded quantity reaches the threshold."""
+
+    def __init__(self, volume: float):
+        super().__init__(f"VOLUME_{volume:g}", volume)
+
+    def measure(self, bar: Bar) -> float:
+        return bar.volume
+
+
+class DollarBarAggregator(ThresholdBarAggregator):
+    """Closes a bar once the traded notional (price * volume) reaches the threshold."""
+
+    def __init__(self, dollars: float):
+        super().__init__(f"DOLLAR_{dollars:g}", dollars)
+
+    def measure(self, bar: Bar) -> float:
+        return bar.dollar_volume
+
+
+def aggregate_bars(ticks: Iterable[Tick],
+                   aggregators: List[BarAggregator],
+                   flush: bool = True) -> Generator[Bar, None, None]:
+    """
+    Single-pass, multi-resolution aggregation stage.
+
+    Every tick is pushed through all aggregators, so 1m, 5m and 100-tick bars
+    come out of the same read. Works with any tick source, e.g.:
+        aggregate_bars(reader.stream_ticks(), aggs)
+        aggregate_bars((Tick.from_message(m) for m in stub.StreamMarketData(req)), aggs)
+
+    Set flush=False for endless (live) streams where trailing partial bars are meaningless.
+    """
+    for tick in ticks:
+        for aggregator in aggregators:
+            bar = aggregator.update(tick)
+            if bar is not None:
+                yield bar
+
+    if flush:
+        for aggregator in aggregators:
+            yield from aggregator.flush()
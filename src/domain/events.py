@@ -0,0 +1,38 @@
+from typing import Any, Dict, Optional
+
+from src.domain.entities import Order
+
+# Routing key of the order service's event on the `order_events` exchange
+ORDER_CREATED = "order.created"
+
+
+class DomainEvent:
+    """
+    Something that happened, to be published once the transaction that caused
+    it has committed. Written to the outbox in that same transaction, so the
+    event exists if and only if the change does.
+
+    `topic` tells the relay where it goes (a routing key or a task name);
+    `event_id` is assigned by the outbox and lets consumers drop redeliveries.
+    """
+    __slots__ = ['topic', 'payload', 'event_id']
+
+    def __init__(self, topic: str, payload: Dict[str, Any], event_id: Optional[int] = None):
+        self.topic = topic
+        self.payload = payload
+        self.event_id = event_id
+
+    def __repr__(self):
+        return f"DomainEvent({self.event_id}, {self.topic})"
+
+
+def order_created(order: Order) -> DomainEvent:
+    return DomainEvent(ORDER_CREATED, {
+        "event": "order_created",
+        "order_id": order.order_id,
+        "symbol": order.symbol,
+        "quantity": order.quantity,
+        "price": order.price,
+        "side": order.side,
+        "status": "ACCEPTED"
+    })
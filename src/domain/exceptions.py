@@ -13,4 +13,8 @@ class NegativePriceError(DomainError):
 
 class InsufficientLiquidityError(DomainError):
     """Raised when the market cannot fill the order."""
-    pass
\ No newline at end of file
+    pass
+
+class RiskLimitExceededError(DomainError):
+    """Raised when an order would breach a pre-trade risk limit."""
+    pass
@@ -1,5 +1,59 @@
 import csv
-from typing import Generator, Dict
+from typing import Generator, Dict, Any, Union
+
+
+def parse_timestamp(value: Union[str, int, float]) -> int:
+    """
+    Normalizes a tick timestamp to integer milliseconds.
+    Accepts epoch milliseconds (gRPC stream) or 'HH:MM:SS' strings (CSV files).
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    text = value.strip()
+    if ":" not in text:
+        return int(float(text))
+
+    # 'HH:MM:SS[.fff]' -> milliseconds since midnight
+    hours, minutes, seconds = text.split(":")
+    return int((int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000)
+
+
+class Tick:
+    """
+    A single trade/quote observation, normalized from any market data source.
+    Uses __slots__ because millions of these flow through the pipeline.
+    """
+    __slots__ = ['symbol', 'price', 'volume', 'timestamp']
+
+    def __init__(self, symbol: str, price: float, volume: float, timestamp: int):
+        self.symbol = symbol
+        self.price = price
+        self.volume = volume
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Tick':
+        """Builds a Tick from a MarketDataReader row (CSV values are strings)."""
+        return cls(
+            symbol=row['symbol'],
+            price=float(row['price']),
+            volume=float(row.get('volume') or 0.0),
+            timestamp=parse_timestamp(row['timestamp'])
+        )
+
+    @classmethod
+    def from_message(cls, message: Any) -> 'Tick':
+        """Builds a Tick from a MarketDataResponse (duck-typed, no protobuf import)."""
+        return cls(
+            symbol=message.symbol,
+            price=message.price,
+            volume=message.volume,
+            timestamp=message.timestamp
+        )
+
+    def __repr__(self):
+        return f"Tick({self.symbol}, {self.price} x {self.volume} @ {self.timestamp})"
 
 
 class MarketDataReader:
@@ -19,4 +73,9 @@ class MarketDataReader:
 
                 # Yield pauses execution here and returns the row
                 # Next time we call next(), it resumes right here
-                yield row
\ No newline at end of file
+                yield row
+
+    def stream_ticks(self) -> Generator[Tick, None, None]:
+        """Same lazy stream, normalized to Tick objects."""
+        for row in self.start_stream():
+            yield Tick.from_row(row)
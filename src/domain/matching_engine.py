@@ -0,0 +1,237 @@
+from operator import neg
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sortedcontainers import SortedDict
+
+from src.domain.order_book import ASK, BID
+
+BUY = "BUY"
+SELL = "SELL"
+SIDES = (BUY, SELL)
+
+# Quantities are rounded to this many decimals after every subtraction, so
+# float error (0.3 - 0.1 = 0.19999999999999998) never leaves dust orders,
+# dust trades or a level total that drifts from the sum of its orders
+QUANTITY_DECIMALS = 9
+
+
+def _snap(quantity: float) -> float:
+    return round(quantity, QUANTITY_DECIMALS)
+
+
+class RestingOrder:
+    """A limit order (or what is left of it) waiting in the book."""
+    __slots__ = ['order_id', 'side', 'price', 'quantity', 'sequence']
+
+    def __init__(self, order_id: str, side: str, price: float, quantity: float, sequence: int):
+        self.order_id = order_id
+        self.side = side
+        self.price = price
+        self.quantity = quantity
+        self.sequence = sequence
+
+    def __repr__(self):
+        return f"RestingOrder({self.order_id}, {self.side}, {self.quantity} @ {self.price})"
+
+
+class Trade:
+    """One fill between a resting (maker) order and an incoming (taker) order, at the maker's price."""
+    __slots__ = ['trade_id', 'symbol', 'price', 'quantity', 'maker_order_id', 'taker_order_id',
+                 'taker_side', 'sequence']
+
+    def __init__(self, trade_id: int, symbol: str, price: float, quantity: float,
+                 maker_order_id: str, taker_order_id: str, taker_side: str, sequence: int):
+        self.trade_id = trade_id
+        self.symbol = symbol
+        self.price = price
+        self.quantity = quantity
+        self.maker_order_id = maker_order_id
+        self.taker_order_id = taker_order_id
+        self.taker_side = taker_side
+        self.sequence = sequence
+
+    def __repr__(self):
+        return f"Trade({self.trade_id}, {self.symbol}, {self.quantity} @ {self.price})"
+
+
+class PriceLevel:
+    """
+    All resting orders at one price. The dict keeps insertion order, which is
+    time priority (first in, first filled), and removes any order by ID in O(1).
+    """
+    __slots__ = ['price', 'orders', 'quantity']
+
+    def __init__(self, price: float):
+        self.price = price
+        self.orders: Dict[str, RestingOrder] = {}
+        self.quantity = 0.0
+
+
+class OrderSide:
+    """
+    One side of a limit order book, best price first.
+
+    Same layout as the L2 `BookSide`: levels in a SortedDict by price (bids
+    sorted by negated price). Finding, adding or removing a level is O(log n)
+    and the best level is at index 0.
+    """
+    __slots__ = ['side', 'levels']
+
+    def __init__(self, side: str):
+        self.side = side
+        self.levels: SortedDict = SortedDict(neg) if side == BID else SortedDict()
+
+    def best(self) -> Optional[PriceLevel]:
+        return self.levels.peekitem(0)[1] if self.levels else None
+
+    def add(self, order: RestingOrder) -> None:
+        level = self.levels.get(order.price)
+        if level is None:
+            level = self.levels[order.price] = PriceLevel(order.price)
+        level.orders[order.order_id] = order
+        level.quantity = _snap(level.quantity + order.quantity)
+
+    def remove(self, order: RestingOrder) -> None:
+        level = self.levels[order.price]
+        del level.orders[order.order_id]
+        level.quantity = _snap(level.quantity - order.quantity)
+        if not level.orders:
+            self.drop_level(level)
+
+    def drop_level(self, level: PriceLevel) -> None:
+        del self.levels[level.price]
+
+    def depth(self, levels: Optional[int] = None) -> List[Tuple[float, float]]:
+        items = self.levels.items()
+        return [(price, level.quantity) for price, level in (items if levels is None else items[:levels])]
+
+
+class LimitOrderBook:
+    """
+    Price-time priority matching for one symbol.
+
+    An incoming order trades against the best opposite level while the prices
+    cross. Within a level, resting orders fill oldest first, each fill at the
+    resting order's price. Whatever the order cannot fill rests at its limit
+    price. A market order (no price) takes what liquidity there is, and any
+    remainder is cancelled. Order lookup by ID, for cancels, is a dict hit.
+    """
+
+    def __init__(self, symbol: str, on_trade: Optional[Callable[[Trade], None]] = None):
+        self.symbol = symbol
+        self.bids = OrderSide(BID)
+        self.asks = OrderSide(ASK)
+        self.orders: Dict[str, RestingOrder] = {}
+        self.on_trade = on_trade
+        self.last_price: Optional[float] = None
+        self.sequence = 0
+        self._trade_ids = 0
+
+    def submit(self, order_id: str, side: str, quantity: float, price: Optional[float] = None) -> List[Trade]:
+        """Matches an order and rests any limit remainder. Returns the trades it caused, in order."""
+        if side not in SIDES:
+            raise ValueError(f"Invalid side: {side!r}")
+        if order_id in self.orders:
+            raise ValueError(f"Duplicate order id: {order_id}")
+        remaining = _snap(quantity)
+        if not remaining > 0:
+            raise ValueError("Quantity must be positive")
+
+        self.sequence += 1
+        buying = side == BUY
+        opposite = self.asks if buying else self.bids
+        trades: List[Trade] = []
+
+        while remaining > 0:
+            level = opposite.best()
+            if level is None:
+                break
+            if price is not None and (level.price > price if buying else level.price < price):
+                break
+
+            orders = level.orders
+            while remaining > 0 and orders:
+                maker = next(iter(orders.values()))
+                fill = maker.quantity if maker.quantity <= remaining else remaining
+                remaining = _snap(remaining - fill)
+                maker.quantity = _snap(maker.quantity - fill)
+                level.quantity = _snap(level.quantity - fill)
+                if maker.quantity <= 0:
+                    del orders[maker.order_id]
+                    del self.orders[maker.order_id]
+
+                self._trade_ids += 1
+                trade = Trade(self._trade_ids, self.symbol, level.price, fill,
+                              maker.order_id, order_id, side, self.sequence)
+                trades.append(trade)
+                if self.on_trade is not None:
+                    self.on_trade(trade)
+
+            if not orders:
+                opposite.drop_level(level)
+
+        if trades:
+            self.last_price = trades[-1].price
+        if remaining > 0 and price is not None:
+            resting = RestingOrder(order_id, side, price, remaining, self.sequence)
+            (self.bids if buying else self.asks).add(resting)
+            self.orders[order_id] = resting
+        return trades
+
+    def cancel(self, order_id: str) -> Optional[RestingOrder]:
+        """Removes a resting order; returns it, or None if it already filled or never rested."""
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            (self.bids if order.side == BUY else self.asks).remove(order)
+            self.sequence += 1
+        return order
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        level = self.bids.best()
+        return (level.price, level.quantity) if level else None
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        level = self.asks.best()
+        return (level.price, level.quantity) if level else None
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid.price + ask.price) / 2
+
+    def depth(self, levels: Optional[int] = None):
+        return self.bids.depth(levels), self.asks.depth(levels)
+
+
+class MatchingEngine:
+    """
+    One LimitOrderBook per symbol, created on first use. Every trade is passed
+    to the registered listeners (the trade event stream), in execution order.
+    """
+
+    def __init__(self):
+        self.books: Dict[str, LimitOrderBook] = {}
+        self.listeners: List[Callable[[Trade], None]] = []
+
+    def add_listener(self, listener: Callable[[Trade], None]) -> None:
+        self.listeners.append(listener)
+
+    def _publish(self, trade: Trade) -> None:
+        for listener in self.listeners:
+            listener(trade)
+
+    def book(self, symbol: str) -> LimitOrderBook:
+        symbol = symbol.upper()
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = LimitOrderBook(symbol, on_trade=self._publish)
+        return book
+
+    def submit(self, symbol: str, order_id: str, side: str, quantity: float,
+               price: Optional[float] = None) -> List[Trade]:
+        return self.book(symbol).submit(order_id, side, quantity, price)
+
+    def cancel(self, symbol: str, order_id: str) -> Optional[RestingOrder]:
+        book = self.books.get(symbol.upper())
+        return book.cancel(order_id) if book else None
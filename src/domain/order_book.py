@@ -0,0 +1,88 @@
+from operator import neg
+from typing import List, Optional, Tuple
+
+from sortedcontainers import SortedDict
+
+BID = "BID"
+ASK = "ASK"
+
+# (price, quantity) pairs, best level first
+Levels = List[Tuple[float, float]]
+
+
+class BookSide:
+    """
+    Aggregated price levels of one side of the book, best price first.
+
+    Quantities live in a SortedDict keyed by price (bids sorted by negated
+    price), so looking up, adding or removing a level is O(log n) and the best
+    level is always at index 0.
+    """
+    __slots__ = ['side', 'quantities']
+
+    def __init__(self, side: str):
+        self.side = side
+        self.quantities: SortedDict = SortedDict(neg) if side == BID else SortedDict()
+
+    def __len__(self):
+        return len(self.quantities)
+
+    def set(self, price: float, quantity: float) -> None:
+        """Sets a level's total quantity; zero (or less) removes the level."""
+        if quantity <= 0:
+            self.quantities.pop(price, None)
+        else:
+            self.quantities[price] = quantity
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        return self.quantities.peekitem(0) if self.quantities else None
+
+    def levels(self, depth: Optional[int] = None) -> Levels:
+        items = self.quantities.items()
+        return list(items if depth is None else items[:depth])
+
+    def clear(self) -> None:
+        self.quantities.clear()
+
+
+class OrderBook:
+    """
+    Level-2 (price-aggregated) order book for one symbol.
+    Used server-side to publish depth and client-side to rebuild it from updates.
+    """
+    __slots__ = ['symbol', 'bids', 'asks', 'sequence', 'timestamp']
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = BookSide(BID)
+        self.asks = BookSide(ASK)
+        self.sequence = 0
+        self.timestamp = 0
+
+    def side(self, side: str) -> BookSide:
+        return self.bids if side == BID else self.asks
+
+    def apply(self, side: str, price: float, quantity: float) -> None:
+        self.side(side).set(price, quantity)
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        return self.asks.best()
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def depth(self, levels: Optional[int] = None) -> Tuple[Levels, Levels]:
+        return self.bids.levels(levels), self.asks.levels(levels)
+
+    def clear(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+
+    def __repr__(self):
+        return f"OrderBook({self.symbol}, bid={self.best_bid()}, ask={self.best_ask()}, seq={self.sequence})"
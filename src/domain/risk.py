@@ -0,0 +1,117 @@
+from typing import Dict, Optional, Tuple
+
+from src.domain.exceptions import RiskLimitExceededError
+
+# Orders that do not name an account are checked against this one
+DEFAULT_ACCOUNT = "default"
+
+
+class RiskLimits:
+    """
+    Pre-trade limits. Any limit set to None is not checked.
+
+    - max_order_quantity: largest single order.
+    - max_position: largest absolute net position per account and symbol,
+      counting every open order, and this one, as if it filled completely.
+    - max_notional: the same projected position, valued at the order price.
+    - price_band: fat-finger check. The largest relative distance between a
+      limit price and the last price (0.1 = 10%).
+    """
+    __slots__ = ['max_order_quantity', 'max_position', 'max_notional', 'price_band']
+
+    def __init__(self, max_order_quantity: Optional[float] = None, max_position: Optional[float] = None,
+                 max_notional: Optional[float] = None, price_band: Optional[float] = None):
+        self.max_order_quantity = max_order_quantity
+        self.max_position = max_position
+        self.max_notional = max_notional
+        self.price_band = price_band
+
+
+class RiskEngine:
+    """
+    In-memory pre-trade risk checks, run before an order is persisted.
+
+    Net positions and notional exposure are kept per (account, symbol) and
+    updated one fill at a time by `on_fill`. Accepted orders that have not
+    filled are held separately: `reserve` adds an order once it passes its
+    check and `release` takes it out again (persisting it failed, it was
+    cancelled, or it filled). Checks count both, so a stream of orders cannot
+    pass one by one what it could not pass together. Nothing is recomputed
+    from history. A check is a few dict lookups and comparisons, so it costs
+    microseconds and needs no I/O. The state is local to the process.
+    """
+
+    def __init__(self, limits: RiskLimits, symbol_limits: Optional[Dict[str, RiskLimits]] = None):
+        self.limits = limits
+        self.symbol_limits = symbol_limits or {}
+        # (account, symbol) -> signed net quantity (long > 0)
+        self.positions: Dict[Tuple[str, str], float] = {}
+        # (account, symbol) -> signed notional of the fills that built the position
+        self.notional: Dict[Tuple[str, str], float] = {}
+        # (account, symbol) -> signed quantity and notional of accepted orders not yet filled
+        self.open_quantity: Dict[Tuple[str, str], float] = {}
+        self.open_notional: Dict[Tuple[str, str], float] = {}
+        self.checks = 0
+        self.rejections = 0
+
+    def check(self, account: str, symbol: str, side: str, quantity: float, price: float,
+              last_price: Optional[float] = None) -> None:
+        """Raises RiskLimitExceededError if the order breaches a limit."""
+        self.checks += 1
+        symbol = symbol.upper()
+        limits = self.symbol_limits.get(symbol, self.limits)
+
+        if limits.max_order_quantity is not None and quantity > limits.max_order_quantity:
+            self._reject(f"Order quantity {quantity} exceeds {limits.max_order_quantity} for {symbol}")
+
+        if limits.price_band is not None and last_price:
+            if abs(price - last_price) > limits.price_band * last_price:
+                self._reject(f"Price {price} is more than {limits.price_band:.0%} "
+                             f"from the last price {last_price} for {symbol}")
+
+        key = (account, symbol)
+        projected = (self.positions.get(key, 0.0) + self.open_quantity.get(key, 0.0)
+                     + (quantity if side == "BUY" else -quantity))
+        if limits.max_position is not None and abs(projected) > limits.max_position:
+            self._reject(f"Position {projected} would exceed {limits.max_position} for {symbol}")
+        if limits.max_notional is not None and abs(projected) * price > limits.max_notional:
+            self._reject(f"Exposure {abs(projected) * price:.2f} would exceed {limits.max_notional} for {symbol}")
+
+    def _reject(self, reason: str) -> None:
+        self.rejections += 1
+        raise RiskLimitExceededError(reason)
+
+    def reserve(self, account: str, symbol: str, side: str, quantity: float, price: float) -> None:
+        """Counts an accepted order towards the limits until it is released."""
+        key = (account, symbol.upper())
+        signed = quantity if side == "BUY" else -quantity
+        self.open_quantity[key] = self.open_quantity.get(key, 0.0) + signed
+        self.open_notional[key] = self.open_notional.get(key, 0.0) + signed * price
+
+    def release(self, account: str, symbol: str, side: str, quantity: float, price: float) -> None:
+        """Undoes `reserve` for all or part of an order."""
+        key = (account, symbol.upper())
+        signed = quantity if side == "BUY" else -quantity
+        remaining = self.open_quantity.get(key, 0.0) - signed
+        if remaining:
+            self.open_quantity[key] = remaining
+            self.open_notional[key] = self.open_notional.get(key, 0.0) - signed * price
+        else:
+            self.open_quantity.pop(key, None)
+            self.open_notional.pop(key, None)
+
+    def on_fill(self, account: str, symbol: str, side: str, quantity: float, price: float) -> None:
+        """Books a fill into the position. For a reserved order, `release` the filled quantity as well."""
+        key = (account, symbol.upper())
+        signed = quantity if side == "BUY" else -quantity
+        self.positions[key] = self.positions.get(key, 0.0) + signed
+        self.notional[key] = self.notional.get(key, 0.0) + signed * price
+
+    def position(self, account: str, symbol: str) -> float:
+        return self.positions.get((account, symbol.upper()), 0.0)
+
+    def exposure(self, account: str, symbol: str) -> float:
+        return self.notional.get((account, symbol.upper()), 0.0)
+
+    def open_exposure(self, account: str, symbol: str) -> float:
+        return self.open_notional.get((account, symbol.upper()), 0.0)
@@ -1,6 +1,6 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from src.domain.exceptions import DomainError, InvalidSymbolError, NegativePriceError
+from src.domain.exceptions import DomainError, InvalidSymbolError, NegativePriceError, RiskLimitExceededError
 
 
 async def domain_exception_handler(request: Request, exc: DomainError):
@@ -19,6 +19,9 @@ async def domain_exception_handler(request: Request, exc: DomainError):
     elif isinstance(exc, NegativePriceError):
         status_code = 400
         error_type = "NegativePrice"
+    elif isinstance(exc, RiskLimitExceededError):
+        status_code = 422
+        error_type = "RiskLimitExceeded"
 
     return JSONResponse(
         status_code=status_code,
@@ -1,7 +1,9 @@
+import grpc
 from fastapi import APIRouter, Depends, HTTPException
 from src.application.dtos import OrderCreate, OrderResponse
 from src.application.use_cases.analyze_market import AnalysisRequest, AnalysisResponse, AnalyzeMarketUseCase
 from src.application.use_cases.run_backtest import RunBacktestUseCase
+from src.domain.exceptions import RiskLimitExceededError
 from src.infrastructure.grpc_client import grpc_client_manager
 from src.generated import order_pb2
 from src.infrastructure.adapters.mock_exchange import MockExchangeAdapter
@@ -10,6 +12,13 @@ from src.infrastructure.adapters.mock_exchange import MockExchangeAdapter
 
 router = APIRouter()
 
+# Order service status codes that are the client's fault or a temporary outage, not a server error
+GRPC_TO_HTTP_STATUS = {
+    grpc.StatusCode.INVALID_ARGUMENT: 400,
+    grpc.StatusCode.UNAVAILABLE: 503,
+    grpc.StatusCode.DEADLINE_EXCEEDED: 504,
+}
+
 # Dependency Injection Setup
 # def get_uow(): ... (Removed for pure Gateway logic on this route, or kept for others if needed)
 
@@ -31,14 +40,16 @@ def get_backtest_use_case():
 @router.post("/orders", response_model=OrderResponse)
 async def place_order(order_data: OrderCreate):
     try:
-        stub = grpc_client_manager.get_order_stub()
+        # Every order for a symbol goes to the shard that owns it
+        stub = grpc_client_manager.get_order_stub(order_data.symbol)
         
         # Helper: Convert Pydantic -> Protobuf
         req = order_pb2.OrderRequest(
             symbol=order_data.symbol,
             quantity=order_data.quantity,
             price=order_data.price,
-            side=order_data.side
+            side=order_data.side,
+            account_id=order_data.account_id
         )
         
         # Call gRPC Service
@@ -54,8 +65,12 @@ async def place_order(order_data: OrderCreate):
             side=order_data.side,
             metadata=order_data.metadata or {}
         )
+    except grpc.RpcError as e:
+        # Risk rejections are answered like the domain error (422, see errors.py)
+        if e.code() == grpc.StatusCode.FAILED_PRECONDITION:
+            raise RiskLimitExceededError(e.details())
+        raise HTTPException(status_code=GRPC_TO_HTTP_STATUS.get(e.code(), 500), detail=e.details())
     except Exception as e:
-        # Map gRPC errors to HTTP exceptions if needed
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/analyze", response_model=AnalysisResponse)
@@ -39,7 +39,8 @@ from fastmcp import FastMCP, Context
 from mcp.types import TextContent, PromptMessage
 
 # Domain & Application Layer
-from src.domain.exceptions import InvalidSymbolError
+from src.domain.exceptions import InvalidSymbolError, RiskLimitExceededError
+from src.domain.risk import RiskEngine, RiskLimits
 from src.application.use_cases.get_portfolio import GetPortfolioUseCase
 from src.application.use_cases.place_order import PlaceOrderUseCase
 from src.application.dtos import OrderCreate
@@ -49,6 +50,7 @@ from src.ai.application.rag_service import RAGService
 from src.ai.application.agent_service import TraderAgent
 
 # Infrastructure (for bootstrap only)
+from src.config import RISK_MAX_NOTIONAL, RISK_MAX_ORDER_QUANTITY, RISK_MAX_POSITION, RISK_PRICE_BAND
 from src.infrastructure.uow_postgres import SqlAlchemyUnitOfWork
 from src.infrastructure.adapters.mock_exchange import MockExchangeAdapter
 from src.ai.adapters.vector_store_factory import VectorStoreFactory
@@ -94,10 +96,15 @@ def bootstrap_mcp() -> MCPServices:
     # Infrastructure Layer (Adapters)
     uow = SqlAlchemyUnitOfWork()
     exchange = MockExchangeAdapter()
+    # Same limits as the order service (ORDER_RISK_* environment variables)
+    risk = RiskEngine(RiskLimits(
+        max_order_quantity=RISK_MAX_ORDER_QUANTITY, max_position=RISK_MAX_POSITION,
+        max_notional=RISK_MAX_NOTIONAL, price_band=RISK_PRICE_BAND
+    ))
     
     # Application Layer (Use Cases)
     portfolio_use_case = GetPortfolioUseCase(uow=uow)
-    place_order_use_case = PlaceOrderUseCase(uow=uow, exchange=exchange)
+    place_order_use_case = PlaceOrderUseCase(uow=uow, exchange=exchange, risk=risk)
     
     # AI Services (Optional - graceful degradation if not configured)
     rag_service = None
@@ -221,6 +228,9 @@ async def place_order(symbol: str, side: str, amount: float, price: float = 0.0)
     except InvalidSymbolError as e:
         return f"❌ Invalid symbol: {str(e)}"
     
+    except RiskLimitExceededError as e:
+        return f"❌ Rejected by risk limits: {str(e)}"
+    
     except ValueError as e:
         return f"❌ Validation error: {str(e)}"
     
@@ -14,17 +14,29 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11market_data.proto\x12\x0bmarket_data\"#\n\x11MarketDataRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\"V\n\x12MarketDataResponse\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x01\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x32l\n\x11MarketDataService\x12W\n\x10StreamMarketData\x12\x1e.market_data.MarketDataRequest\x1a\x1f.market_data.MarketDataResponse\"\x00\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11market_data.proto\x12\x0bmarket_data\"\xa4\x01\n\x11MarketDataRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12!\n\x14resume_from_sequence\x18\x02 \x01(\x04H\x00\x88\x01\x01\x12\x10\n\x08snapshot\x18\x03 \x01(\x08\x12\x31\n\nconflation\x18\x04 \x01(\x0e\x32\x1d.market_data.ConflationPolicyB\x17\n\x15_resume_from_sequence\"z\n\x12MarketDataResponse\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\x12\x0e\n\x06volume\x18\x03 \x01(\x01\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12\x10\n\x08sequence\x18\x05 \x01(\x04\x12\x10\n\x08snapshot\x18\x06 \x01(\x08\"m\n\x12MultiSymbolRequest\x12\x0f\n\x07symbols\x18\x01 \x03(\t\x12\x13\n\x0b\x63oalesce_ms\x18\x02 \x01(\r\x12\x31\n\nconflation\x18\x03 \x01(\x0e\x32\x1d.market_data.ConflationPolicy\"e\n\x0fMarketDataBatch\x12.\n\x05ticks\x18\x01 \x03(\x0b\x32\x1f.market_data.MarketDataResponse\x12\x0f\n\x07\x64ropped\x18\x02 \x01(\x04\x12\x11\n\tconflated\x18\x03 \x01(\x04\"\"\n\x10OrderBookRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\"-\n\nPriceLevel\x12\r\n\x05price\x18\x01 \x01(\x01\x12\x10\n\x08quantity\x18\x02 \x01(\x01\"\xa6\x01\n\x0fOrderBookUpdate\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x10\n\x08sequence\x18\x02 \x01(\x04\x12\x10\n\x08snapshot\x18\x03 \x01(\x08\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12%\n\x04\x62ids\x18\x05 \x03(\x0b\x32\x17.market_data.PriceLevel\x12%\n\x04\x61sks\x18\x06 \x03(\x0b\x32\x17.market_data.PriceLevel*)\n\x10\x43onflationPolicy\x12\t\n\x05QUEUE\x10\x00\x12\n\n\x06LATEST\x10\x01\x32\xb9\x03\n\x11MarketDataService\x12W\n\x10StreamMarketData\x12\x1e.market_data.MarketDataRequest\x1a\x1f.market_data.MarketDataResponse\"\x00\x30\x01\x12Z\n\x15StreamMarketDataBatch\x12\x1f.market_data.MultiSymbolRequest\x1a\x1c.market_data.MarketDataBatch\"\x00\x30\x01\x12M\n\x08GetPrice\x12\x1e.market_data.MarketDataRequest\x1a\x1f.market_data.MarketDataResponse\"\x00\x12L\n\tGetPrices\x12\x1f.market_data.MultiSymbolRequest\x1a\x1c.market_data.MarketDataBatch\"\x00\x12R\n\x0fStreamOrderBook\x12\x1d.market_data.OrderBookRequest\x1a\x1c.market_data.OrderBookUpdate\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'market_data_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
-  _globals['_MARKETDATAREQUEST']._serialized_start=34
-  _globals['_MARKETDATAREQUEST']._serialized_end=69
-  _globals['_MARKETDATARESPONSE']._serialized_start=71
-  _globals['_MARKETDATARESPONSE']._serialized_end=157
-  _globals['_MARKETDATASERVICE']._serialized_start=159
-  _globals['_MARKETDATASERVICE']._serialized_end=267
+  _globals['_CONFLATIONPOLICY']._serialized_start=791
+  _globals['_CONFLATIONPOLICY']._serialized_end=832
+  _globals['_MARKETDATAREQUEST']._serialized_start=35
+  _globals['_MARKETDATAREQUEST']._serialized_end=199
+  _globals['_MARKETDATARESPONSE']._serialized_start=201
+  _globals['_MARKETDATARESPONSE']._serialized_end=323
+  _globals['_MULTISYMBOLREQUEST']._serialized_start=325
+  _globals['_MULTISYMBOLREQUEST']._serialized_end=434
+  _globals['_MARKETDATABATCH']._serialized_start=436
+  _globals['_MARKETDATABATCH']._serialized_end=537
+  _globals['_ORDERBOOKREQUEST']._serialized_start=539
+  _globals['_ORDERBOOKREQUEST']._serialized_end=573
+  _globals['_PRICELEVEL']._serialized_start=575
+  _globals['_PRICELEVEL']._serialized_end=620
+  _globals['_ORDERBOOKUPDATE']._serialized_start=623
+  _globals['_ORDERBOOKUPDATE']._serialized_end=789
+  _globals['_MARKETDATASERVICE']._serialized_start=835
+  _globals['_MARKETDATASERVICE']._serialized_end=1276
 # @@protoc_insertion_point(module_scope)
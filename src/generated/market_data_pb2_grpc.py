@@ -19,6 +19,26 @@ class MarketDataServiceStub(object):
                 request_serializer=market__data__pb2.MarketDataRequest.SerializeToString,
                 response_deserializer=market__data__pb2.MarketDataResponse.FromString,
                 )
+        self.StreamMarketDataBatch = channel.unary_stream(
+                '/market_data.MarketDataService/StreamMarketDataBatch',
+                request_serializer=market__data__pb2.MultiSymbolRequest.SerializeToString,
+                response_deserializer=market__data__pb2.MarketDataBatch.FromString,
+                )
+        self.GetPrice = channel.unary_unary(
+                '/market_data.MarketDataService/GetPrice',
+                request_serializer=market__data__pb2.MarketDataRequest.SerializeToString,
+                response_deserializer=market__data__pb2.MarketDataResponse.FromString,
+                )
+        self.GetPrices = channel.unary_unary(
+                '/market_data.MarketDataService/GetPrices',
+                request_serializer=market__data__pb2.MultiSymbolRequest.SerializeToString,
+                response_deserializer=market__data__pb2.MarketDataBatch.FromString,
+                )
+        self.StreamOrderBook = channel.unary_stream(
+                '/market_data.MarketDataService/StreamOrderBook',
+                request_serializer=market__data__pb2.OrderBookRequest.SerializeToString,
+                response_deserializer=market__data__pb2.OrderBookUpdate.FromString,
+                )
 
 
 class MarketDataServiceServicer(object):
@@ -30,6 +50,33 @@ class MarketDataServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamMarketDataBatch(self, request, context):
+        """One stream for many symbols; ticks are coalesced into batches
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPrice(self, request, context):
+        """Latest known tick, served from the in-memory last-price table
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPrices(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamOrderBook(self, request, context):
+        """Level-2 depth: one full snapshot, then only the price levels that changed
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_MarketDataServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -38,6 +85,26 @@ def add_MarketDataServiceServicer_to_server(servicer, server):
                     request_deserializer=market__data__pb2.MarketDataRequest.FromString,
                     response_serializer=market__data__pb2.MarketDataResponse.SerializeToString,
             ),
+            'StreamMarketDataBatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamMarketDataBatch,
+                    request_deserializer=market__data__pb2.MultiSymbolRequest.FromString,
+                    response_serializer=market__data__pb2.MarketDataBatch.SerializeToString,
+            ),
+            'GetPrice': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPrice,
+                    request_deserializer=market__data__pb2.MarketDataRequest.FromString,
+                    response_serializer=market__data__pb2.MarketDataResponse.SerializeToString,
+            ),
+            'GetPrices': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetPrices,
+                    request_deserializer=market__data__pb2.MultiSymbolRequest.FromString,
+                    response_serializer=market__data__pb2.MarketDataBatch.SerializeToString,
+            ),
+            'StreamOrderBook': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamOrderBook,
+                    request_deserializer=market__data__pb2.OrderBookRequest.FromString,
+                    response_serializer=market__data__pb2.OrderBookUpdate.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'market_data.MarketDataService', rpc_method_handlers)
@@ -64,3 +131,71 @@ class MarketDataService(object):
             market__data__pb2.MarketDataResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamMarketDataBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/market_data.MarketDataService/StreamMarketDataBatch',
+            market__data__pb2.MultiSymbolRequest.SerializeToString,
+            market__data__pb2.MarketDataBatch.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetPrice(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/market_data.MarketDataService/GetPrice',
+            market__data__pb2.MarketDataRequest.SerializeToString,
+            market__data__pb2.MarketDataResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetPrices(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/market_data.MarketDataService/GetPrices',
+            market__data__pb2.MultiSymbolRequest.SerializeToString,
+            market__data__pb2.MarketDataBatch.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamOrderBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/market_data.MarketDataService/StreamOrderBook',
+            market__data__pb2.OrderBookRequest.SerializeToString,
+            market__data__pb2.OrderBookUpdate.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0border.proto\x12\x05order\"M\n\x0cOrderRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x01\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x0c\n\x04side\x18\x04 \x01(\t\"B\n\rOrderResponse\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t2I\n\x0cOrderService\x12\x39\n\nPlaceOrder\x12\x13.order.OrderRequest\x1a\x14.order.OrderResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0border.proto\x12\x05order\"z\n\x0cOrderRequest\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x01\x12\r\n\x05price\x18\x03 \x01(\x01\x12\x0c\n\x04side\x18\x04 \x01(\t\x12\x17\n\x0f\x63lient_order_id\x18\x05 \x01(\t\x12\x12\n\naccount_id\x18\x06 \x01(\t\"[\n\rOrderResponse\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x17\n\x0f\x63lient_order_id\x18\x04 \x01(\t\"8\n\x11OrderBatchRequest\x12#\n\x06orders\x18\x01 \x03(\x0b\x32\x13.order.OrderRequest\";\n\x12OrderBatchResponse\x12%\n\x07results\x18\x01 \x03(\x0b\x32\x14.order.OrderResponse2\xd0\x01\n\x0cOrderService\x12\x39\n\nPlaceOrder\x12\x13.order.OrderRequest\x1a\x14.order.OrderResponse\"\x00\x12\x44\n\x0bPlaceOrders\x12\x18.order.OrderBatchRequest\x1a\x19.order.OrderBatchResponse\"\x00\x12?\n\x0cStreamOrders\x12\x13.order.OrderRequest\x1a\x14.order.OrderResponse\"\x00(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -22,9 +22,13 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'order_pb2', _globals)
 if _descriptor._USE_C_DESCRIPTORS == False:
   DESCRIPTOR._options = None
   _globals['_ORDERREQUEST']._serialized_start=22
-  _globals['_ORDERREQUEST']._serialized_end=99
-  _globals['_ORDERRESPONSE']._serialized_start=101
-  _globals['_ORDERRESPONSE']._serialized_end=167
-  _globals['_ORDERSERVICE']._serialized_start=169
-  _globals['_ORDERSERVICE']._serialized_end=242
+  _globals['_ORDERREQUEST']._serialized_end=144
+  _globals['_ORDERRESPONSE']._serialized_start=146
+  _globals['_ORDERRESPONSE']._serialized_end=237
+  _globals['_ORDERBATCHREQUEST']._serialized_start=239
+  _globals['_ORDERBATCHREQUEST']._serialized_end=295
+  _globals['_ORDERBATCHRESPONSE']._serialized_start=297
+  _globals['_ORDERBATCHRESPONSE']._serialized_end=356
+  _globals['_ORDERSERVICE']._serialized_start=359
+  _globals['_ORDERSERVICE']._serialized_end=567
 # @@protoc_insertion_point(module_scope)
@@ -19,6 +19,16 @@ class OrderServiceStub(object):
                 request_serializer=order__pb2.OrderRequest.SerializeToString,
                 response_deserializer=order__pb2.OrderResponse.FromString,
                 )
+        self.PlaceOrders = channel.unary_unary(
+                '/order.OrderService/PlaceOrders',
+                request_serializer=order__pb2.OrderBatchRequest.SerializeToString,
+                response_deserializer=order__pb2.OrderBatchResponse.FromString,
+                )
+        self.StreamOrders = channel.stream_stream(
+                '/order.OrderService/StreamOrders',
+                request_serializer=order__pb2.OrderRequest.SerializeToString,
+                response_deserializer=order__pb2.OrderResponse.FromString,
+                )
 
 
 class OrderServiceServicer(object):
@@ -30,6 +40,21 @@ class OrderServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PlaceOrders(self, request, context):
+        """Basket/rebalance entry: one transaction and one event batch for all orders
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamOrders(self, request_iterator, context):
+        """Order entry channel: requests and acknowledgements flow independently,
+        acks may arrive out of order and are matched by client_order_id
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_OrderServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -38,6 +63,16 @@ def add_OrderServiceServicer_to_server(servicer, server):
                     request_deserializer=order__pb2.OrderRequest.FromString,
                     response_serializer=order__pb2.OrderResponse.SerializeToString,
             ),
+            'PlaceOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.PlaceOrders,
+                    request_deserializer=order__pb2.OrderBatchRequest.FromString,
+                    response_serializer=order__pb2.OrderBatchResponse.SerializeToString,
+            ),
+            'StreamOrders': grpc.stream_stream_rpc_method_handler(
+                    servicer.StreamOrders,
+                    request_deserializer=order__pb2.OrderRequest.FromString,
+                    response_serializer=order__pb2.OrderResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'order.OrderService', rpc_method_handlers)
@@ -64,3 +99,37 @@ class OrderService(object):
             order__pb2.OrderResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PlaceOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/order.OrderService/PlaceOrders',
+            order__pb2.OrderBatchRequest.SerializeToString,
+            order__pb2.OrderBatchResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def StreamOrders(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/order.OrderService/StreamOrders',
+            order__pb2.OrderRequest.SerializeToString,
+            order__pb2.OrderResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
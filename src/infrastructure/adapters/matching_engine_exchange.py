@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set
+
+from src.application.ports.interfaces import ExchangeClient
+from src.domain.exceptions import InsufficientLiquidityError
+from src.domain.matching_engine import MatchingEngine, RestingOrder, Trade
+
+logger = logging.getLogger("MatchingEngineExchange")
+
+
+class MatchingEngineExchange(ExchangeClient):
+    """
+    An in-process exchange: prices come from trades on our own MatchingEngine
+    rather than from a random walk (MockExchangeAdapter).
+
+    The current price is the last trade, or the mid of the book before the
+    first trade. History is the most recent trade prices. `trades()` streams
+    every execution to any number of async consumers. Matching never waits for
+    a slow consumer: a subscriber whose queue is full is closed, and its
+    `trades()` raises instead of silently skipping executions.
+    """
+
+    def __init__(self, engine: Optional[MatchingEngine] = None, history_size: int = 1000,
+                 subscriber_queue_size: int = 10_000):
+        self.engine = engine or MatchingEngine()
+        self.history_size = history_size
+        self.subscriber_queue_size = subscriber_queue_size
+        self.history: Dict[str, Deque[float]] = {}
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.dropped_subscribers = 0
+        self.engine.add_listener(self._on_trade)
+
+    def _on_trade(self, trade: Trade) -> None:
+        history = self.history.get(trade.symbol)
+        if history is None:
+            history = self.history[trade.symbol] = deque(maxlen=self.history_size)
+        history.append(trade.price)
+        lagging = []
+        for queue in self.subscribers:
+            if queue.full():
+                lagging.append(queue)
+            else:
+                queue.put_nowait(trade)
+        for queue in lagging:
+            self.subscribers.discard(queue)
+            self.dropped_subscribers += 1
+            logger.warning(f"Trade subscriber fell {queue.qsize()} trades behind and was dropped "
+                           f"at trade {trade.trade_id} of {trade.symbol}")
+
+    async def place_order(self, symbol: str, order_id: str, side: str, quantity: float,
+                          price: Optional[float] = None) -> List[Trade]:
+        """Matches synchronously: no awaits, so every order sees a consistent book."""
+        return self.engine.submit(symbol, order_id, side, quantity, price)
+
+    async def cancel_order(self, symbol: str, order_id: str) -> Optional[RestingOrder]:
+        return self.engine.cancel(symbol, order_id)
+
+    async def trades(self) -> AsyncIterator[Trade]:
+        """Every trade, in order. Raises ConnectionError after the trades queued before falling behind."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        self.subscribers.add(queue)
+        try:
+            while queue in self.subscribers or not queue.empty():
+                yield await queue.get()
+            raise ConnectionError("Trade stream fell behind and was closed; resubscribe")
+        finally:
+            self.subscribers.discard(queue)
+
+    async def get_current_price(self, symbol: str) -> float:
+        book = self.engine.books.get(symbol.upper())
+        if book is not None:
+            if book.last_price is not None:
+                return book.last_price
+            mid = book.mid_price()
+            if mid is not None:
+                return mid
+        raise InsufficientLiquidityError(f"No trades or two-sided book for {symbol}")
+
+    async def get_latest_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Symbols without a trade or a two-sided book are left out."""
+        prices = {}
+        for symbol in symbols:
+            try:
+                prices[symbol] = await self.get_current_price(symbol)
+            except InsufficientLiquidityError:
+                continue
+        return prices
+
+    async def get_price_history(self, symbol: str, limit: int = 20) -> List[float]:
+        history = self.history.get(symbol.upper())
+        return list(history)[-limit:] if history else []
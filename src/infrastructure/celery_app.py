@@ -23,6 +23,9 @@ celery_app.conf.update(
     # "acks_late": Only confirm task is done AFTER execution finishes.
     # If worker crashes mid-task, the task is re-queued.
     task_acks_late=True,
+    # Publisher confirms: sending a task only returns once the broker has it
+    # (the outbox relay deletes events after sending them).
+    broker_transport_options={"confirm_publish": True},
 )
 
 # Auto-discover tasks in the application layer
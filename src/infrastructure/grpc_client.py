@@ -1,29 +1,38 @@
 import grpc
 import logging
+import os
 from src.generated import order_pb2_grpc
 from src.generated import market_data_pb2_grpc
+from src.infrastructure.sharding import ConsistentHashRing, parse_shard_map
 
 logger = logging.getLogger("GrpcInfrastructure")
 
+# Order service shards as name=host:port pairs; orders are routed by consistent hash of the symbol
+ORDER_SERVICE_SHARDS = os.getenv("ORDER_SERVICE_SHARDS", "default=localhost:50052")
+
 class GrpcClientManager:
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(GrpcClientManager, cls).__new__(cls)
-            cls._instance.order_channel = None
+            cls._instance.order_channels = {}
+            cls._instance.order_stubs = {}
+            cls._instance.order_ring = None
             cls._instance.market_channel = None
-            cls._instance.order_stub = None
             cls._instance.market_stub = None
         return cls._instance
 
     async def initialize(self):
         """Initialize gRPC channels and stubs."""
-        # Connect to Order Service (running on 50052)
-        if not self.order_channel:
-            self.order_channel = grpc.aio.insecure_channel('localhost:50052')
-            self.order_stub = order_pb2_grpc.OrderServiceStub(self.order_channel)
-            logger.info("Initialized connection to Order Service at localhost:50052")
+        # One channel per Order Service shard (a single shard on 50052 by default)
+        if not self.order_channels:
+            shards = parse_shard_map(ORDER_SERVICE_SHARDS)
+            for name, address in shards.items():
+                self.order_channels[name] = grpc.aio.insecure_channel(address)
+                self.order_stubs[name] = order_pb2_grpc.OrderServiceStub(self.order_channels[name])
+                logger.info(f"Initialized connection to Order Service shard {name} at {address}")
+            self.order_ring = ConsistentHashRing(shards)
 
         # Connect to Market Data Service (running on 50051)
         if not self.market_channel:
@@ -33,20 +42,25 @@ class GrpcClientManager:
 
     async def close(self):
         """Close all gRPC channels."""
-        if self.order_channel:
-            await self.order_channel.close()
-            logger.info("Closed Order Service channel")
+        for name, channel in self.order_channels.items():
+            await channel.close()
+            logger.info(f"Closed Order Service channel to shard {name}")
+        self.order_channels, self.order_stubs, self.order_ring = {}, {}, None
         if self.market_channel:
             await self.market_channel.close()
             logger.info("Closed Market Data Service channel")
 
-    def get_order_stub(self):
-        if not self.order_stub:
+    def get_order_stub(self, symbol: str):
+        """
+        Stub of the shard that owns `symbol`. All orders for a symbol go to the
+        same shard, which holds that symbol's in-memory state (prices, risk).
+        """
+        if not self.order_ring:
              # In case it's called before initialize, though lifespan should handle it.
-             # Ideally, we rely on initialize being called. 
+             # Ideally, we rely on initialize being called.
              # For robustness, we could throw error or lazy init (but lazy init async in sync property is hard).
              raise RuntimeError("GrpcClientManager not initialized. Call initialize() first.")
-        return self.order_stub
+        return self.order_stubs[self.order_ring.get(symbol.upper())]
 
     def get_market_data_stub(self):
         if not self.market_stub:
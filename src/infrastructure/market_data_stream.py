@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+import structlog
+
+from src.domain.market_data import MarketDataReader
+
+logger = structlog.get_logger()
+
+# Marks the end of the producer's stream inside the queue
+_END_OF_STREAM = object()
+
+
+class QueueMetrics:
+    """Live counters for the reader's bounded queue (depth is measured in batches)."""
+    __slots__ = ['capacity', 'depth', 'max_depth', 'batches_produced', 'batches_consumed',
+                 'rows_consumed', 'producer_blocked_seconds']
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.depth = 0
+        self.max_depth = 0
+        self.batches_produced = 0
+        self.batches_consumed = 0
+        self.rows_consumed = 0
+        self.producer_blocked_seconds = 0.0
+
+    @property
+    def occupancy(self) -> float:
+        """Fraction of the queue in use (1.0 means the consumer is the bottleneck)."""
+        return self.depth / self.capacity
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["occupancy"] = self.occupancy
+        return data
+
+
+class AsyncMarketDataReader:
+    """
+    Async variant of MarketDataReader.start_stream for FastAPI / grpc.aio consumers.
+
+    File reading and parsing run on a worker thread that pushes batches into a
+    bounded asyncio.Queue. When the consumer falls behind the queue fills up and
+    the worker blocks (backpressure) instead of buffering the whole file in memory.
+    """
+
+    def __init__(self,
+                 reader: MarketDataReader,
+                 batch_size: int = 500,
+                 max_queue_batches: int = 8,
+                 on_metrics: Optional[Callable[[QueueMetrics], None]] = None):
+        if batch_size <= 0 or max_queue_batches <= 0:
+            raise ValueError("batch_size and max_queue_batches must be positive")
+        self.reader = reader
+        self.batch_size = batch_size
+        self.max_queue_batches = max_queue_batches
+        self.on_metrics = on_metrics
+        self.metrics = QueueMetrics(max_queue_batches)
+
+    async def stream_batches(self) -> AsyncGenerator[List[Dict], None]:
+        """Yields lists of rows as the worker thread produces them."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_batches)
+        stop = threading.Event()
+        producer = loop.run_in_executor(None, self._produce, loop, queue, stop)
+
+        try:
+            while True:
+                batch = await queue.get()
+                self.metrics.depth = queue.qsize()
+
+                if batch is _END_OF_STREAM:
+                    break
+                if isinstance(batch, BaseException):
+                    raise batch
+
+                self.metrics.batches_consumed += 1
+                self.metrics.rows_consumed += len(batch)
+                if self.on_metrics is not None:
+                    self.on_metrics(self.metrics)
+                yield batch
+        finally:
+            # Consumer left early (break / cancel): unblock the worker and let it exit
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
+            logger.info("market_data_stream_closed", file=str(self.reader.file_path),
+                        **self.metrics.snapshot())
+
+    async def start_stream(self) -> AsyncGenerator[Dict, None]:
+        """Row-by-row async iteration, same rows as MarketDataReader.start_stream."""
+        async for batch in self.stream_batches():
+            for row in batch:
+                yield row
+
+    # --- Worker thread ---
+
+    def _produce(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue,
+                 stop: threading.Event) -> None:
+        try:
+            batch = []
+            for row in self.reader.start_stream():
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    if not self._put(loop, queue, stop, batch):
+                        return
+                    batch = []
+            if batch and not self._put(loop, queue, stop, batch):
+                return
+            self._put(loop, queue, stop, _END_OF_STREAM)
+        except Exception as e:
+            self._put(loop, queue, stop, e)
+
+    async def _put_waiting(self, queue: asyncio.Queue, item: Any) -> None:
+        """Runs on the event loop; only time spent waiting on a full queue counts as blocked."""
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+        started = time.perf_counter()
+        await queue.put(item)
+        self.metrics.producer_blocked_seconds += time.perf_counter() - started
+
+    def _put(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue,
+             stop: threading.Event, item: Any) -> bool:
+        """Blocks the worker while the queue is full. Returns False once the consumer is gone."""
+        if stop.is_set():
+            return False
+
+        asyncio.run_coroutine_threadsafe(self._put_waiting(queue, item), loop).result()
+
+        if item is not _END_OF_STREAM:
+            self.metrics.batches_produced += 1
+        depth = queue.qsize()
+        self.metrics.depth = depth
+        if depth > self.metrics.max_depth:
+            self.metrics.max_depth = depth
+        return not stop.is_set()
@@ -1,4 +1,6 @@
-from sqlalchemy import String, Float, JSON
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, Float, JSON, func
 from sqlalchemy.orm import Mapped, mapped_column
 from src.infrastructure.database import Base
 
@@ -25,4 +27,20 @@ class OrderModel(Base):
     meta_data: Mapped[dict] = mapped_column("metadata", JSON, default={})
 
     def __repr__(self):
-        return f"<OrderDB(id={self.order_id}, sym={self.symbol})>"
\ No newline at end of file
+        return f"<OrderDB(id={self.order_id}, sym={self.symbol})>"
+
+class OutboxModel(Base):
+    """
+    Transactional outbox: events written in the same transaction as the orders
+    they describe, deleted by the relay once the broker has confirmed them.
+    """
+    __tablename__ = "outbox"
+
+    # Insertion order = publication order
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    topic: Mapped[str] = mapped_column(String)  # Routing key or task name
+    payload: Mapped[dict] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<OutboxDB(id={self.id}, topic={self.topic})>"
@@ -0,0 +1,62 @@
+from typing import Any, AsyncGenerator
+
+from src.domain.order_book import ASK, BID, OrderBook
+from src.generated import market_data_pb2
+
+
+class OrderBookGapError(Exception):
+    """An update was missed (the client lagged and the server dropped it): resubscribe for a new snapshot."""
+    pass
+
+
+class OrderBookReplica:
+    """
+    Client-side copy of a server L2 book, rebuilt from StreamOrderBook updates:
+    a snapshot replaces the local state, every later update must carry the next
+    sequence number and only lists the levels that changed.
+    """
+
+    def __init__(self, symbol: str):
+        self.book = OrderBook(symbol)
+        self.synced = False
+
+    @property
+    def sequence(self) -> int:
+        return self.book.sequence
+
+    def apply(self, update: Any) -> OrderBook:
+        book = self.book
+        if update.snapshot:
+            book.clear()
+            self.synced = True
+        elif not self.synced:
+            raise OrderBookGapError(f"{book.symbol}: incremental update before the first snapshot")
+        elif update.sequence != book.sequence + 1:
+            self.synced = False
+            raise OrderBookGapError(f"{book.symbol}: expected sequence {book.sequence + 1}, got {update.sequence}")
+
+        for level in update.bids:
+            book.apply(BID, level.price, level.quantity)
+        for level in update.asks:
+            book.apply(ASK, level.price, level.quantity)
+        book.sequence = update.sequence
+        book.timestamp = update.timestamp
+        return book
+
+
+async def stream_order_book(stub: Any, symbol: str) -> AsyncGenerator[OrderBook, None]:
+    """
+    Yields the locally rebuilt book after every update, resubscribing (and so
+    resynchronising from a fresh snapshot) whenever a gap is detected.
+    """
+    replica = OrderBookReplica(symbol)
+    while True:
+        stream = stub.StreamOrderBook(market_data_pb2.OrderBookRequest(symbol=symbol))
+        try:
+            async for update in stream:
+                yield replica.apply(update)
+            return
+        except OrderBookGapError:
+            continue
+        finally:
+            stream.cancel()
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Callable, List
+
+import structlog
+
+from src.application.ports.interfaces import AbstractUnitOfWork
+from src.domain.events import DomainEvent
+
+logger = structlog.get_logger()
+
+
+class CeleryOutboxPublisher:
+    """
+    Sends each event as the Celery task named by its topic, with the payload as
+    keyword arguments. The batch shares one pooled producer connection; with
+    the `confirm_publish` transport option each send waits for the broker's ack.
+    Kombu is blocking, so the batch runs in a worker thread.
+    """
+
+    def __init__(self, celery_app):
+        self.celery_app = celery_app
+
+    async def publish_batch(self, events: List[DomainEvent]) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._send, events)
+
+    def _send(self, events: List[DomainEvent]) -> None:
+        with self.celery_app.producer_or_acquire() as producer:
+            for event in events:
+                self.celery_app.send_task(event.topic, kwargs=event.payload, producer=producer)
+
+
+class OutboxRelay:
+    """
+    Drains the outbox table to the broker in batches.
+
+    Each round claims up to `batch_size` of the oldest events for its topic
+    prefix, publishes them, waits for the confirms and then deletes them, all
+    in one transaction. If publishing fails the transaction rolls back, the
+    rows stay and the batch is retried. Delivery is at least once, and
+    consumers de-duplicate on the event ID.
+
+    A full batch is followed immediately by the next one. Otherwise the relay
+    sleeps until `notify()` (called after a commit) or until `poll_interval`
+    passes, which also picks up events committed by other processes.
+
+    `publisher` is anything with `async publish_batch(events)` that raises unless
+    every event was confirmed: EventPublisher (RabbitMQ exchange) or
+    CeleryOutboxPublisher.
+    """
+
+    def __init__(self, uow_factory: Callable[[], AbstractUnitOfWork], publisher, topic_prefix: str = "",
+                 batch_size: int = 500, poll_interval: float = 0.5, retry_delay: float = 1.0):
+        self.uow_factory = uow_factory
+        self.publisher = publisher
+        self.topic_prefix = topic_prefix
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.task = None
+        self.published = 0
+        self.failures = 0
+        self._wakeup = asyncio.Event()
+
+    def notify(self) -> None:
+        """New events were committed: drain now rather than at the next poll."""
+        self._wakeup.set()
+
+    async def drain_once(self) -> int:
+        async with self.uow_factory() as uow:
+            events = await uow.outbox.claim(self.topic_prefix, self.batch_size)
+            if events:
+                await self.publisher.publish_batch(events)
+                await uow.outbox.remove([event.event_id for event in events])
+        self.published += len(events)
+        return len(events)
+
+    async def run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                count = await self.drain_once()
+            except Exception as e:
+                self.failures += 1
+                logger.error("outbox_relay_failed", topic_prefix=self.topic_prefix, error=str(e))
+                await asyncio.sleep(self.retry_delay)
+                continue
+
+            if count < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        """Stops the loop; events still in the table are published by the next relay to run."""
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+
+async def relay_celery_tasks() -> None:
+    """Relay for API-side events: `tasks.*` topics are Celery task names (see PlaceOrderUseCase)."""
+    from src.infrastructure.celery_app import celery_app
+    from src.infrastructure.uow_postgres import SqlAlchemyUnitOfWork
+
+    relay = OutboxRelay(SqlAlchemyUnitOfWork, CeleryOutboxPublisher(celery_app), topic_prefix="tasks.")
+    logger.info("outbox_relay_started", topic_prefix=relay.topic_prefix)
+    await relay.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(relay_celery_tasks())
@@ -1,6 +1,7 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set
 from src.domain.entities import Order
-from src.application.ports.interfaces import OrderRepository
+from src.domain.events import DomainEvent
+from src.application.ports.interfaces import OrderRepository, OutboxRepository
 
 class InMemoryOrderRepository(OrderRepository):
     def __init__(self):
@@ -9,5 +10,38 @@ class InMemoryOrderRepository(OrderRepository):
     def add(self, order: Order) -> None:
         self._storage[order.order_id] = order
 
+    def add_many(self, orders: List[Order]) -> None:
+        self._storage.update((order.order_id, order) for order in orders)
+
     def get_by_id(self, order_id: str) -> Optional[Order]:
-        return self._storage.get(order_id)
\ No newline at end of file
+        return self._storage.get(order_id)
+
+    def existing_ids(self, order_ids: List[str]) -> Set[str]:
+        return {order_id for order_id in order_ids if order_id in self._storage}
+
+    def list_page(self, after_id: Optional[str] = None, limit: int = 100) -> List[Order]:
+        ids = sorted(order_id for order_id in self._storage if after_id is None or order_id > after_id)
+        return [self._storage[order_id] for order_id in ids[:limit]]
+
+
+class InMemoryOutboxRepository(OutboxRepository):
+    def __init__(self):
+        self._events: Dict[int, DomainEvent] = {}
+        self._next_id = 1
+
+    def add(self, event: DomainEvent) -> None:
+        event.event_id = self._next_id
+        self._next_id += 1
+        self._events[event.event_id] = event
+
+    def add_many(self, events: List[DomainEvent]) -> None:
+        for event in events:
+            self.add(event)
+
+    def claim(self, topic_prefix: str, limit: int) -> List[DomainEvent]:
+        matching = [event for event in self._events.values() if event.topic.startswith(topic_prefix)]
+        return matching[:limit]
+
+    def remove(self, event_ids: List[int]) -> None:
+        for event_id in event_ids:
+            self._events.pop(event_id, None)
@@ -1,9 +1,10 @@
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import List, Optional, Set
 from src.domain.entities import Order
-from src.infrastructure.models import OrderModel
-from src.application.ports.interfaces import OrderRepository
+from src.domain.events import DomainEvent
+from src.infrastructure.models import OrderModel, OutboxModel
+from src.application.ports.interfaces import OrderRepository, OutboxRepository
 
 class SqlAlchemyOrderRepository(OrderRepository):
     def __init__(self, session: AsyncSession):
@@ -19,10 +20,32 @@ class SqlAlchemyOrderRepository(OrderRepository):
             quantity=order.quantity,
             price=order.price,
             side=order.side,
-            metadata=order.metadata
+            meta_data=order.metadata
         )
         self.session.add(model)
 
+    async def add_many(self, orders: List[Order]) -> None:
+        """
+        One multi-row INSERT for the whole batch instead of one ORM object (and
+        one flush round-trip) per order. Runs inside the unit of work's transaction.
+        """
+        if not orders:
+            return
+        await self.session.execute(
+            insert(OrderModel),
+            [
+                {
+                    "order_id": order.order_id,
+                    "symbol": order.symbol,
+                    "quantity": order.quantity,
+                    "price": order.price,
+                    "side": order.side,
+                    "meta_data": order.metadata,
+                }
+                for order in orders
+            ],
+        )
+
     async def get_by_id(self, order_id: str) -> Optional[Order]:
         """
         Fetches from DB Model -> Maps to Domain Entity
@@ -34,6 +57,26 @@ class SqlAlchemyOrderRepository(OrderRepository):
         if model is None:
                 return None
 
+        return self._to_entity(model)
+
+    async def existing_ids(self, order_ids: List[str]) -> Set[str]:
+        """One primary key lookup for the whole list; keep lists to a few thousand IDs."""
+        if not order_ids:
+            return set()
+        query = select(OrderModel.order_id).where(OrderModel.order_id.in_(order_ids))
+        result = await self.session.execute(query)
+        return set(result.scalars())
+
+    async def list_page(self, after_id: Optional[str] = None, limit: int = 100) -> List[Order]:
+        """A range scan of the primary key: no OFFSET, so every page costs the same."""
+        query = select(OrderModel).order_by(OrderModel.order_id).limit(limit)
+        if after_id is not None:
+            query = query.where(OrderModel.order_id > after_id)
+        result = await self.session.execute(query)
+        return [self._to_entity(model) for model in result.scalars()]
+
+    @staticmethod
+    def _to_entity(model: OrderModel) -> Order:
         return Order(
             order_id=model.order_id,
             symbol=model.symbol,
@@ -41,4 +84,39 @@ class SqlAlchemyOrderRepository(OrderRepository):
             price=model.price,
             side=model.side,
             metadata=model.meta_data
-        )
\ No newline at end of file
+        )
+
+
+class SqlAlchemyOutboxRepository(OutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, event: DomainEvent) -> None:
+        self.session.add(OutboxModel(topic=event.topic, payload=event.payload))
+
+    async def add_many(self, events: List[DomainEvent]) -> None:
+        if not events:
+            return
+        await self.session.execute(
+            insert(OutboxModel),
+            [{"topic": event.topic, "payload": event.payload} for event in events],
+        )
+
+    async def claim(self, topic_prefix: str, limit: int) -> List[DomainEvent]:
+        """
+        FOR UPDATE SKIP LOCKED: rows stay locked until this transaction ends and
+        other relays skip them, so several relays can drain the table in parallel.
+        """
+        query = (
+            select(OutboxModel)
+            .where(OutboxModel.topic.startswith(topic_prefix, autoescape=True))
+            .order_by(OutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(query)
+        return [DomainEvent(row.topic, row.payload, event_id=row.id) for row in result.scalars()]
+
+    async def remove(self, event_ids: List[int]) -> None:
+        if event_ids:
+            await self.session.execute(delete(OutboxModel).where(OutboxModel.id.in_(event_ids)))
@@ -0,0 +1,65 @@
+import hashlib
+from bisect import bisect_right
+from typing import Dict, Iterable, List
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def parse_shard_map(spec: str) -> Dict[str, str]:
+    """'a=host1:50052,b=host2:50052' -> {'a': 'host1:50052', 'b': 'host2:50052'}"""
+    shards = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, address = entry.partition("=")
+        if not sep or not name.strip() or not address.strip():
+            raise ValueError(f"Invalid shard entry {entry!r}, expected name=host:port")
+        shards[name.strip()] = address.strip()
+    if not shards:
+        raise ValueError("Shard map is empty")
+    return shards
+
+
+class ConsistentHashRing:
+    """
+    Maps keys (symbols) to shard names.
+
+    Each shard is placed on a 64-bit ring at `replicas` pseudo-random points,
+    hashed from its name. A key belongs to the first point clockwise from the
+    key's hash. Adding or removing a shard only moves the keys next to its
+    points, about 1/N of them. The other shards keep their symbols and the
+    in-memory state that goes with them. Placement depends only on the shard
+    names, so every gateway with the same shard map routes the same way.
+    """
+
+    def __init__(self, shards: Iterable[str] = (), replicas: int = 100):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+        for shard in shards:
+            self.add(shard)
+
+    def add(self, shard: str) -> None:
+        for i in range(self.replicas):
+            point = _hash(f"{shard}#{i}")
+            if point in self._owners:
+                continue
+            self._owners[point] = shard
+            self._points.insert(bisect_right(self._points, point), point)
+
+    def remove(self, shard: str) -> None:
+        self._points = [point for point in self._points if self._owners[point] != shard]
+        self._owners = {point: self._owners[point] for point in self._points}
+
+    def get(self, key: str) -> str:
+        if not self._points:
+            raise LookupError("No shards on the ring")
+        index = bisect_right(self._points, _hash(key))
+        return self._owners[self._points[index % len(self._points)]]
+
+    @property
+    def shards(self) -> List[str]:
+        return sorted(set(self._owners.values()))
@@ -0,0 +1,352 @@
+"""
+Compact binary tick archive (".cfta").
+
+Layout:
+    header  : magic 'CFTA' | version | price_decimals | volume_decimals | compressed
+    blocks  : [payload_len:u32][tick_count:u32][payload] ...
+    index   : [offset:u64] * n_blocks
+    trailer : [n_blocks:u32][index_offset:u64] 'CFTI'
+
+Every block carries its own symbol table and delta bases, so any block can be
+decoded on its own (random access, parallel decode). Inside a block:
+    - symbols    -> ids into the block's symbol table (varints)
+    - timestamps -> zigzag varint deltas (ticks are time ordered)
+    - prices     -> fixed-point integers, zigzag varint deltas per symbol
+    - volumes    -> fixed-point integers, zigzag varint deltas per symbol
+Encoding and decoding are vectorized with numpy; payloads are optionally zlib'd.
+"""
+import struct
+import zlib
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.market_data import MarketDataReader, Tick
+
+MAGIC = b"CFTA"
+INDEX_MAGIC = b"CFTI"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBBBB")
+_BLOCK_HEADER = struct.Struct("<II")
+_TRAILER = struct.Struct("<IQ4s")
+
+_U64 = np.uint64
+
+
+# --- Vectorized varint / zigzag primitives ---
+
+def zigzag_encode(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.int64)
+    return ((values << 1) ^ (values >> 63)).astype(_U64)
+
+
+def zigzag_decode(values: np.ndarray) -> np.ndarray:
+    values = values.astype(_U64)
+    return (values >> _U64(1)).astype(np.int64) ^ -(values & _U64(1)).astype(np.int64)
+
+
+def encode_varints(values: np.ndarray) -> bytes:
+    """LEB128-encodes an array of unsigned integers without a Python-level loop per value."""
+    values = np.asarray(values, dtype=_U64)
+    if values.size == 0:
+        return b""
+
+    lengths = np.ones(values.size, dtype=np.int64)
+    for k in range(1, 10):
+        lengths += values >= _U64(1 << (7 * k))
+
+    offsets = np.zeros(values.size, dtype=np.int64)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    out = np.empty(int(lengths.sum()), dtype=np.uint8)
+
+    for k in range(int(lengths.max())):
+        mask = lengths > k
+        chunk = ((values[mask] >> _U64(7 * k)) & _U64(0x7F)).astype(np.uint8)
+        chunk[lengths[mask] > k + 1] |= 0x80
+        out[offsets[mask] + k] = chunk
+
+    return out.tobytes()
+
+
+def decode_varints(buffer: bytes) -> np.ndarray:
+    """Inverse of encode_varints."""
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size == 0:
+        return np.empty(0, dtype=_U64)
+
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+
+    position = np.arange(data.size) - np.repeat(starts, ends - starts + 1)
+    parts = (data & 0x7F).astype(_U64) << (position * 7).astype(_U64)
+    return np.add.reduceat(parts, starts)
+
+
+def grouped_deltas(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Deltas against the previous value of the same group (first of a group is absolute)."""
+    order = np.argsort(groups, kind="stable")
+    ordered = values[order]
+    deltas = np.empty_like(ordered)
+    deltas[0:1] = ordered[0:1]
+    deltas[1:] = ordered[1:] - ordered[:-1]
+
+    ordered_groups = groups[order]
+    group_starts = np.flatnonzero(np.r_[True, ordered_groups[1:] != ordered_groups[:-1]])
+    deltas[group_starts] = ordered[group_starts]
+
+    result = np.empty_like(deltas)
+    result[order] = deltas
+    return result
+
+
+def grouped_cumsum(deltas: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Inverse of grouped_deltas."""
+    order = np.argsort(groups, kind="stable")
+    ordered = deltas[order]
+    ordered_groups = groups[order]
+
+    running = np.cumsum(ordered)
+    group_starts = np.flatnonzero(np.r_[True, ordered_groups[1:] != ordered_groups[:-1]])
+    carried = np.r_[0, running[group_starts[1:] - 1]]
+    lengths = np.diff(np.r_[group_starts, ordered.size])
+    ordered_values = running - np.repeat(carried, lengths)
+
+    result = np.empty_like(ordered_values)
+    result[order] = ordered_values
+    return result
+
+
+def _pack_column(values: np.ndarray) -> bytes:
+    encoded = encode_varints(values)
+    return encode_varints(np.array([len(encoded)])) + encoded
+
+
+class TickBlock:
+    """Decoded columns of one archive block."""
+    __slots__ = ['symbols', 'symbol_ids', 'timestamps', 'prices', 'volumes']
+
+    def __init__(self, symbols: List[str], symbol_ids: np.ndarray, timestamps: np.ndarray,
+                 prices: np.ndarray, volumes: np.ndarray):
+        self.symbols = symbols
+        self.symbol_ids = symbol_ids
+        self.timestamps = timestamps
+        self.prices = prices
+        self.volumes = volumes
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def rows(self) -> Generator[Dict[str, Any], None, None]:
+        symbols = [self.symbols[i] for i in self.symbol_ids.tolist()]
+        for symbol, price, volume, timestamp in zip(
+                symbols, self.prices.tolist(), self.volumes.tolist(), self.timestamps.tolist()):
+            yield {"symbol": symbol, "price": price, "volume": volume, "timestamp": timestamp}
+
+
+class TickArchiveWriter:
+    """
+    Buffers ticks and writes them as independently decodable blocks.
+    Use as a context manager so the index is always written.
+    """
+
+    def __init__(self, file_path: str, block_size: int = 65_536, price_decimals: int = 4,
+                 volume_decimals: int = 8, compress: bool = True, compression_level: int = 6):
+        self.file_path = file_path
+        self.block_size = block_size
+        self.price_decimals = price_decimals
+        self.volume_decimals = volume_decimals
+        self.compress = compress
+        self.compression_level = compression_level
+        self.ticks_written = 0
+
+        self._symbols: List[str] = []
+        self._prices: List[float] = []
+        self._volumes: List[float] = []
+        self._timestamps: List[int] = []
+        self._offsets: List[int] = []
+
+        self._file = open(file_path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, price_decimals, volume_decimals, int(compress)))
+
+    def __enter__(self) -> 'TickArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, symbol: str, price: float, volume: float, timestamp: int) -> None:
+        self._symbols.append(symbol)
+        self._prices.append(price)
+        self._volumes.append(volume)
+        self._timestamps.append(timestamp)
+        if len(self._timestamps) >= self.block_size:
+            self._flush_buffer()
+
+    def write_tick(self, tick: Tick) -> None:
+        self.write(tick.symbol, tick.price, tick.volume, tick.timestamp)
+
+    def write_arrays(self, symbols: Sequence[str], prices: np.ndarray, volumes: np.ndarray,
+                     timestamps: np.ndarray, executor: Optional[Any] = None) -> None:
+        """
+        Bulk path for vectorized producers. Arrays are sliced into blocks directly;
+        pass a concurrent.futures executor to encode blocks in parallel.
+        """
+        self._flush_buffer()
+        symbols = np.asarray(symbols)
+
+        def encode(start: int) -> bytes:
+            end = start + self.block_size
+            return self._encode_block(symbols[start:end], np.asarray(prices[start:end]),
+                                      np.asarray(volumes[start:end]), np.asarray(timestamps[start:end]))
+
+        starts = range(0, len(timestamps), self.block_size)
+        payloads = map(encode, starts) if executor is None else executor.map(encode, starts)
+        for start, payload in zip(starts, payloads):
+            self._append_block(payload, min(self.block_size, len(timestamps) - start))
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self._flush_buffer()
+        index_offset = self._file.tell()
+        self._file.write(np.asarray(self._offsets, dtype="<u8").tobytes())
+        self._file.write(_TRAILER.pack(len(self._offsets), index_offset, INDEX_MAGIC))
+        self._file.close()
+
+    def _flush_buffer(self) -> None:
+        if not self._timestamps:
+            return
+        payload = self._encode_block(np.asarray(self._symbols), np.asarray(self._prices, dtype=np.float64),
+                                     np.asarray(self._volumes, dtype=np.float64),
+                                     np.asarray(self._timestamps, dtype=np.int64))
+        self._append_block(payload, len(self._timestamps))
+        self._symbols, self._prices, self._volumes, self._timestamps = [], [], [], []
+
+    def _encode_block(self, symbols: np.ndarray, prices: np.ndarray, volumes: np.ndarray,
+                      timestamps: np.ndarray) -> bytes:
+        table, symbol_ids = np.unique(symbols, return_inverse=True)
+        symbol_ids = symbol_ids.astype(np.int64)
+
+        fixed_prices = np.rint(prices * 10 ** self.price_decimals).astype(np.int64)
+        fixed_volumes = np.rint(volumes * 10 ** self.volume_decimals).astype(np.int64)
+        timestamps = timestamps.astype(np.int64)
+        time_deltas = np.diff(timestamps, prepend=np.int64(0))
+
+        encoded_table = b"".join(
+            encode_varints(np.array([len(raw)])) + raw
+            for raw in (str(s).encode("utf-8") for s in table.tolist())
+        )
+        payload = b"".join([
+            encode_varints(np.array([len(table)])) + encoded_table,
+            _pack_column(symbol_ids),
+            _pack_column(zigzag_encode(time_deltas)),
+            _pack_column(zigzag_encode(grouped_deltas(fixed_prices, symbol_ids))),
+            _pack_column(zigzag_encode(grouped_deltas(fixed_volumes, symbol_ids))),
+        ])
+        if self.compress:
+            payload = zlib.compress(payload, self.compression_level)
+        return payload
+
+    def _append_block(self, payload: bytes, count: int) -> None:
+        self._offsets.append(self._file.tell())
+        self._file.write(_BLOCK_HEADER.pack(len(payload), count))
+        self._file.write(payload)
+        self.ticks_written += count
+
+
+class TickArchiveReader(MarketDataReader):
+    """
+    Drop-in replacement for MarketDataReader over a .cfta archive.
+    start_stream() yields the same row dicts (typed values instead of strings);
+    iter_blocks() exposes whole columns for vectorized consumers.
+    """
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        with open(file_path, "rb") as f:
+            magic, version, self.price_decimals, self.volume_decimals, compressed = \
+                _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{file_path} is not a v{VERSION} tick archive")
+            self.compressed = bool(compressed)
+
+            f.seek(-_TRAILER.size, 2)
+            n_blocks, index_offset, index_magic = _TRAILER.unpack(f.read(_TRAILER.size))
+            if index_magic != INDEX_MAGIC:
+                raise ValueError(f"{file_path} has no block index (truncated archive?)")
+            f.seek(index_offset)
+            self.block_offsets: List[int] = np.frombuffer(f.read(8 * n_blocks), dtype="<u8").tolist()
+
+    def __len__(self):
+        return len(self.block_offsets)
+
+    def read_block(self, index: int) -> TickBlock:
+        """Decodes one block. Safe to call concurrently from threads or processes."""
+        with open(self.file_path, "rb") as f:
+            f.seek(self.block_offsets[index])
+            payload_len, count = _BLOCK_HEADER.unpack(f.read(_BLOCK_HEADER.size))
+            payload = f.read(payload_len)
+        return self.decode_block(payload, count)
+
+    def decode_block(self, payload: bytes, count: int) -> TickBlock:
+        if self.compressed:
+            payload = zlib.decompress(payload)
+        view = memoryview(payload)
+        pos = 0
+
+        def read_varint() -> int:
+            nonlocal pos
+            result, shift = 0, 0
+            while True:
+                byte = view[pos]
+                pos += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+
+        symbols = []
+        for _ in range(read_varint()):
+            length = read_varint()
+            symbols.append(bytes(view[pos:pos + length]).decode("utf-8"))
+            pos += length
+
+        columns = []
+        for _ in range(4):
+            length = read_varint()
+            columns.append(decode_varints(view[pos:pos + length]))
+            pos += length
+
+        symbol_ids = columns[0].astype(np.int64)
+        timestamps = np.cumsum(zigzag_decode(columns[1]))
+        prices = grouped_cumsum(zigzag_decode(columns[2]), symbol_ids) / 10 ** self.price_decimals
+        volumes = grouped_cumsum(zigzag_decode(columns[3]), symbol_ids) / 10 ** self.volume_decimals
+
+        if len(timestamps) != count:
+            raise ValueError(f"Corrupt block: expected {count} ticks, decoded {len(timestamps)}")
+        return TickBlock(symbols, symbol_ids, timestamps, prices, volumes)
+
+    def iter_blocks(self, executor: Optional[Any] = None) -> Iterable[TickBlock]:
+        """
+        Yields decoded blocks in order. Pass a concurrent.futures executor to
+        decode blocks in parallel (zlib and numpy release the GIL for large blocks).
+        """
+        indices = range(len(self.block_offsets))
+        if executor is None:
+            return (self.read_block(i) for i in indices)
+        return executor.map(self.read_block, indices)
+
+    def start_stream(self) -> Generator[Dict, None, None]:
+        for block in self.iter_blocks():
+            yield from block.rows()
+
+
+def convert_csv_to_archive(csv_path: str, archive_path: str, **writer_options) -> int:
+    """Re-encodes a MarketDataReader CSV file as an archive. Returns the tick count."""
+    with TickArchiveWriter(archive_path, **writer_options) as writer:
+        for tick in MarketDataReader(csv_path).stream_ticks():
+            writer.write_tick(tick)
+    return writer.ticks_written
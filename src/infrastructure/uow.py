@@ -1,13 +1,14 @@
 import structlog
 
 from src.application.ports.interfaces import AbstractUnitOfWork
-from src.infrastructure.repositories.memory import InMemoryOrderRepository
+from src.infrastructure.repositories.memory import InMemoryOrderRepository, InMemoryOutboxRepository
 
 logger = structlog.getLogger()
 
 class InMemoryUnitOfWork(AbstractUnitOfWork):
     def __init__(self):
         self.orders = InMemoryOrderRepository()
+        self.outbox = InMemoryOutboxRepository()
         self.committed = False
 
     def commit(self):
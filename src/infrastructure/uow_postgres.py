@@ -1,7 +1,7 @@
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.ports.interfaces import AbstractUnitOfWork
-from src.infrastructure.repositories.postgres import SqlAlchemyOrderRepository
+from src.infrastructure.repositories.postgres import SqlAlchemyOrderRepository, SqlAlchemyOutboxRepository
 from src.infrastructure.database import get_session_factory
 
 logger = structlog.get_logger()
@@ -15,6 +15,7 @@ class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
         self.session = self.session_factory()
         # Initialize Repositories
         self.orders = SqlAlchemyOrderRepository(self.session)
+        self.outbox = SqlAlchemyOutboxRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
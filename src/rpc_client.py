@@ -5,6 +5,7 @@ from src.generated import market_data_pb2
 from src.generated import market_data_pb2_grpc
 from src.generated import order_pb2
 from src.generated import order_pb2_grpc
+from src.infrastructure.order_book_client import OrderBookReplica
 
 def run_market_data_client():
     print("--- Market Data Client (Streaming) ---")
@@ -25,6 +26,47 @@ def run_market_data_client():
     except Exception as e:
         print(f"Market Data Error: {e}")
 
+def run_market_data_batch_client():
+    print("\n--- Market Data Client (Multi-Symbol Batches) ---")
+    try:
+        with grpc.insecure_channel('localhost:50051') as channel:
+            stub = market_data_pb2_grpc.MarketDataServiceStub(channel)
+            request = market_data_pb2.MultiSymbolRequest(
+                symbols=["BTC/USD", "ETH/USD", "SOL/USD"],
+                coalesce_ms=250
+            )
+
+            start_time = time.time()
+            for batch in stub.StreamMarketDataBatch(request):
+                symbols = ", ".join(tick.symbol for tick in batch.ticks)
+                print(f"Batch of {len(batch.ticks)} ticks: {symbols}")
+
+                if time.time() - start_time > 3:
+                    break
+
+    except Exception as e:
+        print(f"Market Data Batch Error: {e}")
+
+def run_order_book_client():
+    print("\n--- Order Book Client (L2 Snapshot + Deltas) ---")
+    try:
+        with grpc.insecure_channel('localhost:50051') as channel:
+            stub = market_data_pb2_grpc.MarketDataServiceStub(channel)
+            replica = OrderBookReplica("BTC/USD")
+
+            start_time = time.time()
+            for update in stub.StreamOrderBook(market_data_pb2.OrderBookRequest(symbol="BTC/USD")):
+                book = replica.apply(update)
+                kind = "snapshot" if update.snapshot else "delta"
+                print(f"#{update.sequence} {kind}: {len(update.bids) + len(update.asks)} levels | "
+                      f"bid {book.best_bid()} / ask {book.best_ask()}")
+
+                if time.time() - start_time > 3:
+                    break
+
+    except Exception as e:
+        print(f"Order Book Error: {e}")
+
 def run_order_client():
     print("\n--- Order Client (Unary) ---")
     try:
@@ -44,6 +86,33 @@ def run_order_client():
     except Exception as e:
         print(f"Order Error: {e}")
 
+def run_order_stream_client(orders: int = 100):
+    print("\n--- Order Client (Bidirectional Stream) ---")
+    try:
+        with grpc.insecure_channel('localhost:50052') as channel:
+            stub = order_pb2_grpc.OrderServiceStub(channel)
+
+            def requests():
+                for i in range(orders):
+                    yield order_pb2.OrderRequest(
+                        symbol="ETH/USD", quantity=0.1, side="BUY" if i % 2 else "SELL",
+                        client_order_id=f"demo-{i}"
+                    )
+
+            start_time = time.time()
+            statuses = {}
+            # Acks arrive as orders complete, not necessarily in request order
+            for ack in stub.StreamOrders(requests()):
+                statuses[ack.status] = statuses.get(ack.status, 0) + 1
+            elapsed = time.time() - start_time
+            print(f"{orders} orders acknowledged in {elapsed:.2f}s: {statuses}")
+
+    except Exception as e:
+        print(f"Order Stream Error: {e}")
+
 if __name__ == '__main__':
     run_order_client()
+    run_order_stream_client()
     run_market_data_client()
+    run_market_data_batch_client()
+    run_order_book_client()
@@ -0,0 +1,220 @@
+# src/scripts/benchmark_market_data.py
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List
+
+import grpc
+import numpy as np
+
+# Add project root to path so we can import src
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from src.generated import market_data_pb2, market_data_pb2_grpc
+from src.services.market_data_service.server import MarketDataService
+
+PERCENTILES = [50, 90, 99, 99.9]
+# grpc.aio multiplexes streams over HTTP/2; spread them so no channel hits the stream limit
+SUBSCRIBERS_PER_CHANNEL = 100
+
+
+def rss_bytes() -> int:
+    """Current resident set size (Linux /proc), falling back to the peak from getrusage."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+# --- Server process ---
+
+def run_server(conn, tick_interval: float, queue_size: int) -> None:
+    # Per-subscription INFO lines would dominate the measured CPU
+    logging.getLogger().setLevel(logging.WARNING)
+
+    async def main():
+        server = grpc.aio.server()
+        service = MarketDataService(tick_interval=tick_interval, subscriber_queue_size=queue_size)
+        market_data_pb2_grpc.add_MarketDataServiceServicer_to_server(service, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        conn.send({"port": port})
+
+        loop = asyncio.get_running_loop()
+        while True:
+            command = await loop.run_in_executor(None, conn.recv)
+            stats = service.broadcaster.subscription_stats()
+            conn.send({
+                "rss_bytes": rss_bytes(),
+                "cpu_seconds": cpu_seconds(),
+                "subscriptions": len(stats),
+                "dropped": sum(s["dropped"] for s in stats),
+                "conflated": sum(s["conflated"] for s in stats),
+            })
+            if command == "stop":
+                break
+
+        await server.stop(None)
+        await service.close()
+
+    asyncio.run(main())
+
+
+# --- Client processes ---
+
+def run_clients(port: int, symbols: List[str], measure_start: float, measure_end: float, results) -> None:
+    async def subscriber(stub, symbol, latencies):
+        received = 0
+        stream = stub.StreamMarketData(market_data_pb2.MarketDataRequest(symbol=symbol))
+        try:
+            async for response in stream:
+                now = time.time()
+                if now >= measure_end:
+                    break
+                if now >= measure_start:
+                    received += 1
+                    # Live ticks embed their creation time in epoch milliseconds
+                    latencies.append(now * 1000.0 - response.timestamp)
+        finally:
+            stream.cancel()
+        return received
+
+    async def main():
+        latencies = array("d")
+        channels = [grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+                    for _ in range(0, len(symbols), SUBSCRIBERS_PER_CHANNEL)]
+        stubs = [market_data_pb2_grpc.MarketDataServiceStub(channel) for channel in channels]
+        try:
+            counts = await asyncio.gather(*[
+                subscriber(stubs[i // SUBSCRIBERS_PER_CHANNEL], symbol, latencies)
+                for i, symbol in enumerate(symbols)
+            ])
+        finally:
+            for channel in channels:
+                await channel.close()
+        results.put({"messages": sum(counts), "idle_subscribers": counts.count(0),
+                     "latencies": latencies.tobytes()})
+
+    asyncio.run(main())
+
+
+# --- Orchestration ---
+
+def run_benchmark(subscribers: int, symbols: int, duration: float, warmup: float,
+                  tick_interval: float, queue_size: int, client_processes: int) -> Dict[str, Any]:
+    ctx = mp.get_context("spawn")
+    server_conn, child_conn = ctx.Pipe()
+    server = ctx.Process(target=run_server, args=(child_conn, tick_interval, queue_size), daemon=True)
+    server.start()
+    port = server_conn.recv()["port"]
+
+    server_conn.send("measure")
+    idle = server_conn.recv()
+
+    # Subscribers are spread round-robin over the symbols, then over the client processes
+    assignments = [f"SYM{i % symbols}" for i in range(subscribers)]
+    measure_start = time.time() + warmup
+    measure_end = measure_start + duration
+    results = ctx.Queue()
+    clients = [
+        ctx.Process(target=run_clients,
+                    args=(port, assignments[i::client_processes], measure_start, measure_end, results))
+        for i in range(client_processes)
+    ]
+    for client in clients:
+        client.start()
+
+    time.sleep(max(0.0, measure_start - time.time()))
+    server_conn.send("measure")
+    loaded = server_conn.recv()
+    time.sleep(max(0.0, measure_end - time.time()))
+    server_conn.send("measure")
+    finished = server_conn.recv()
+
+    client_results = [results.get(timeout=duration + warmup + 60) for _ in clients]
+    for client in clients:
+        client.join()
+    server_conn.send("stop")
+    server_conn.recv()
+    server.join(timeout=10)
+
+    latencies = np.concatenate([np.frombuffer(r["latencies"], dtype=np.float64) for r in client_results])
+    messages = sum(r["messages"] for r in client_results)
+    server_cpu = finished["cpu_seconds"] - loaded["cpu_seconds"]
+
+    return {
+        "config": {
+            "subscribers": subscribers,
+            "symbols": symbols,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "tick_interval_s": tick_interval,
+            "subscriber_queue_size": queue_size,
+            "client_processes": client_processes,
+            "cpu_count": os.cpu_count(),
+        },
+        "throughput": {
+            "messages": messages,
+            "messages_per_second": messages / duration,
+            "expected_per_second": subscribers / tick_interval,
+            "idle_subscribers": sum(r["idle_subscribers"] for r in client_results),
+        },
+        "latency_ms": {
+            "samples": int(latencies.size),
+            **({f"p{p:g}": float(np.percentile(latencies, p)) for p in PERCENTILES} if latencies.size else {}),
+            "max": float(latencies.max()) if latencies.size else None,
+            "mean": float(latencies.mean()) if latencies.size else None,
+        },
+        "server": {
+            "cpu_seconds": server_cpu,
+            "cpu_percent": 100.0 * server_cpu / duration,
+            "rss_idle_mb": idle["rss_bytes"] / 1e6,
+            "rss_loaded_mb": finished["rss_bytes"] / 1e6,
+            "memory_per_subscriber_kb": (finished["rss_bytes"] - idle["rss_bytes"]) / subscribers / 1e3,
+            "subscriptions": loaded["subscriptions"],
+            "dropped": finished["dropped"],
+            "conflated": finished["conflated"],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test StreamMarketData: throughput, latency, CPU and memory")
+    parser.add_argument("--subscribers", type=int, default=1_000)
+    parser.add_argument("--symbols", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds to connect before measuring")
+    parser.add_argument("--tick-interval", type=float, default=0.1, help="Seconds between ticks per symbol")
+    parser.add_argument("--queue-size", type=int, default=1_000, help="Per-subscriber queue on the server")
+    parser.add_argument("--client-processes", type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    parser.add_argument("--output", default=None, help="Write the JSON report here (default: stdout only)")
+    args = parser.parse_args()
+
+    print(f"--- Market Data Benchmark: {args.subscribers:,} subscribers x {args.symbols} symbols, "
+          f"{args.duration:.0f}s ---", file=sys.stderr)
+    report = run_benchmark(args.subscribers, args.symbols, args.duration, args.warmup,
+                           args.tick_interval, args.queue_size, args.client_processes)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(f"Report written to {args.output}", file=sys.stderr)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# project root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from src.domain.matching_engine import BUY, SELL, MatchingEngine
+
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+def build_flow(n: int, symbols: int, cancel_ratio: float, market_ratio: float, seed: int = 42):
+    """
+    Random order flow around a fixed mid: limit prices within +-1% on a 0.01
+    tick, so books get deep and most orders cross a few levels. Generated up
+    front so the timed loop measures the engine, not the generator.
+    """
+    rng = np.random.default_rng(seed)
+    symbol_ids = rng.integers(0, symbols, n)
+    sides = np.where(rng.random(n) < 0.5, BUY, SELL)
+    quantities = np.round(rng.exponential(1.0, n) + 0.01, 4)
+    offsets = rng.normal(0, 0.004, n)
+    prices = np.round(100.0 * (1 + offsets), 2)
+    actions = rng.random(n)
+    # What a cancel targets: a random earlier order (it may have filled already)
+    targets = (rng.random(n) * np.arange(n)).astype(np.int64)
+    return (
+        [f"SYM{i}" for i in symbol_ids.tolist()], sides.tolist(), quantities.tolist(), prices.tolist(),
+        (actions < cancel_ratio).tolist(), (actions > 1 - market_ratio).tolist(), targets.tolist(),
+    )
+
+
+def run_benchmark(n: int, symbols: int, cancel_ratio: float, market_ratio: float):
+    symbol_names, sides, quantities, prices, cancels, markets, targets = build_flow(
+        n, symbols, cancel_ratio, market_ratio
+    )
+    engine = MatchingEngine()
+    trades = 0
+
+    def count(_trade):
+        nonlocal trades
+        trades += 1
+
+    engine.add_listener(count)
+    latencies = np.empty(n)
+    submit, cancel, clock = engine.submit, engine.cancel, time.perf_counter
+
+    print(f"--- Matching Engine Benchmark ({n:,} messages, {symbols} symbols) ---")
+    started = clock()
+    for i in range(n):
+        t0 = clock()
+        if cancels[i]:
+            cancel(symbol_names[targets[i]], str(targets[i]))
+        else:
+            submit(symbol_names[i], str(i), sides[i], quantities[i], None if markets[i] else prices[i])
+        latencies[i] = clock() - t0
+    elapsed = time.perf_counter() - started
+
+    resting = sum(len(book.orders) for book in engine.books.values())
+    levels = sum(len(book.bids.levels) + len(book.asks.levels) for book in engine.books.values())
+    print(f"   Throughput : {n / elapsed:,.0f} messages/s ({elapsed:.3f}s)")
+    print(f"   Trades     : {trades:,}")
+    print(f"   Resting    : {resting:,} orders on {levels:,} price levels")
+    print("   Latency    : " + " | ".join(
+        f"p{p} {np.percentile(latencies, p) * 1e6:.1f}us" for p in PERCENTILES
+    ))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Throughput and latency of the price-time priority matching engine")
+    parser.add_argument("--orders", type=int, default=1_000_000, help="Messages (orders and cancels)")
+    parser.add_argument("--symbols", type=int, default=4)
+    parser.add_argument("--cancel-ratio", type=float, default=0.3)
+    parser.add_argument("--market-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+    run_benchmark(args.orders, args.symbols, args.cancel_ratio, args.market_ratio)
@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# project root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import Column, Float, MetaData, String, Table, insert, text
+
+from src.domain.ids import OrderIdGenerator
+from src.infrastructure.database import get_engine
+
+metadata = MetaData()
+
+
+def orders_table(name: str) -> Table:
+    """Same key and columns as `orders`, so the primary key index behaves the same."""
+    return Table(
+        name, metadata,
+        Column("order_id", String, primary_key=True),
+        Column("symbol", String),
+        Column("quantity", Float),
+        Column("price", Float),
+        Column("side", String(4)),
+    )
+
+
+async def fill(engine, table: Table, new_id, rows: int, batch_size: int) -> float:
+    """Inserts `rows` rows in batches of one multi-row INSERT each; returns the seconds taken."""
+    started = time.perf_counter()
+    for start in range(0, rows, batch_size):
+        batch = [
+            {"order_id": new_id(), "symbol": "BTC", "quantity": 1.0, "price": 50_000.0, "side": "BUY"}
+            for _ in range(min(batch_size, rows - start))
+        ]
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), batch)
+    return time.perf_counter() - started
+
+
+async def run_benchmark(rows: int, measured: int, batch_size: int):
+    engine = get_engine()
+    generators = {
+        "uuid4": lambda: str(uuid.uuid4()),
+        "time-sortable": OrderIdGenerator().new_id,
+    }
+
+    print(f"--- Order ID Insert Benchmark ({rows:,} existing rows, {measured:,} measured) ---")
+    for label, new_id in generators.items():
+        table = orders_table(f"bench_orders_{label.replace('-', '_')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(table.drop, checkfirst=True)
+            await conn.run_sync(table.create)
+
+        # A large table first: random keys only hurt once the index outgrows the cache
+        await fill(engine, table, new_id, rows, batch_size)
+        elapsed = await fill(engine, table, new_id, measured, batch_size)
+
+        async with engine.begin() as conn:
+            index_bytes = (await conn.execute(
+                text("SELECT pg_relation_size(:index)"), {"index": f"{table.name}_pkey"}
+            )).scalar_one()
+            await conn.run_sync(table.drop)
+
+        print(f"   {label:<14}: {measured / elapsed:10,.0f} rows/s | primary key {index_bytes / 1e6:8.1f} MB")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Insert throughput into a large table: uuid4 vs time-sortable IDs")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Rows loaded before measuring")
+    parser.add_argument("--measured", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.measured, args.batch_size))
@@ -0,0 +1,85 @@
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# project root
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from src.infrastructure.tick_archive import TickArchiveReader, TickArchiveWriter
+
+
+def build_ticks(n: int, seed: int = 42):
+    """Random-walk ticks over a handful of symbols, time ordered."""
+    rng = np.random.default_rng(seed)
+    symbols = np.array(["BTCUSD", "ETHUSD", "SOLUSD", "XRPUSD"])
+    base = np.array([60000.0, 3000.0, 150.0, 0.5])
+
+    ids = rng.integers(0, len(symbols), n)
+    steps = rng.normal(0, 0.0002, n)
+    prices = np.empty(n)
+    for i in range(len(symbols)):
+        mask = ids == i
+        prices[mask] = np.round(base[i] * np.exp(np.cumsum(steps[mask])), 4)
+    volumes = np.round(rng.exponential(0.5, n), 8)
+    timestamps = 1_700_000_000_000 + np.cumsum(rng.exponential(5, n)).astype(np.int64)
+    return symbols[ids], prices, volumes, timestamps
+
+
+def run_benchmark(n: int):
+    symbols, prices, volumes, timestamps = build_ticks(n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "ticks.csv")
+        archive_path = os.path.join(tmp, "ticks.cfta")
+
+        print(f"--- Tick Archive Benchmark ({n:,} ticks) ---")
+
+        # 1. CSV encode
+        start = time.perf_counter()
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["symbol", "price", "volume", "timestamp"])
+            writer.writerows(zip(symbols.tolist(), prices.tolist(), volumes.tolist(), timestamps.tolist()))
+        csv_encode = time.perf_counter() - start
+
+        # 2. Archive encode
+        start = time.perf_counter()
+        with TickArchiveWriter(archive_path) as archive:
+            archive.write_arrays(symbols, prices, volumes, timestamps)
+        archive_encode = time.perf_counter() - start
+
+        # 3. CSV decode (parse to typed columns, the minimum a strategy needs)
+        start = time.perf_counter()
+        with open(csv_path, newline="") as f:
+            reader = csv.reader(f)
+            next(reader)
+            parsed = [(row[0], float(row[1]), float(row[2]), int(row[3])) for row in reader]
+        csv_decode = time.perf_counter() - start
+        assert len(parsed) == n
+
+        # 4. Archive decode (columnar)
+        start = time.perf_counter()
+        decoded = sum(len(block) for block in TickArchiveReader(archive_path).iter_blocks())
+        archive_decode = time.perf_counter() - start
+        assert decoded == n
+
+        csv_size = os.path.getsize(csv_path)
+        archive_size = os.path.getsize(archive_path)
+
+    print(f"   CSV     : {csv_size / 1e6:8.2f} MB | encode {csv_encode:.3f}s | decode {csv_decode:.3f}s")
+    print(f"   Archive : {archive_size / 1e6:8.2f} MB | encode {archive_encode:.3f}s | decode {archive_decode:.3f}s")
+    print(f"\n Size Reduction: {csv_size / archive_size:.1f}x")
+    print(f" Decode Speedup: {csv_decode / archive_decode:.1f}x faster")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare CSV vs .cfta tick archives")
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run_benchmark(args.ticks)
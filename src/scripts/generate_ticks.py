@@ -0,0 +1,236 @@
+# src/scripts/generate_ticks.py
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Generator, List, Tuple
+
+import numpy as np
+
+# Add project root to path so we can import src
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from src.infrastructure.tick_archive import TickArchiveWriter, grouped_cumsum
+
+BASE_SYMBOLS = ["BTC", "ETH", "SOL", "XRP", "ADA", "DOT", "DOGE", "AVAX"]
+MS_PER_YEAR = 365 * 24 * 3600 * 1000
+
+TickChunk = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class SyntheticTickGenerator:
+    """
+    Vectorized, seed-deterministic tick generator.
+
+    - Prices: per-symbol geometric Brownian motion plus Poisson jumps.
+    - Regimes: alternating calm/burst periods (geometric run lengths). Bursts
+      shrink inter-arrival gaps and inflate volatility and volume together,
+      which gives bursty timestamps and volume/volatility clustering.
+    - Symbols: Zipf-like popularity, so a few symbols dominate the flow.
+
+    Chunk i draws from its own RNG stream ([seed, i]), so the same seed and
+    chunk size always reproduce the same ticks, byte for byte.
+    """
+
+    def __init__(self, n_symbols: int = 8, seed: int = 42, start_ms: int = 1_700_000_000_000,
+                 mean_gap_ms: float = 5.0, volatility: float = 0.6, drift: float = 0.0,
+                 jump_intensity: float = 50.0, jump_std: float = 0.01,
+                 burst_multiplier: float = 8.0, mean_regime_ticks: int = 2_000):
+        self.seed = seed
+        self.symbols = np.array(self._symbol_names(n_symbols))
+        self.mean_gap_ms = mean_gap_ms
+        self.volatility = volatility
+        self.drift = drift
+        self.jump_intensity = jump_intensity
+        self.jump_std = jump_std
+        self.burst_multiplier = burst_multiplier
+        self.mean_regime_ticks = mean_regime_ticks
+
+        setup = np.random.default_rng([seed, 2**32 - 1])
+        popularity = 1.0 / np.arange(1, n_symbols + 1)
+        self.weights = popularity / popularity.sum()
+        self.base_volume = setup.lognormal(0.0, 1.0, n_symbols)
+
+        # Carried state between chunks
+        self.log_prices = np.log(setup.lognormal(np.log(100.0), 2.5, n_symbols).clip(0.01, 100_000))
+        self.last_ts = np.full(n_symbols, start_ms, dtype=np.int64)
+        self.clock_ms = float(start_ms)
+
+    @staticmethod
+    def _symbol_names(n: int) -> List[str]:
+        names = BASE_SYMBOLS[:n]
+        names += [f"SYM{i:05d}" for i in range(len(names), n)]
+        return names
+
+    def _regimes(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Per-tick intensity multiplier: 1.0 in calm runs, burst_multiplier in bursts."""
+        runs = rng.geometric(1.0 / self.mean_regime_ticks, n // self.mean_regime_ticks * 2 + 2)
+        while runs.sum() < n:
+            runs = np.concatenate([runs, rng.geometric(1.0 / self.mean_regime_ticks, runs.size)])
+        states = np.resize([1.0, self.burst_multiplier], runs.size)
+        if rng.random() < 0.5:
+            states = states[::-1].copy()
+        return np.repeat(states, runs)[:n]
+
+    def generate_chunk(self, index: int, n: int) -> TickChunk:
+        rng = np.random.default_rng([self.seed, index])
+        intensity = self._regimes(rng, n)
+
+        # 1. Bursty timestamps
+        gaps = rng.exponential(self.mean_gap_ms / intensity)
+        timestamps = (self.clock_ms + np.cumsum(gaps)).astype(np.int64)
+        self.clock_ms += float(gaps.sum())
+
+        # 2. Symbol assignment
+        ids = rng.choice(self.symbols.size, size=n, p=self.weights)
+
+        # 3. GBM + jumps, using each symbol's own elapsed time as dt
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        sorted_ts = timestamps[order]
+        previous = np.empty_like(sorted_ts)
+        previous[1:] = sorted_ts[:-1]
+        group_starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        previous[group_starts] = self.last_ts[sorted_ids[group_starts]]
+        dt = np.zeros(n)
+        dt[order] = np.maximum(sorted_ts - previous, 1) / MS_PER_YEAR
+
+        sigma = self.volatility * np.sqrt(intensity)
+        returns = (self.drift - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * rng.standard_normal(n)
+        jumps = rng.random(n) < self.jump_intensity * dt
+        returns[jumps] += rng.normal(0.0, self.jump_std, int(jumps.sum()))
+
+        log_prices = grouped_cumsum(returns, ids) + self.log_prices[ids]
+        prices = np.round(np.exp(log_prices), 4)
+
+        # 4. Clustered volumes (heavier in bursts)
+        volumes = np.round(self.base_volume[ids] * rng.lognormal(0.0, 0.75, n) * np.sqrt(intensity), 8)
+
+        # Carry per-symbol state into the next chunk
+        last_index = np.full(self.symbols.size, -1)
+        last_index[ids] = np.arange(n)
+        seen = last_index >= 0
+        self.log_prices[seen] = log_prices[last_index[seen]]
+        self.last_ts[seen] = timestamps[last_index[seen]]
+
+        return self.symbols[ids], prices, volumes, timestamps
+
+    def chunks(self, total: int, chunk_size: int = 1_000_000) -> Generator[TickChunk, None, None]:
+        for index, start in enumerate(range(0, total, chunk_size)):
+            yield self.generate_chunk(index, min(chunk_size, total - start))
+
+
+def _digit_columns(values: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ASCII digits of non-negative ints right-aligned in `width` columns, and a mask hiding leading zeros."""
+    if width > 9:
+        # Integer division is the hot spot: split wide values into two int32 halves
+        high, low = np.divmod(values, 10 ** 9)
+        high_digits, high_shown = _digit_columns(high, width - 9)
+        low_digits, low_shown = _digit_columns(low, 9)
+        high_shown[:, -1] = high > 0
+        low_shown |= (high > 0)[:, None]
+        return np.hstack([high_digits, low_digits]), np.hstack([high_shown, low_shown])
+
+    values = values.astype(np.int32)
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int32)
+    digits = (values[:, None] // powers) % 10 + ord("0")
+    shown = values[:, None] >= powers
+    shown[:, -1] = True
+    return digits.astype(np.uint8), shown
+
+
+def _fixed_point_columns(values: np.ndarray, decimals: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Same text as f"{value:.{decimals}f}" for non-negative values."""
+    scale = 10 ** decimals
+    whole, fraction = np.divmod(np.rint(values * scale).astype(np.int64), scale)
+    fraction_digits, _ = _digit_columns(fraction, decimals)
+    return [
+        _digit_columns(whole, len(str(int(whole.max())))),
+        _literal(b".", len(values)),
+        (fraction_digits, np.ones_like(fraction_digits, dtype=bool)),
+    ]
+
+
+def _literal(char: bytes, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    return np.full((n, 1), ord(char), dtype=np.uint8), np.ones((n, 1), dtype=bool)
+
+
+def format_csv_rows(symbols: np.ndarray, prices: np.ndarray, volumes: np.ndarray,
+                    timestamps: np.ndarray) -> bytes:
+    """
+    CSV rows for one chunk, formatted without a Python-level loop: every field is
+    laid out as fixed-width byte columns, then a mask drops the padding and the
+    row-major flatten yields the rows back to back.
+    """
+    n = len(timestamps)
+    # Symbols are ASCII: narrow numpy's UCS-4 code points straight to bytes
+    symbols = np.ascontiguousarray(symbols, dtype=str)
+    symbol_columns = symbols.view(np.uint32).reshape(n, symbols.itemsize // 4).astype(np.uint8)
+
+    pieces = [(symbol_columns, symbol_columns != 0), _literal(b",", n)]
+    pieces += _fixed_point_columns(prices, 4) + [_literal(b",", n)]
+    pieces += _fixed_point_columns(volumes, 8) + [_literal(b",", n)]
+    pieces += [_digit_columns(timestamps, len(str(int(timestamps.max())))), _literal(b"\n", n)]
+
+    text = np.hstack([columns for columns, _ in pieces])
+    shown = np.hstack([mask for _, mask in pieces])
+    return text[shown].tobytes()
+
+
+def write_csv(path: str, chunks, rows_per_write: int = 100_000) -> int:
+    written = 0
+    with open(path, "wb") as f:
+        f.write(b"symbol,price,volume,timestamp\n")
+        for symbols, prices, volumes, timestamps in chunks:
+            # Slices bound the width x rows scratch arrays
+            for start in range(0, len(timestamps), rows_per_write):
+                end = start + rows_per_write
+                f.write(format_csv_rows(symbols[start:end], prices[start:end],
+                                        volumes[start:end], timestamps[start:end]))
+            written += len(timestamps)
+    return written
+
+
+def write_archive(path: str, chunks, workers: int = 1) -> int:
+    # zlib and most numpy kernels release the GIL, so block encoding scales with threads
+    with ThreadPoolExecutor(max_workers=workers) as pool, TickArchiveWriter(path) as writer:
+        for symbols, prices, volumes, timestamps in chunks:
+            writer.write_arrays(symbols, prices, volumes, timestamps, executor=pool)
+    return writer.ticks_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate reproducible synthetic market ticks")
+    parser.add_argument("output", help="Destination file (.csv or .cfta)")
+    parser.add_argument("--ticks", type=int, default=1_000_000)
+    parser.add_argument("--symbols", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--mean-gap-ms", type=float, default=5.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Threads used to encode .cfta blocks")
+    parser.add_argument("--format", choices=["csv", "cfta"], default=None,
+                        help="Defaults to the output file extension")
+    args = parser.parse_args()
+
+    fmt = args.format or ("cfta" if args.output.endswith(".cfta") else "csv")
+    generator = SyntheticTickGenerator(n_symbols=args.symbols, seed=args.seed, mean_gap_ms=args.mean_gap_ms)
+
+    print(f"--- Generating {args.ticks:,} ticks for {args.symbols} symbols (seed={args.seed}) ---")
+    start = time.perf_counter()
+    chunks = generator.chunks(args.ticks, args.chunk_size)
+    if fmt == "cfta":
+        written = write_archive(args.output, chunks, workers=args.workers)
+    else:
+        written = write_csv(args.output, chunks)
+    duration = time.perf_counter() - start
+
+    size_mb = Path(args.output).stat().st_size / 1e6
+    print(f"Wrote {written:,} ticks to {args.output} ({size_mb:.1f} MB) in {duration:.2f}s "
+          f"({written / duration / 1e6:.2f}M ticks/s)")
+
+
+if __name__ == "__main__":
+    main()
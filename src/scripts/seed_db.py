@@ -1,7 +1,6 @@
 # src/scripts/seed_db.py
 import asyncio
 import random
-import uuid
 import sys
 from pathlib import Path
 
@@ -11,6 +10,7 @@ sys.path.append(str(Path(__file__).resolve().parents[2]))
 # FIXED IMPORTS: Use the getters from your lazy-loading database.py
 from src.infrastructure.database import get_engine, get_session_factory
 from src.infrastructure.models import OrderModel, Base
+from src.domain.ids import new_order_id
 
 SYMBOLS = ["BTC", "ETH", "SOL", "ADA", "XRP", "DOT", "DOGE", "AVAX"]
 SIDES = ["BUY", "SELL"]
@@ -33,7 +33,7 @@ async def seed_data(n=100000):
         batch = []
         for i in range(n):
             order = OrderModel(
-                order_id=str(uuid.uuid4()),
+                order_id=new_order_id(),
                 symbol=random.choice(SYMBOLS),
                 quantity=round(random.uniform(0.1, 10.0), 4),
                 price=round(random.uniform(10.0, 60000.0), 2),
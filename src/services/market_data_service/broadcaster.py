@@ -0,0 +1,391 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+from src.services.market_data_service.price_table import LastPriceTable
+
+logger = logging.getLogger("MarketDataBroadcaster")
+
+# Queued after the last message when a feed ends
+_CLOSED = object()
+
+# Conflation policies for slow subscribers
+# QUEUE: bounded FIFO, the oldest message is dropped when full (every tick until the client lags)
+# LATEST: at most one pending message per symbol, a newer tick replaces the unsent one
+CONFLATE_QUEUE = "QUEUE"
+CONFLATE_LATEST = "LATEST"
+
+TickSource = Callable[[str], AsyncIterator[Any]]
+
+
+class Subscription:
+    """
+    One subscriber's view of one or more feeds: a buffer the producers never wait on.
+    Under CONFLATE_QUEUE the oldest message is dropped when the queue is full; under
+    CONFLATE_LATEST only the newest unsent tick per symbol is kept. Either way a stalled
+    client cannot block a feed or grow memory without bound.
+    """
+
+    def __init__(self, symbols: List[str], max_queue_size: int = 1_000,
+                 conflation: str = CONFLATE_QUEUE):
+        if conflation not in (CONFLATE_QUEUE, CONFLATE_LATEST):
+            raise ValueError(f"Unknown conflation policy: {conflation}")
+        self.symbols = symbols
+        self.conflation = conflation
+        # LATEST queues hold symbol keys, at most one per symbol: no bound needed
+        maxsize = max_queue_size if conflation == CONFLATE_QUEUE else 0
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.feeds: List['SymbolFeed'] = []
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.error: Optional[BaseException] = None
+        self._pending: Dict[str, Any] = {}
+        self._open_feeds = 0
+        self._finished = False
+
+    @property
+    def symbol(self) -> str:
+        return self.symbols[0]
+
+    def offer(self, message: Any) -> None:
+        if self.conflation == CONFLATE_LATEST and message is not _CLOSED:
+            key = message.symbol
+            if key in self._pending:
+                self.conflated += 1
+            else:
+                self.queue.put_nowait(key)
+            self._pending[key] = message
+            return
+
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        """Called by each feed as it ends; the stream ends with the last feed or the first error."""
+        self._open_feeds -= 1
+        if error is not None:
+            self.error = error
+        if self._open_feeds <= 0 or error is not None:
+            self.offer(_CLOSED)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "symbols": len(self.symbols),
+            "conflation": self.conflation,
+            "queued": self.queue.qsize(),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+        }
+
+    def __aiter__(self) -> 'Subscription':
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self._finished:
+            message = self._take(await self.queue.get())
+            if message is not _CLOSED:
+                self.delivered += 1
+                return message
+            self._finished = True
+
+        if self.error is not None:
+            raise self.error
+        raise StopAsyncIteration
+
+    async def next_batch(self, window: float = 0.0, max_size: int = 5_000) -> List[Any]:
+        """
+        Waits for one message, lets the coalescing window fill the queue, then drains it.
+        Raises StopAsyncIteration once every feed has ended.
+        """
+        batch = [await self.__anext__()]
+        # A backlog of a full batch or more is sent right away rather than once per window
+        if window > 0 and self.queue.qsize() < max_size:
+            await asyncio.sleep(window)
+
+        while len(batch) < max_size and not self.queue.empty():
+            message = self._take(self.queue.get_nowait())
+            if message is _CLOSED:
+                # Deliver what we have; the next call reports the end of stream
+                self._finished = True
+                break
+            batch.append(message)
+        self.delivered += len(batch) - 1
+        return batch
+
+    def _take(self, item: Any) -> Any:
+        if self.conflation == CONFLATE_LATEST and item is not _CLOSED:
+            return self._pending.pop(item)
+        return item
+
+
+class SymbolHistory:
+    """
+    Per-symbol sequence counter plus a bounded ring buffer of recent ticks.
+    Outlives individual feed tasks, so sequences keep increasing across restarts.
+    """
+    __slots__ = ['sequence', 'recent']
+
+    def __init__(self, size: int):
+        self.sequence = 0
+        self.recent: deque = deque(maxlen=size)
+
+    def record(self, message: Any) -> None:
+        self.sequence += 1
+        message.sequence = self.sequence
+        self.recent.append(message)
+
+    def since(self, sequence: int) -> Optional[List[Any]]:
+        """
+        Ticks after `sequence`, or None if some of them already left the buffer,
+        or if `sequence` is ahead of ours (counters were reset by a restart).
+        """
+        if sequence > self.sequence:
+            return None
+        if sequence == self.sequence:
+            return []
+        if not self.recent or self.recent[0].sequence > sequence + 1:
+            return None
+        skip = len(self.recent) - (self.sequence - sequence)
+        return list(self.recent)[skip:]
+
+    def snapshot(self) -> Optional[Any]:
+        """Copy of the latest tick flagged as a snapshot (shared messages are never mutated)."""
+        if not self.recent:
+            return None
+        latest = self.recent[-1]
+        snapshot = type(latest)()
+        snapshot.CopyFrom(latest)
+        snapshot.snapshot = True
+        return snapshot
+
+
+class SymbolFeed:
+    """Single producer task for one symbol, fanning each message out to every subscriber."""
+
+    def __init__(self, symbol: str, source: AsyncIterator[Any], history: SymbolHistory,
+                 last_prices: LastPriceTable, on_finish: Optional[Callable[['SymbolFeed'], None]] = None):
+        self.symbol = symbol
+        self.source = source
+        self.history = history
+        self.last_prices = last_prices
+        self.on_finish = on_finish
+        self.pinned = False
+        self.pin_expires_at = 0.0
+        self.pin_timer: Optional[asyncio.TimerHandle] = None
+        self.subscribers: Set[Subscription] = set()
+        self.messages_published = 0
+        self.task: Optional[asyncio.Task] = None
+        self._finished = False
+
+    def start(self) -> asyncio.Task:
+        self.task = asyncio.create_task(self._run(), name=f"feed-{self.symbol}")
+        # A task cancelled before its first step never enters _run's finally block
+        self.task.add_done_callback(lambda _task: self._finish())
+        return self.task
+
+    async def _run(self) -> None:
+        error = None
+        try:
+            async for message in self.source:
+                self.messages_published += 1
+                self.history.record(message)
+                self.last_prices.update(self.symbol, message)
+                # Same message object for everyone: generated once, serialized per stream
+                for subscriber in self.subscribers:
+                    subscriber.offer(message)
+        except Exception as e:
+            logger.error(f"Feed {self.symbol} failed: {e}")
+            error = e
+        finally:
+            # Detach before the first await: a subscriber arriving from here on
+            # must start a new feed instead of joining this one as it ends
+            self._detach()
+            try:
+                aclose = getattr(self.source, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            finally:
+                # Also on cancellation, so nobody keeps waiting on a dead feed
+                self._finish(error)
+
+    def _detach(self) -> None:
+        if self.on_finish is not None:
+            self.on_finish(self)
+            self.on_finish = None
+
+    def _finish(self, error: Optional[BaseException] = None) -> None:
+        self._detach()
+        if self._finished:
+            return
+        self._finished = True
+        for subscriber in self.subscribers:
+            subscriber.close(error)
+
+
+class MarketDataBroadcaster:
+    """
+    Owns one SymbolFeed per actively watched symbol and the last-price table they update.
+    A feed starts with the first subscriber and stops with the last one,
+    unless it was pinned for price lookups (pins lapse after pin_ttl seconds without one).
+    A stopped symbol's history is kept for another pin_ttl seconds, so a client that
+    reconnects can still resume, and is then dropped.
+    """
+
+    def __init__(self, source_factory: TickSource, max_queue_size: int = 1_000,
+                 history_size: int = 1_000, pin_ttl: float = 60.0):
+        self.source_factory = source_factory
+        self.max_queue_size = max_queue_size
+        self.history_size = history_size
+        self.pin_ttl = pin_ttl
+        self.feeds: Dict[str, SymbolFeed] = {}
+        self.histories: Dict[str, SymbolHistory] = {}
+        self.last_prices = LastPriceTable()
+        self._history_timers: Dict[str, asyncio.TimerHandle] = {}
+
+    def subscribe(self, symbol: str, resume_from: Optional[int] = None,
+                  snapshot: bool = False, conflation: str = CONFLATE_QUEUE) -> Subscription:
+        """
+        resume_from: replay buffered ticks with a higher sequence, then go live.
+            If the gap is older than the ring buffer, falls back to a snapshot.
+        snapshot: start with the latest tick (flagged snapshot=True), then deltas.
+        conflation: CONFLATE_QUEUE or CONFLATE_LATEST (see Subscription).
+        """
+        subscription = self.subscribe_many([symbol], conflation)
+        history = self.histories[symbol]
+
+        # No await between subscribing and prefilling: the producer cannot interleave,
+        # so the backlog and the live stream join without gaps or duplicates.
+        backlog = history.since(resume_from) if resume_from is not None else None
+        if backlog is None and (snapshot or resume_from is not None):
+            latest = history.snapshot()
+            backlog = [latest] if latest is not None else []
+        for message in backlog or []:
+            subscription.offer(message)
+        return subscription
+
+    def subscribe_many(self, symbols: List[str], conflation: str = CONFLATE_QUEUE) -> Subscription:
+        """
+        One queue fed by several symbols' feeds (multi-symbol streams).
+        The queue holds max_queue_size messages per symbol, the same headroom as a single-symbol stream.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        subscription = Subscription(symbols, self.max_queue_size * len(symbols), conflation)
+        for symbol in subscription.symbols:
+            feed = self._ensure_feed(symbol)
+            feed.subscribers.add(subscription)
+            subscription.feeds.append(feed)
+            subscription._open_feeds += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for feed in subscription.feeds:
+            feed.subscribers.discard(subscription)
+            if not feed.subscribers and not feed.pinned:
+                self._stop(feed, "no subscribers")
+                self._expire_history(feed.symbol)
+        subscription.feeds = []
+
+    def pin(self, symbol: str) -> None:
+        """
+        Keeps a feed running without subscribers so the last-price table stays fresh.
+        The pin lapses after pin_ttl seconds without a touch(), so lookups of
+        junk symbols cannot accumulate producer tasks.
+        """
+        feed = self._ensure_feed(symbol)
+        feed.pinned = True
+        feed.pin_expires_at = time.monotonic() + self.pin_ttl
+        if feed.pin_timer is None:
+            feed.pin_timer = asyncio.get_running_loop().call_later(self.pin_ttl, self._check_pin, feed)
+
+    def touch(self, symbol: str) -> None:
+        """Records a price lookup, extending the symbol's pin."""
+        feed = self.feeds.get(symbol)
+        if feed is not None and feed.pinned:
+            feed.pin_expires_at = time.monotonic() + self.pin_ttl
+
+    def subscriber_count(self, symbol: str) -> int:
+        feed = self.feeds.get(symbol)
+        return len(feed.subscribers) if feed else 0
+
+    def subscription_stats(self) -> List[Dict[str, Any]]:
+        """Counters of every live subscription, one laggard at a glance."""
+        subscriptions = {sub for feed in self.feeds.values() for sub in feed.subscribers}
+        return [sub.stats() for sub in subscriptions]
+
+    async def close(self) -> None:
+        tasks = [feed.task for feed in self.feeds.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.feeds.clear()
+        for timer in self._history_timers.values():
+            timer.cancel()
+        self._history_timers.clear()
+
+    def _ensure_feed(self, symbol: str) -> SymbolFeed:
+        feed = self.feeds.get(symbol)
+        if feed is None:
+            timer = self._history_timers.pop(symbol, None)
+            if timer is not None:
+                timer.cancel()
+            history = self.histories.get(symbol)
+            if history is None:
+                history = self.histories[symbol] = SymbolHistory(self.history_size)
+            feed = SymbolFeed(symbol, self.source_factory(symbol), history, self.last_prices,
+                              on_finish=self._forget)
+            self.feeds[symbol] = feed
+            feed.start()
+            logger.info(f"Started feed for {symbol}")
+        return feed
+
+    def _check_pin(self, feed: SymbolFeed) -> None:
+        feed.pin_timer = None
+        if self.feeds.get(feed.symbol) is not feed or not feed.pinned:
+            return
+
+        remaining = feed.pin_expires_at - time.monotonic()
+        if remaining > 0:
+            feed.pin_timer = asyncio.get_running_loop().call_later(remaining, self._check_pin, feed)
+            return
+
+        feed.pinned = False
+        if not feed.subscribers:
+            self._stop(feed, f"no price lookups for {self.pin_ttl}s")
+            # Lookup-only symbols keep no history either (resuming clients get a snapshot)
+            self.histories.pop(feed.symbol, None)
+
+    def _expire_history(self, symbol: str) -> None:
+        """Drops the history of a symbol nobody watches once pin_ttl passes without a new feed."""
+        timer = self._history_timers.pop(symbol, None)
+        if timer is not None:
+            timer.cancel()
+        self._history_timers[symbol] = asyncio.get_running_loop().call_later(
+            self.pin_ttl, self._drop_history, symbol
+        )
+
+    def _drop_history(self, symbol: str) -> None:
+        self._history_timers.pop(symbol, None)
+        if symbol not in self.feeds:
+            self.histories.pop(symbol, None)
+
+    def _stop(self, feed: SymbolFeed, reason: str) -> None:
+        if not feed.task.done():
+            feed.task.cancel()
+        self._forget(feed)
+        # Nothing refreshes the entry any more: a later lookup restarts the feed instead
+        self.last_prices.discard(feed.symbol)
+        logger.info(f"Stopped feed for {feed.symbol} ({reason})")
+
+    def _forget(self, feed: SymbolFeed) -> None:
+        # A finished replay must not be reused by the next subscriber
+        if self.feeds.get(feed.symbol) is feed:
+            del self.feeds[feed.symbol]
+        if feed.pin_timer is not None:
+            feed.pin_timer.cancel()
+            feed.pin_timer = None
@@ -0,0 +1,64 @@
+import math
+import random
+from typing import List, Optional, Tuple
+
+from src.domain.order_book import ASK, BID, OrderBook
+
+# (price, new total quantity); quantity 0 removes the level
+LevelChanges = List[Tuple[float, float]]
+
+
+class SyntheticDepth:
+    """
+    Synthetic L2 book that follows a price stream (live or replayed ticks).
+
+    Each move re-centres the book on the new price, re-quotes a fraction of the
+    resting levels and reports only the levels that changed, which is exactly
+    what an incremental depth stream publishes.
+    """
+
+    def __init__(self, symbol: str, levels: int = 20, churn: float = 0.2,
+                 rng: Optional[random.Random] = None):
+        self.book = OrderBook(symbol)
+        self.levels = levels
+        self.churn = churn
+        self.rng = rng or random.Random()
+        self.tick_size: Optional[float] = None
+        self._decimals = 0
+
+    def _grid(self, price: float) -> None:
+        # About five significant digits of price resolution, whatever the price scale
+        exponent = math.floor(math.log10(price)) - 4
+        self.tick_size = 10.0 ** exponent
+        self._decimals = max(0, -exponent)
+
+    def move_to(self, price: float, timestamp: int = 0) -> Tuple[LevelChanges, LevelChanges]:
+        if price <= 0:
+            return [], []
+        if self.tick_size is None:
+            self._grid(price)
+
+        step = self.tick_size
+        best_bid = math.floor(price / step) * step
+        bid_prices = [round(best_bid - k * step, self._decimals) for k in range(self.levels)]
+        ask_prices = [round(best_bid + (k + 1) * step, self._decimals) for k in range(self.levels)]
+
+        bid_changes = self._requote(BID, bid_prices)
+        ask_changes = self._requote(ASK, ask_prices)
+        self.book.timestamp = timestamp
+        return bid_changes, ask_changes
+
+    def _requote(self, side: str, prices: List[float]) -> LevelChanges:
+        book_side = self.book.side(side)
+        wanted = set(prices)
+        changes = [(price, 0.0) for price in book_side.quantities if price not in wanted]
+
+        rng = self.rng
+        for rank, price in enumerate(prices):
+            if price not in book_side.quantities or rng.random() < self.churn:
+                # Liquidity thickens away from the touch
+                changes.append((price, round(rng.uniform(0.1, 5.0) * (1 + rank / 4), 4)))
+
+        for price, quantity in changes:
+            book_side.set(price, quantity)
+        return changes
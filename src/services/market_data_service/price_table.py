@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class LastPriceTable:
+    """
+    Latest tick per symbol, written by the feeds and read by unary price lookups.
+
+    Lock-free by construction: every access happens on the event loop thread,
+    writers replace whole (immutable) messages with a single dict assignment,
+    and readers never wait on writers.
+    """
+
+    def __init__(self):
+        self._last: Dict[str, Any] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+
+    def __len__(self):
+        return len(self._last)
+
+    def update(self, symbol: str, message: Any) -> None:
+        self._last[symbol] = message
+        waiters = self._waiters.pop(symbol, None)
+        if waiters:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(message)
+
+    def discard(self, symbol: str) -> None:
+        self._last.pop(symbol, None)
+
+    def get(self, symbol: str) -> Optional[Any]:
+        return self._last.get(symbol)
+
+    def get_many(self, symbols: Iterable[str]) -> Dict[str, Any]:
+        last = self._last
+        return {symbol: last[symbol] for symbol in symbols if symbol in last}
+
+    async def wait_for(self, symbol: str, timeout: float) -> Optional[Any]:
+        """Returns the current value, or waits up to timeout for the first one."""
+        message = self._last.get(symbol)
+        if message is not None:
+            return message
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(symbol, []).append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            pending = self._waiters.get(symbol)
+            if pending and waiter in pending:
+                pending.remove(waiter)
+                if not pending:
+                    del self._waiters[symbol]
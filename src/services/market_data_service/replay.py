@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import math
+import time
+from typing import AsyncGenerator, Callable, Dict, List, Optional
+
+from src.domain.market_data import MarketDataReader, Tick
+from src.infrastructure.market_data_stream import AsyncMarketDataReader
+from src.infrastructure.tick_archive import TickArchiveReader
+
+logger = logging.getLogger("TickReplay")
+
+# Queued to every route when the replay reaches the end of the file
+_END_OF_REPLAY = object()
+
+
+def open_tick_source(file_path: str) -> MarketDataReader:
+    """Picks the reader by extension: .cfta archives or plain CSV."""
+    if str(file_path).endswith(".cfta"):
+        return TickArchiveReader(str(file_path))
+    return MarketDataReader(str(file_path))
+
+
+def normalize_symbol(symbol: str) -> str:
+    """'btc/usd', 'BTC-USD' and 'BTCUSD' all refer to the same recorded instrument."""
+    return symbol.upper().replace("/", "").replace("-", "")
+
+
+class ReplayClock:
+    """
+    Maps recorded tick timestamps onto the wall clock.
+
+    speed=1.0 is real time, speed=10.0 is ten times faster, and speed<=0 (or inf)
+    replays as fast as possible. Delays are computed against a fixed schedule
+    anchored at the first tick, so sleep overshoot never accumulates into drift.
+    """
+
+    def __init__(self, speed: float = 1.0, monotonic: Callable[[], float] = time.monotonic):
+        self.speed = speed
+        self.monotonic = monotonic
+        self._first_timestamp: Optional[int] = None
+        self._wall_start = 0.0
+
+    @property
+    def unthrottled(self) -> bool:
+        return self.speed <= 0 or math.isinf(self.speed)
+
+    def delay_for(self, timestamp_ms: int) -> float:
+        """Seconds to wait before emitting the tick recorded at timestamp_ms."""
+        if self.unthrottled:
+            return 0.0
+
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp_ms
+            self._wall_start = self.monotonic()
+            return 0.0
+
+        due = self._wall_start + (timestamp_ms - self._first_timestamp) / 1000.0 / self.speed
+        return max(0.0, due - self.monotonic())
+
+
+class ReplaySession:
+    """
+    One pass over a replay file, shared by every symbol feed.
+
+    A single reader (one worker thread) parses the file and routes each tick to
+    the symbols currently watched, paced by one ReplayClock. Symbols that join
+    later pick the replay up where it is, like tuning into a live market.
+    The session ends with the file, or when its last route goes away.
+    """
+
+    def __init__(self, file_path: str, speed: float = 1.0, route_queue_size: int = 1_000):
+        self.file_path = file_path
+        self.speed = speed
+        self.route_queue_size = route_queue_size
+        # Several consumers may follow one symbol
+        self.routes: Dict[str, List[asyncio.Queue]] = {}
+        self.ticks_routed = 0
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Task] = None
+        self._ended = False
+
+    @property
+    def finished(self) -> bool:
+        """True once no new route can be served: late joiners need a new session."""
+        return self._ended or (self.task is not None and self.task.done())
+
+    async def ticks_for(self, symbol: str) -> AsyncGenerator[Tick, None]:
+        """This symbol's ticks until the end of the replay."""
+        key = normalize_symbol(symbol)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.route_queue_size)
+        self.routes.setdefault(key, []).append(queue)
+        if self.task is None:
+            self.task = asyncio.create_task(self._run(), name=f"replay-{self.file_path}")
+
+        try:
+            while True:
+                tick = await queue.get()
+                if tick is _END_OF_REPLAY:
+                    break
+                yield tick
+            if self.error is not None:
+                raise self.error
+        finally:
+            queues = self.routes.get(key)
+            if queues and queue in queues:
+                queues.remove(queue)
+                if not queues:
+                    del self.routes[key]
+            if not self.routes and not self.task.done():
+                self.task.cancel()
+
+    async def _run(self) -> None:
+        # File parsing runs on one worker thread, whatever the number of symbols
+        reader = AsyncMarketDataReader(open_tick_source(self.file_path))
+        clock = ReplayClock(self.speed)
+        try:
+            async for row in reader.start_stream():
+                tick = Tick.from_row(row)
+                queues = self.routes.get(normalize_symbol(tick.symbol))
+                if not queues:
+                    continue
+
+                delay = clock.delay_for(tick.timestamp)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # Feeds never block on their subscribers, so this only waits briefly
+                for queue in list(queues):
+                    await queue.put(tick)
+                self.ticks_routed += 1
+        except Exception as e:
+            logger.error(f"Replay of {self.file_path} failed: {e}")
+            self.error = e
+        self._ended = True
+        logger.info(f"Replay of {self.file_path} finished after {self.ticks_routed} ticks")
+        for queues in list(self.routes.values()):
+            for queue in list(queues):
+                await queue.put(_END_OF_REPLAY)
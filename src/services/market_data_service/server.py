@@ -1,4 +1,5 @@
-from concurrent import futures
+import asyncio
+import os
 import time
 import grpc
 import logging
@@ -6,43 +7,254 @@ import random
 
 from src.generated import market_data_pb2
 from src.generated import market_data_pb2_grpc
+from src.services.market_data_service.broadcaster import MarketDataBroadcaster
+from src.services.market_data_service.order_book_feed import SyntheticDepth
+from src.services.market_data_service.replay import ReplaySession
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("MarketDataService")
 
+# Configuration
+# Replay mode: serve recorded ticks (CSV or .cfta archive) instead of random prices.
+# Speed: 1.0 = real time, 10 = 10x faster, 0 = as fast as possible.
+REPLAY_FILE = os.getenv("MARKET_DATA_REPLAY_FILE")
+REPLAY_SPEED = float(os.getenv("MARKET_DATA_REPLAY_SPEED", "1.0"))
+# Live mode: seconds between generated ticks, per symbol
+TICK_INTERVAL = float(os.getenv("MARKET_DATA_TICK_INTERVAL", "1.0"))
+# Per-subscriber buffer (messages); the oldest are dropped when a client lags
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("MARKET_DATA_SUBSCRIBER_QUEUE_SIZE", "1000"))
+# Upper bound on ticks per MarketDataBatch message
+MAX_BATCH_SIZE = 5000
+# Longest coalescing window a client may ask for; longer ones are capped
+MAX_COALESCE_MS = 1000
+# Recent ticks kept per symbol for resume-from-sequence
+HISTORY_SIZE = int(os.getenv("MARKET_DATA_HISTORY_SIZE", "1000"))
+# GetPrice on a symbol nobody watches yet: how long to wait for its first tick
+PRICE_WAIT_TIMEOUT = float(os.getenv("MARKET_DATA_PRICE_WAIT_TIMEOUT", "2.0"))
+# Feeds started by GetPrice stop after this many seconds without a lookup
+PRICE_PIN_TTL = float(os.getenv("MARKET_DATA_PRICE_PIN_TTL", "60.0"))
+# Price levels per side in the (synthetic) L2 order book
+BOOK_DEPTH = int(os.getenv("MARKET_DATA_BOOK_DEPTH", "20"))
+
 class MarketDataService(market_data_pb2_grpc.MarketDataServiceServicer):
-    def StreamMarketData(self, request, context):
+    """
+    grpc.aio servicer. Each symbol has ONE producer task (live or replay) whose
+    messages are fanned out to every subscriber's queue, so N subscribers on the
+    same symbol cost one price generation per tick instead of N.
+    """
+
+    def __init__(self, replay_file: str = None, replay_speed: float = 1.0,
+                 tick_interval: float = 1.0, subscriber_queue_size: int = 1000,
+                 history_size: int = 1000, price_pin_ttl: float = 60.0, book_depth: int = 20):
+        self.replay_file = replay_file
+        self.replay_speed = replay_speed
+        self.tick_interval = tick_interval
+        self.book_depth = book_depth
+        self.broadcaster = MarketDataBroadcaster(self._tick_source, subscriber_queue_size,
+                                                 history_size, price_pin_ttl)
+        # Depth updates get their own feeds and sequences; the book itself is the snapshot
+        self.book_broadcaster = MarketDataBroadcaster(self._book_updates, subscriber_queue_size, history_size=0)
+        self.order_books = {}
+        self._replay = None
+
+    async def close(self):
+        await self.broadcaster.close()
+        await self.book_broadcaster.close()
+
+    async def StreamMarketData(self, request, context):
         symbol = request.symbol.upper()
-        logger.info(f"Received subscription for {symbol}")
-        
+        resume_from = request.resume_from_sequence if request.HasField("resume_from_sequence") else None
+        conflation = market_data_pb2.ConflationPolicy.Name(request.conflation)
+        logger.info(f"Received subscription for {symbol} "
+                    f"(resume_from={resume_from}, snapshot={request.snapshot}, conflation={conflation})")
+        subscription = self.broadcaster.subscribe(symbol, resume_from=resume_from, snapshot=request.snapshot,
+                                                  conflation=conflation)
+
         try:
-            while True:
-                price = 100.0 + random.uniform(-1, 1)
-                volume = random.uniform(1, 10)
-                timestamp = int(time.time() * 1000)
-                
-                response = market_data_pb2.MarketDataResponse(
-                    symbol=symbol,
-                    price=price,
-                    volume=volume,
-                    timestamp=timestamp
-                )
-                
+            async for response in subscription:
                 yield response
-                time.sleep(1)
-                
+
         except Exception as e:
             logger.error(f"Error streaming data: {e}")
-            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+        finally:
+            self.broadcaster.unsubscribe(subscription)
+            logger.info(f"Subscription closed: {subscription.stats()}")
+
+    async def StreamMarketDataBatch(self, request, context):
+        symbols = [symbol.upper() for symbol in request.symbols]
+        if not symbols:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "At least one symbol is required")
+
+        coalesce_ms = min(request.coalesce_ms, MAX_COALESCE_MS)
+        window = coalesce_ms / 1000.0
+        logger.info(f"Received batch subscription for {len(symbols)} symbols (window={coalesce_ms}ms)")
+        conflation = market_data_pb2.ConflationPolicy.Name(request.conflation)
+        subscription = self.broadcaster.subscribe_many(symbols, conflation)
+
+        try:
+            while True:
+                try:
+                    ticks = await subscription.next_batch(window, MAX_BATCH_SIZE)
+                except StopAsyncIteration:
+                    break
+                yield market_data_pb2.MarketDataBatch(
+                    ticks=ticks,
+                    dropped=subscription.dropped,
+                    conflated=subscription.conflated
+                )
+
+        except Exception as e:
+            logger.error(f"Error streaming batch data: {e}")
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+        finally:
+            self.broadcaster.unsubscribe(subscription)
+            logger.info(f"Subscription closed: {subscription.stats()}")
+
+    async def GetPrice(self, request, context):
+        symbol = request.symbol.upper()
+        # Hot path: one dict lookup, no stream setup
+        response = self.broadcaster.last_prices.get(symbol)
+        if response is None:
+            response = await self._first_price(symbol)
+        else:
+            self.broadcaster.touch(symbol)
+        if response is None:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, f"No price available for {symbol}")
+        return response
+
+    async def GetPrices(self, request, context):
+        symbols = [symbol.upper() for symbol in request.symbols]
+        found = self.broadcaster.last_prices.get_many(symbols)
+        for symbol in found:
+            self.broadcaster.touch(symbol)
+
+        missing = [symbol for symbol in symbols if symbol not in found]
+        if missing:
+            prices = await asyncio.gather(*[self._first_price(symbol) for symbol in missing])
+            found.update({s: p for s, p in zip(missing, prices) if p is not None})
+
+        # Symbols without any price yet are omitted
+        return market_data_pb2.MarketDataBatch(ticks=[found[s] for s in symbols if s in found])
+
+    async def StreamOrderBook(self, request, context):
+        symbol = request.symbol.upper()
+        logger.info(f"Received order book subscription for {symbol}")
+        subscription = self.book_broadcaster.subscribe(symbol)
+        # Built in the same loop step as the subscription: the first queued update follows it exactly
+        snapshot = self._book_snapshot(symbol)
+
+        try:
+            yield snapshot
+            async for update in subscription:
+                yield update
+
+        except Exception as e:
+            logger.error(f"Error streaming order book: {e}")
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+        finally:
+            self.book_broadcaster.unsubscribe(subscription)
+
+    def _book_snapshot(self, symbol):
+        history = self.book_broadcaster.histories.get(symbol)
+        update = market_data_pb2.OrderBookUpdate(
+            symbol=symbol,
+            sequence=history.sequence if history else 0,
+            snapshot=True
+        )
+        book = self.order_books.get(symbol)
+        if book is not None:
+            bids, asks = book.depth()
+            update.timestamp = book.timestamp
+            update.bids.extend(market_data_pb2.PriceLevel(price=p, quantity=q) for p, q in bids)
+            update.asks.extend(market_data_pb2.PriceLevel(price=p, quantity=q) for p, q in asks)
+        return update
+
+    async def _first_price(self, symbol):
+        """Starts (and pins) the symbol's feed, then waits for its first tick."""
+        self.broadcaster.pin(symbol)
+        return await self.broadcaster.last_prices.wait_for(symbol, PRICE_WAIT_TIMEOUT)
+
+    def _tick_source(self, symbol):
+        if self.replay_file:
+            return self._replay_ticks(symbol)
+        return self._live_ticks(symbol)
+
+    async def _live_ticks(self, symbol):
+        while True:
+            price = 100.0 + random.uniform(-1, 1)
+            volume = random.uniform(1, 10)
+            timestamp = int(time.time() * 1000)
+            
+            response = market_data_pb2.MarketDataResponse(
+                symbol=symbol,
+                price=price,
+                volume=volume,
+                timestamp=timestamp
+            )
+            
+            yield response
+            await asyncio.sleep(self.tick_interval)
+
+    async def _book_updates(self, symbol):
+        """Incremental depth around the symbol's price stream: only changed levels are sent."""
+        depth = SyntheticDepth(symbol, self.book_depth)
+        self.order_books[symbol] = depth.book
+        # Follows the shared tick feed, so the book's mid is the price StreamMarketData clients see
+        ticks = self.broadcaster.subscribe(symbol, snapshot=True)
+        try:
+            async for tick in ticks:
+                bids, asks = depth.move_to(tick.price, tick.timestamp)
+                if not bids and not asks:
+                    continue
+                yield market_data_pb2.OrderBookUpdate(
+                    symbol=symbol,
+                    timestamp=tick.timestamp,
+                    bids=[market_data_pb2.PriceLevel(price=p, quantity=q) for p, q in bids],
+                    asks=[market_data_pb2.PriceLevel(price=p, quantity=q) for p, q in asks]
+                )
+        finally:
+            self.broadcaster.unsubscribe(ticks)
+            if self.order_books.get(symbol) is depth.book:
+                del self.order_books[symbol]
+
+    async def _replay_ticks(self, symbol):
+        """Recorded ticks with their original timestamps and (scaled) inter-tick gaps."""
+        # Every symbol reads from the same pass over the file; a new pass starts
+        # once the previous one has ended (or lost all its symbols)
+        if self._replay is None or self._replay.finished:
+            self._replay = ReplaySession(self.replay_file, self.replay_speed)
+
+        async for tick in self._replay.ticks_for(symbol):
+            yield market_data_pb2.MarketDataResponse(
+                symbol=symbol,
+                price=tick.price,
+                volume=tick.volume,
+                timestamp=tick.timestamp
+            )
 
-def serve():
+async def serve():
     port = "50051"
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    market_data_pb2_grpc.add_MarketDataServiceServicer_to_server(MarketDataService(), server)
+    server = grpc.aio.server()
+    service = MarketDataService(
+        replay_file=REPLAY_FILE,
+        replay_speed=REPLAY_SPEED,
+        tick_interval=TICK_INTERVAL,
+        subscriber_queue_size=SUBSCRIBER_QUEUE_SIZE,
+        history_size=HISTORY_SIZE,
+        price_pin_ttl=PRICE_PIN_TTL,
+        book_depth=BOOK_DEPTH
+    )
+    market_data_pb2_grpc.add_MarketDataServiceServicer_to_server(service, server)
     server.add_insecure_port('[::]:' + port)
+    if REPLAY_FILE:
+        logger.info(f"Replay mode: {REPLAY_FILE} at {REPLAY_SPEED}x")
     logger.info(f"Market Data Service started on port {port}")
-    server.start()
-    server.wait_for_termination()
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await service.close()
 
 if __name__ == '__main__':
-    serve()
+    asyncio.run(serve())
@@ -0,0 +1,161 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# handler(actor, *args): runs inside the actor, one message at a time
+Handler = Callable[..., Awaitable[Any]]
+# on_unclaimed(result, *args): a result whose caller stopped waiting while it was produced
+Unclaimed = Callable[..., None]
+
+
+class SymbolActor:
+    """
+    One asyncio task and one mailbox per symbol.
+
+    Messages are handled one at a time, in arrival order. State that belongs
+    to the symbol (its sequence number, risk position, book) is only touched
+    from this task, so it needs no locks even across awaits. Different symbols
+    run concurrently. The caller awaits a future that resolves with the
+    handler's result or raises its exception. The actor keeps running after a
+    failed message. A result nobody is waiting for any more (the caller was
+    cancelled mid-message) goes to `on_unclaimed`, so the handler's side effects
+    can be undone.
+    """
+
+    def __init__(self, symbol: str, handler: Handler, mailbox_size: int = 10_000, latency_window: int = 10_000,
+                 on_unclaimed: Optional[Unclaimed] = None):
+        self.symbol = symbol
+        self.handler = handler
+        self.on_unclaimed = on_unclaimed
+        self.mailbox: asyncio.Queue = asyncio.Queue(maxsize=mailbox_size)
+        self.busy = False
+        self.last_active = time.monotonic()
+        self.sequence = 0
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        # Seconds from enqueue to result, most recent messages
+        self._latencies: deque = deque(maxlen=latency_window)
+        self.task = asyncio.create_task(self._run())
+
+    async def ask(self, *args) -> Any:
+        """Queues a message (waiting while the mailbox is full) and returns the handler's result."""
+        future = asyncio.get_running_loop().create_future()
+        await self.mailbox.put((args, future, time.perf_counter()))
+        self.max_depth = max(self.max_depth, self.mailbox.qsize())
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            args, future, enqueued = await self.mailbox.get()
+            if future.done():  # the caller gave up (e.g. its stream closed)
+                continue
+            self.sequence += 1
+            self.busy = True
+            try:
+                result = await self.handler(self, *args)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Actor for {self.symbol} stopped"))
+                raise
+            except Exception as e:
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.processed += 1
+                if not future.done():
+                    future.set_result(result)
+                elif self.on_unclaimed is not None:
+                    self.on_unclaimed(result, *args)
+            finally:
+                self.busy = False
+            self._latencies.append(time.perf_counter() - enqueued)
+            self.last_active = time.monotonic()
+
+    @property
+    def idle(self) -> bool:
+        """No message queued or being handled."""
+        return not self.busy and self.mailbox.empty()
+
+    def metrics(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+        return {
+            "mailbox_depth": self.mailbox.qsize(),
+            "max_mailbox_depth": self.max_depth,
+            "processed": self.processed,
+            "failed": self.failed,
+            "latency_ms": {"p50": percentile(50), "p99": percentile(99), "max": percentile(100)},
+        }
+
+    async def close(self) -> None:
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        while not self.mailbox.empty():
+            _, future, _ = self.mailbox.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError(f"Actor for {self.symbol} stopped"))
+
+
+class SymbolActors:
+    """
+    Creates a SymbolActor for each symbol on its first message. Actors idle for
+    `idle_timeout` seconds are stopped and removed, so symbols that stop
+    trading (or were only ever sent junk) do not keep a task and a mailbox.
+    A later message simply starts a new actor.
+    """
+
+    def __init__(self, handler: Handler, mailbox_size: int = 10_000, on_unclaimed: Optional[Unclaimed] = None,
+                 idle_timeout: float = 300.0):
+        self.handler = handler
+        self.mailbox_size = mailbox_size
+        self.on_unclaimed = on_unclaimed
+        self.idle_timeout = idle_timeout
+        self.actors: Dict[str, SymbolActor] = {}
+        self.reaped = 0
+        self._reaper: Optional[asyncio.Task] = None
+
+    def get(self, symbol: str) -> SymbolActor:
+        symbol = symbol.upper()
+        actor = self.actors.get(symbol)
+        if actor is None:
+            actor = self.actors[symbol] = SymbolActor(symbol, self.handler, self.mailbox_size,
+                                                      on_unclaimed=self.on_unclaimed)
+            if self._reaper is None:
+                self._reaper = asyncio.create_task(self._reap_idle())
+        return actor
+
+    async def ask(self, symbol: str, *args) -> Any:
+        # No await between get() and the enqueue: the reaper cannot stop the actor in between
+        return await self.get(symbol).ask(*args)
+
+    async def _reap_idle(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            cutoff = time.monotonic() - self.idle_timeout
+            idle = [actor for actor in self.actors.values() if actor.idle and actor.last_active < cutoff]
+            # Removed before the first await: new messages for these symbols start new actors
+            for actor in idle:
+                del self.actors[actor.symbol]
+            for actor in idle:
+                await actor.close()
+            self.reaped += len(idle)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {symbol: actor.metrics() for symbol, actor in self.actors.items()}
+
+    async def close(self) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        for actor in self.actors.values():
+            await actor.close()
+        self.actors.clear()
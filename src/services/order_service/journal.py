@@ -0,0 +1,313 @@
+import asyncio
+import json
+import logging
+import os
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+from src.application.ports.interfaces import AbstractUnitOfWork
+from src.domain.entities import Order
+from src.domain.events import order_created
+
+logger = logging.getLogger("OrderService.Journal")
+
+# Order IDs per existence query during recovery
+RECOVERY_LOOKUP_CHUNK = 1000
+
+
+def _to_record(sequence: int, order: Order) -> bytes:
+    return json.dumps({
+        "seq": sequence,
+        "order": {
+            "order_id": order.order_id,
+            "symbol": order.symbol,
+            "quantity": order.quantity,
+            "price": order.price,
+            "side": order.side,
+            "metadata": order.metadata,
+        },
+    }).encode() + b"\n"
+
+
+class OrderJournal:
+    """
+    Local write-ahead journal for accepted orders. Postgres is written behind it.
+
+    `append` writes the orders to an append-only file (one JSON line each) and
+    returns once they are fsynced. The order is durable at that point and can
+    be acknowledged, whatever the database is doing. Appends that arrive while
+    an fsync is running are written together by the next one (group fsync).
+
+    A background flusher moves journaled orders to Postgres in bulk, with
+    their outbox events, in one transaction per batch. After each commit it
+    appends a `flushed` marker. Once everything is flushed the file is
+    truncated when it grows past `compact_bytes`.
+
+    On `open`, entries after the last marker are replayed. The marker is not
+    fsynced, so orders that are already in the database are skipped. A torn
+    last line from a crash mid-write is cut off.
+
+    A failing batch is halved until the orders ahead of a bad one go through.
+    If a single order keeps failing while the database still answers reads, it
+    is moved to `<path>.rejected` (fsynced) so it cannot block the orders
+    behind it. If reads fail too, the database is down and the order is kept.
+    """
+
+    def __init__(self, path: str, uow_factory: Callable[[], AbstractUnitOfWork], flush_interval: float = 0.05,
+                 flush_batch: int = 1000, max_backlog: int = 100_000, compact_bytes: int = 64 * 1024 * 1024,
+                 retry_delay: float = 1.0, on_flushed: Optional[Callable[[], None]] = None,
+                 reject_after: int = 3):
+        self.path = path
+        self.uow_factory = uow_factory
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.max_backlog = max_backlog
+        self.compact_bytes = compact_bytes
+        self.retry_delay = retry_delay
+        self.on_flushed = on_flushed
+        self.reject_after = reject_after
+        self.rejected_path = path + ".rejected"
+        self.appended = 0
+        self.fsyncs = 0
+        self.flushed = 0
+        self.flush_failures = 0
+        self.rejected = 0
+        self.recovered = 0
+        self.task: Optional[asyncio.Task] = None
+        self._fd: Optional[int] = None
+        self._sequence = 0
+        # Fsynced, not yet in Postgres, oldest first
+        self._unflushed: Deque[Tuple[int, Order]] = deque()
+        self._pending: List[Tuple[List[Tuple[int, Order]], asyncio.Future]] = []
+        self._writer: Optional[asyncio.Task] = None
+        # Set by a failed write: the file may end in a partial line, so stop appending (fail-stop)
+        self._broken: Optional[Exception] = None
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def backlog(self) -> int:
+        return len(self._unflushed) + sum(len(entries) for entries, _ in self._pending)
+
+    async def open(self) -> None:
+        """Recovers unflushed entries and starts the flusher (idempotent)."""
+        async with self._open_lock:
+            if self._fd is not None:
+                return
+            entries = await asyncio.get_running_loop().run_in_executor(None, self._recover)
+            if entries:
+                entries = await self._skip_persisted(entries)
+                self._unflushed.extend(entries)
+                self.recovered = len(entries)
+                logger.info(f"Journal recovery: {len(entries)} orders to replay into the database")
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self.task = asyncio.create_task(self._run_flusher())
+
+    def _recover(self) -> List[Tuple[int, Order]]:
+        if not os.path.exists(self.path):
+            return []
+        entries, flushed, offset, good_bytes = [], 0, 0, 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                offset += len(line)
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("torn write")
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Journal: skipping a damaged record ending at byte {offset}")
+                    continue
+                good_bytes = offset
+                if "flushed" in record:
+                    flushed = max(flushed, record["flushed"])
+                else:
+                    entries.append((record["seq"], Order(**record["order"])))
+        # A torn tail would otherwise be glued to the next append
+        if good_bytes < offset:
+            os.truncate(self.path, good_bytes)
+        # New entries must sort after every marker left in the file
+        self._sequence = max(flushed, entries[-1][0] if entries else 0)
+        return [(sequence, order) for sequence, order in entries if sequence > flushed]
+
+    async def _skip_persisted(self, entries: List[Tuple[int, Order]]) -> List[Tuple[int, Order]]:
+        """Drops orders whose batch committed but whose marker never reached the disk."""
+        persisted = set()
+        async with self.uow_factory() as uow:
+            for start in range(0, len(entries), RECOVERY_LOOKUP_CHUNK):
+                chunk = entries[start:start + RECOVERY_LOOKUP_CHUNK]
+                persisted |= await uow.orders.existing_ids([order.order_id for _, order in chunk])
+        return [(sequence, order) for sequence, order in entries if order.order_id not in persisted]
+
+    async def append(self, orders: List[Order]) -> None:
+        """Returns once the orders are fsynced. Raises ValueError if they cannot be journaled."""
+        if self._broken is not None:
+            raise ValueError(f"Order journal unavailable after a failed write: {self._broken}")
+        if self.backlog + len(orders) > self.max_backlog:
+            raise ValueError("Order journal backlog is full: database flush is falling behind")
+        entries = []
+        for order in orders:
+            self._sequence += 1
+            entries.append((self._sequence, order))
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((entries, future))
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_pending())
+        await future
+
+    async def _write_pending(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                data = b"".join(_to_record(sequence, order) for entries, _ in batch for sequence, order in entries)
+                try:
+                    await loop.run_in_executor(None, self._write, data, True)
+                except Exception as e:
+                    logger.error(f"Journal write of {len(batch)} appends failed, journal stopped: {e}")
+                    self._broken = e
+                    error = ValueError(f"Order journal write failed: {e}")
+                    for _, future in batch + self._pending:
+                        if not future.done():
+                            future.set_exception(error)
+                    self._pending = []
+                    return
+                self.fsyncs += 1
+                for entries, future in batch:
+                    self._unflushed.extend(entries)
+                    self.appended += len(entries)
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self._writer = None
+
+    def _write(self, data: bytes, sync: bool) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+        if sync:
+            os.fsync(self._fd)
+
+    async def flush_once(self, limit: Optional[int] = None) -> int:
+        """Writes the oldest journaled orders (up to `limit`) to Postgres in one transaction; returns how many."""
+        count = min(limit or self.flush_batch, len(self._unflushed))
+        entries = [self._unflushed[i] for i in range(count)]
+        if not entries:
+            return 0
+        orders = [order for _, order in entries]
+        async with self.uow_factory() as uow:
+            await uow.orders.add_many(orders)
+            await uow.outbox.add_many([order_created(order) for order in orders])
+        self.flushed += len(entries)
+        await self._mark_flushed(len(entries))
+        if self.on_flushed:
+            self.on_flushed()
+        return len(entries)
+
+    async def _mark_flushed(self, count: int) -> None:
+        """Drops the oldest `count` entries, which are in the database (or set aside) now."""
+        sequence = self._unflushed[count - 1][0]
+        for _ in range(count):
+            self._unflushed.popleft()
+        # Not fsynced: losing it only means recovery checks these orders against the database
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write, json.dumps({"flushed": sequence}).encode() + b"\n", False
+        )
+        self._compact()
+
+    async def _reject_oldest(self, error: Exception) -> bool:
+        """
+        Sets the oldest order aside after it failed on its own. Returns False,
+        doing nothing, if the database does not answer a read either (an outage,
+        not a bad order).
+        """
+        sequence, order = self._unflushed[0]
+        try:
+            async with self.uow_factory() as uow:
+                stored = order.order_id in await uow.orders.existing_ids([order.order_id])
+        except Exception:
+            return False
+        if stored:
+            logger.warning(f"Journal: order {order.order_id} is already in the database, skipping it")
+        else:
+            record = json.loads(_to_record(sequence, order))
+            record["error"] = str(error)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_rejected, json.dumps(record).encode() + b"\n"
+            )
+            self.rejected += 1
+            logger.error(f"Journal: order {order.order_id} rejected by the database, moved to "
+                         f"{self.rejected_path}: {error}")
+        await self._mark_flushed(1)
+        return True
+
+    def _write_rejected(self, data: bytes) -> None:
+        fd = os.open(self.rejected_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _compact(self) -> None:
+        # No await here: nothing can be appended between the check and the truncate
+        if self._unflushed or self._pending or self._writer is not None:
+            return
+        if os.fstat(self._fd).st_size > self.compact_bytes:
+            os.ftruncate(self._fd, 0)
+
+    async def _run_flusher(self) -> None:
+        limit, strikes = self.flush_batch, 0
+        while True:
+            try:
+                count = await self.flush_once(limit)
+            except Exception as e:
+                self.flush_failures += 1
+                logger.error(f"Journal flush of {min(limit, len(self._unflushed))} orders failed, "
+                             f"{len(self._unflushed)} orders waiting: {e}")
+                if limit > 1:
+                    # Bisect: the orders ahead of a bad one still go through
+                    limit = (limit + 1) // 2
+                    continue
+                strikes += 1
+                if strikes >= self.reject_after and await self._reject_oldest(e):
+                    limit, strikes = self.flush_batch, 0
+                    continue
+                await asyncio.sleep(self.retry_delay)
+                continue
+            strikes = 0
+            if count and limit < self.flush_batch:
+                # Grow back to full batches once past the failing orders
+                limit = min(limit * 2, self.flush_batch)
+                continue
+            if count < self.flush_batch:
+                await asyncio.sleep(self.flush_interval)
+
+    def stats(self) -> dict:
+        return {
+            "appended": self.appended,
+            "fsyncs": self.fsyncs,
+            "flushed": self.flushed,
+            "backlog": self.backlog,
+            "flush_failures": self.flush_failures,
+            "rejected": self.rejected,
+            "recovered": self.recovered,
+        }
+
+    async def close(self) -> None:
+        """Finishes pending appends, flushes what it can, and stops. Anything left is replayed on the next open."""
+        if self._fd is None:
+            return
+        while self._writer is not None:
+            await asyncio.wait({self._writer})
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+        try:
+            while await self.flush_once():
+                pass
+        except Exception as e:
+            logger.error(f"Journal: {len(self._unflushed)} orders left for recovery: {e}")
+        os.close(self._fd)
+        self._fd = None
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from src.generated import market_data_pb2
+
+logger = logging.getLogger("OrderService.PriceCache")
+
+
+class PriceCache:
+    """
+    In-process last-price table for the order path.
+
+    One background StreamMarketDataBatch subscription covers every symbol the
+    service has been asked to price, with LATEST conflation so a busy loop only
+    ever applies the newest tick. Each entry keeps its arrival time (monotonic),
+    and `get` only returns prices younger than `max_age`: callers fall back to a
+    remote lookup on a miss and `put` the result, which also starts watching it.
+    """
+
+    def __init__(self, max_age: float = 2.0, coalesce_ms: int = 50, retry_delay: float = 1.0):
+        self.max_age = max_age
+        self.coalesce_ms = coalesce_ms
+        self.retry_delay = retry_delay
+        # symbol -> (price, time.monotonic() when received)
+        self.prices: Dict[str, Tuple[float, float]] = {}
+        self.symbols: Set[str] = set()
+        self.task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self._stub = None
+        self._symbols_changed = asyncio.Event()
+
+    def get(self, symbol: str) -> Optional[float]:
+        entry = self.prices.get(symbol.upper())
+        if entry is not None and time.monotonic() - entry[1] <= self.max_age:
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        return None
+
+    def put(self, symbol: str, price: float) -> None:
+        symbol = symbol.upper()
+        self.prices[symbol] = (price, time.monotonic())
+        self.watch([symbol])
+
+    def watch(self, symbols: Iterable[str]) -> None:
+        """Adds symbols to the background subscription (resubscribing once if any is new)."""
+        new = {symbol.upper() for symbol in symbols} - self.symbols
+        if new:
+            self.symbols |= new
+            self._symbols_changed.set()
+
+    def start(self, market_stub) -> None:
+        if self.task is None:
+            self._stub = market_stub
+            self.task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def _consume(self, stream) -> None:
+        async for batch in stream:
+            received = time.monotonic()
+            for tick in batch.ticks:
+                self.prices[tick.symbol] = (tick.price, received)
+
+    async def _run(self) -> None:
+        while True:
+            await self._symbols_changed.wait()
+            self._symbols_changed.clear()
+
+            stream = self._stub.StreamMarketDataBatch(market_data_pb2.MultiSymbolRequest(
+                symbols=sorted(self.symbols),
+                coalesce_ms=self.coalesce_ms,
+                conflation=market_data_pb2.LATEST,
+            ))
+            reader = asyncio.ensure_future(self._consume(stream))
+            changed = asyncio.ensure_future(self._symbols_changed.wait())
+            try:
+                # Runs until the stream ends or fails, or a new symbol needs a wider subscription
+                await asyncio.wait({reader, changed}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                changed.cancel()
+                reader.cancel()
+                stream.cancel()
+
+            if reader.done() and not reader.cancelled():
+                reason = reader.exception() or "closed by the server"
+                logger.warning(f"Price stream for {len(self.symbols)} symbols ended ({reason}); "
+                               f"resubscribing in {self.retry_delay}s")
+                await asyncio.sleep(self.retry_delay)
+                self._symbols_changed.set()
@@ -0,0 +1,55 @@
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+SIDES = ("BUY", "SELL")
+
+SYMBOL_REQUIRED = "Symbol is required"
+QUANTITY_NOT_POSITIVE = "Quantity must be positive"
+PRICE_NEGATIVE = "Price must be zero (market) or positive"
+SIDE_UNKNOWN = "Side must be BUY or SELL"
+
+
+def validate_order(request) -> Optional[str]:
+    """Same rules as validate_orders for a single order, without the array setup cost."""
+    if not request.symbol:
+        return SYMBOL_REQUIRED
+    if not 0 < request.quantity < math.inf:
+        return QUANTITY_NOT_POSITIVE
+    if not 0 <= request.price < math.inf:
+        return PRICE_NEGATIVE
+    if request.side not in SIDES:
+        return SIDE_UNKNOWN
+    return None
+
+
+def validate_orders(requests: Sequence) -> List[Optional[str]]:
+    """
+    Validates a whole batch of OrderRequest messages with array operations:
+    the fields are read once into columns and each rule is one vectorized
+    comparison over all orders, instead of a chain of branches per order.
+
+    Returns the rejection reason of every order, in request order (None = valid).
+    When an order breaks several rules the first one listed below is reported.
+    """
+    count = len(requests)
+    symbols = np.array([request.symbol for request in requests], dtype=object)
+    sides = np.array([request.side for request in requests], dtype=object)
+    quantities = np.fromiter((request.quantity for request in requests), dtype=np.float64, count=count)
+    prices = np.fromiter((request.price for request in requests), dtype=np.float64, count=count)
+
+    rules = [
+        (symbols == "", SYMBOL_REQUIRED),
+        # NaN fails every comparison, so `~(x > 0)` rejects it too
+        (~(quantities > 0) | np.isinf(quantities), QUANTITY_NOT_POSITIVE),
+        # 0 = market order (priced from the market data service)
+        (~(prices >= 0) | np.isinf(prices), PRICE_NEGATIVE),
+        (~np.isin(sides, SIDES), SIDE_UNKNOWN),
+    ]
+
+    reasons = np.full(count, None, dtype=object)
+    # Applied last-to-first so the earliest failing rule wins
+    for invalid, reason in reversed(rules):
+        reasons[invalid] = reason
+    return reasons.tolist()
@@ -0,0 +1,159 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from src.application.ports.interfaces import AbstractUnitOfWork, OrderRepository, OutboxRepository
+from src.generated import market_data_pb2
+
+# Test doubles for the order service's ports: database (units of work), market data and RabbitMQ.
+
+
+class FakeSession:
+    """Pending rows of one transaction, like an AsyncSession."""
+
+    def __init__(self):
+        self.pending = []
+        self.pending_events = []
+
+
+class FakeDatabase:
+    """Shared store behind per-call units of work."""
+
+    def __init__(self):
+        self.orders = {}
+        self.outbox = {}
+        self.next_event_id = 1
+        self.commits = 0
+        self.bulk_inserts = 0
+        self.id_lookups = 0
+        self.open_sessions = 0
+        self.peak_sessions = 0
+
+    def unit_of_work(self):
+        return FakeUnitOfWork(self)
+
+
+class FakeOrderRepository(OrderRepository):
+    def __init__(self, database, session):
+        self.database = database
+        self.session = session
+
+    async def add(self, order):
+        self.session.pending.append(order)
+        await asyncio.sleep(0)  # let other orders interleave, as a real flush would
+
+    async def add_many(self, orders):
+        self.database.bulk_inserts += 1
+        self.session.pending.extend(orders)
+
+    async def get_by_id(self, order_id):
+        return self.database.orders.get(order_id)
+
+    async def existing_ids(self, order_ids):
+        self.database.id_lookups += 1
+        return {order_id for order_id in order_ids if order_id in self.database.orders}
+
+    async def list_page(self, after_id=None, limit=100):
+        ids = sorted(order_id for order_id in self.database.orders if after_id is None or order_id > after_id)
+        return [self.database.orders[order_id] for order_id in ids[:limit]]
+
+
+class FakeOutboxRepository(OutboxRepository):
+    def __init__(self, database, session):
+        self.database = database
+        self.session = session
+
+    async def add(self, event):
+        self.session.pending_events.append(event)
+
+    async def claim(self, topic_prefix, limit):
+        return [event for event in self.database.outbox.values() if event.topic.startswith(topic_prefix)][:limit]
+
+    async def remove(self, event_ids):
+        for event_id in event_ids:
+            del self.database.outbox[event_id]
+
+
+class FakeUnitOfWork(AbstractUnitOfWork):
+    def __init__(self, database):
+        self.database = database
+        self.session = None
+
+    async def __aenter__(self):
+        # Same shape as SqlAlchemyUnitOfWork: a fresh session per `async with`
+        self.session = FakeSession()
+        self.orders = FakeOrderRepository(self.database, self.session)
+        self.outbox = FakeOutboxRepository(self.database, self.session)
+        self.database.open_sessions += 1
+        self.database.peak_sessions = max(self.database.peak_sessions, self.database.open_sessions)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.database.open_sessions -= 1
+
+    async def commit(self):
+        await asyncio.sleep(0)
+        self.database.commits += 1
+        for order in self.session.pending:
+            assert order.order_id not in self.database.orders, "order committed twice"
+            self.database.orders[order.order_id] = order
+        for event in self.session.pending_events:
+            event.event_id = self.database.next_event_id
+            self.database.next_event_id += 1
+            self.database.outbox[event.event_id] = event
+        self.session.pending = []
+        self.session.pending_events = []
+
+    async def rollback(self):
+        self.session.pending = []
+        self.session.pending_events = []
+
+
+class FakeMarketStub:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = 0
+
+    async def GetPrice(self, request):
+        self.calls += 1
+        return market_data_pb2.MarketDataResponse(symbol=request.symbol, price=self.prices[request.symbol])
+
+    async def GetPrices(self, request):
+        self.calls += 1
+        return market_data_pb2.MarketDataBatch(ticks=[
+            market_data_pb2.MarketDataResponse(symbol=symbol, price=self.prices[symbol])
+            for symbol in request.symbols if symbol in self.prices
+        ])
+
+
+class FakeExchange:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, message, routing_key):
+        self.published.append((routing_key, json.loads(message.body)))
+
+
+class FakeChannelPool:
+    """ChannelPool stand-in: one fake exchange per channel."""
+
+    def __init__(self, exchanges):
+        self.exchanges = exchanges
+        self.size = len(exchanges)
+        self._idle = asyncio.Queue()
+        for exchange in exchanges:
+            self._idle.put_nowait(exchange)
+
+    @asynccontextmanager
+    async def acquire(self):
+        exchange = await self._idle.get()
+        try:
+            yield exchange
+        finally:
+            self._idle.put_nowait(exchange)
+
+    async def close(self):
+        pass
@@ -1,3 +1,4 @@
+import grpc
 import pytest
 from unittest.mock import AsyncMock
 from httpx import AsyncClient, ASGITransport
@@ -52,3 +53,22 @@ async def test_bulk_order_creation(client, mock_grpc_stub):
             payload = OrderFactory.build_api_payload()
             response = await ac.post("/api/v1/orders", json=payload)
             assert response.status_code == 200
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("code, status, error", [
+    (grpc.StatusCode.FAILED_PRECONDITION, 422, "RiskLimitExceeded"),
+    (grpc.StatusCode.INVALID_ARGUMENT, 400, None),
+    (grpc.StatusCode.UNAVAILABLE, 503, None),
+    (grpc.StatusCode.INTERNAL, 500, None),
+])
+async def test_order_service_errors_map_to_http_status(client, mock_grpc_stub, code, status, error):
+    mock_grpc_stub.PlaceOrder.side_effect = grpc.aio.AioRpcError(
+        code, grpc.aio.Metadata(), grpc.aio.Metadata(), details="rejected by the order service"
+    )
+
+    response = await client.post("/api/v1/orders", json=OrderFactory.build_api_payload(symbol="BTC"))
+
+    assert response.status_code == status
+    assert "rejected by the order service" in response.json()["detail"]
+    if error:
+        assert response.json()["error"] == error
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from src.domain.market_data import MarketDataReader
+from src.infrastructure.market_data_stream import AsyncMarketDataReader
+
+
+def write_csv(path, rows):
+    lines = ["symbol,price,timestamp"] + [f"BTCUSD,{100 + i},{i}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_async_stream_yields_all_rows_in_order(tmp_path):
+    csv_file = tmp_path / "ticks.csv"
+    write_csv(csv_file, 1_000)
+
+    reader = AsyncMarketDataReader(MarketDataReader(str(csv_file)), batch_size=64)
+    prices = [row["price"] async for row in reader.start_stream()]
+
+    assert prices == [str(100 + i) for i in range(1_000)]
+    assert reader.metrics.rows_consumed == 1_000
+    assert reader.metrics.batches_consumed == 16  # ceil(1000 / 64)
+
+
+@pytest.mark.asyncio
+async def test_roomy_queue_never_blocks_producer(tmp_path):
+    csv_file = tmp_path / "ticks.csv"
+    write_csv(csv_file, 1_000)
+
+    reader = AsyncMarketDataReader(MarketDataReader(str(csv_file)), batch_size=64, max_queue_batches=32)
+    async for _ in reader.stream_batches():
+        await asyncio.sleep(0.001)
+
+    assert reader.metrics.producer_blocked_seconds == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_applies_backpressure(tmp_path):
+    """The worker never runs more than max_queue_batches ahead of the consumer."""
+    csv_file = tmp_path / "ticks.csv"
+    write_csv(csv_file, 2_000)
+
+    observed = []
+    reader = AsyncMarketDataReader(
+        MarketDataReader(str(csv_file)),
+        batch_size=10,
+        max_queue_batches=2,
+        on_metrics=lambda m: observed.append(m.batches_produced - m.batches_consumed),
+    )
+
+    async for _ in reader.stream_batches():
+        await asyncio.sleep(0.001)
+
+    # In flight = queued batches + the one the worker is waiting to put
+    assert max(observed) <= reader.max_queue_batches + 1
+    assert reader.metrics.max_depth <= reader.max_queue_batches
+    assert reader.metrics.producer_blocked_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_early_exit_stops_worker(tmp_path):
+    csv_file = tmp_path / "ticks.csv"
+    write_csv(csv_file, 10_000)
+
+    reader = AsyncMarketDataReader(MarketDataReader(str(csv_file)), batch_size=10, max_queue_batches=1)
+    stream = reader.start_stream()
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first["price"] == "100"
+    assert reader.metrics.batches_produced < 1_000
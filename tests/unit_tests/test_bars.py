@@ -0,0 +1,82 @@
+import pytest
+from src.domain.bars import (
+    aggregate_bars,
+    DollarBarAggregator,
+    TickBarAggregator,
+    TimeBarAggregator,
+    VolumeBarAggregator,
+)
+from src.domain.market_data import MarketDataReader, Tick
+
+
+def make_ticks():
+    # (price, volume, timestamp_ms)
+    raw = [
+        (100.0, 1.0, 0),
+        (102.0, 2.0, 500),
+        (99.0, 1.0, 999),
+        (101.0, 3.0, 1000),
+        (103.0, 1.0, 1500),
+        (98.0, 2.0, 2100),
+    ]
+    return [Tick("BTC", price, volume, ts) for price, volume, ts in raw]
+
+
+def test_time_bars_ohlcv():
+    """1-second bars: a new bucket closes the previous bar."""
+    bars = list(aggregate_bars(make_ticks(), [TimeBarAggregator(1000)]))
+
+    assert len(bars) == 3
+    first = bars[0]
+    assert (first.open, first.high, first.low, first.close) == (100.0, 102.0, 99.0, 99.0)
+    assert first.volume == 4.0
+    assert first.tick_count == 3
+
+    # Last bar is the flushed partial bar
+    assert bars[-1].close == 98.0
+    assert bars[-1].tick_count == 1
+
+
+def test_tick_volume_and_dollar_bars():
+    """Threshold bars close on the tick that reaches the threshold."""
+    ticks = make_ticks()
+
+    tick_bars = list(aggregate_bars(ticks, [TickBarAggregator(2)], flush=False))
+    assert [b.close for b in tick_bars] == [102.0, 101.0, 98.0]
+
+    volume_bars = list(aggregate_bars(ticks, [VolumeBarAggregator(3.0)], flush=False))
+    assert [b.volume for b in volume_bars] == [3.0, 4.0, 3.0]
+
+    dollar_bars = list(aggregate_bars(ticks, [DollarBarAggregator(300.0)], flush=False))
+    assert dollar_bars[0].dollar_volume == pytest.approx(304.0)
+
+
+def test_multiple_resolutions_single_pass():
+    """All resolutions are emitted from one iteration over a one-shot generator."""
+    ticks = iter(make_ticks())
+    aggregators = [TimeBarAggregator(1000), TickBarAggregator(3)]
+
+    bars = list(aggregate_bars(ticks, aggregators))
+    resolutions = {b.resolution for b in bars}
+
+    assert resolutions == {"TIME_1000ms", "TICK_3"}
+
+
+def test_bars_from_market_data_reader(tmp_path):
+    """CSV rows (string values, HH:MM:SS timestamps) feed the aggregator."""
+    csv_file = tmp_path / "ticks.csv"
+    csv_file.write_text(
+        "symbol,price,timestamp\n"
+        "BTCUSD,100.0,12:00:01\n"
+        "ETHUSD,10.0,12:00:01\n"
+        "BTCUSD,101.0,12:00:02\n",
+        encoding="utf-8",
+    )
+
+    reader = MarketDataReader(str(csv_file))
+    bars = list(aggregate_bars(reader.stream_ticks(), [TimeBarAggregator(60_000)]))
+
+    by_symbol = {b.symbol: b for b in bars}
+    assert by_symbol["BTCUSD"].close == 101.0
+    assert by_symbol["BTCUSD"].tick_count == 2
+    assert by_symbol["ETHUSD"].tick_count == 1
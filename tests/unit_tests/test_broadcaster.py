@@ -0,0 +1,307 @@
+import asyncio
+
+import grpc
+import pytest
+
+from src.generated import market_data_pb2, market_data_pb2_grpc
+from src.services.market_data_service.broadcaster import CONFLATE_LATEST, MarketDataBroadcaster
+from src.services.market_data_service.server import MarketDataService
+
+
+class CountingSource:
+    """Fake producer that records how many times each symbol's feed was generated."""
+
+    def __init__(self, ticks=5):
+        self.ticks = ticks
+        self.generated = {}
+
+    def __call__(self, symbol):
+        return self._run(symbol)
+
+    async def _run(self, symbol):
+        for i in range(self.ticks):
+            self.generated[symbol] = self.generated.get(symbol, 0) + 1
+            yield market_data_pb2.MarketDataResponse(symbol=symbol, price=i)
+            await asyncio.sleep(0)
+
+
+def label(message):
+    return f"{message.symbol}-{int(message.price)}"
+
+
+async def collect(subscription):
+    return [label(message) async for message in subscription]
+
+
+@pytest.mark.asyncio
+async def test_one_producer_fans_out_to_all_subscribers():
+    source = CountingSource(ticks=5)
+    broadcaster = MarketDataBroadcaster(source)
+
+    subscriptions = [broadcaster.subscribe("BTC") for _ in range(1_000)]
+    received = await asyncio.gather(*[collect(sub) for sub in subscriptions])
+
+    assert all(messages == [f"BTC-{i}" for i in range(5)] for messages in received)
+    # 1000 subscribers, but each tick was generated exactly once
+    assert source.generated == {"BTC": 5}
+
+
+@pytest.mark.asyncio
+async def test_last_unsubscribe_stops_feed():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=1_000_000))
+
+    first = broadcaster.subscribe("ETH")
+    second = broadcaster.subscribe("ETH")
+    feed = first.feeds[0]
+    assert broadcaster.subscriber_count("ETH") == 2
+
+    broadcaster.unsubscribe(first)
+    assert not feed.task.done()
+
+    broadcaster.unsubscribe(second)
+    await asyncio.sleep(0)
+    assert feed.task.cancelled()
+    assert "ETH" not in broadcaster.feeds
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=10), max_queue_size=3)
+    subscription = broadcaster.subscribe("SOL")
+
+    await subscription.feeds[0].task
+    messages = await collect(subscription)
+
+    assert messages == ["SOL-8", "SOL-9"]  # 3 slots: 2 newest ticks + close marker
+    assert subscription.dropped == 8
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_after_feed_ends_starts_new_feed():
+    """A client reconnecting right after a replay ended must not join the dead feed."""
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=3))
+
+    first = await collect(broadcaster.subscribe("BTC"))
+    second = await asyncio.wait_for(collect(broadcaster.subscribe("BTC")), timeout=1)
+
+    assert first == second == ["BTC-0", "BTC-1", "BTC-2"]
+
+
+@pytest.mark.asyncio
+async def test_close_ends_active_subscriptions():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=1_000_000))
+    running = asyncio.create_task(collect(broadcaster.subscribe("BTC")))
+    await asyncio.sleep(0.01)
+    # Cancelled before its first step: the feed task never ran at all
+    idle = broadcaster.subscribe("ETH")
+
+    await broadcaster.close()
+
+    assert len(await asyncio.wait_for(running, timeout=1)) > 0
+    assert await asyncio.wait_for(collect(idle), timeout=1) == []
+    assert broadcaster.feeds == {}
+
+
+@pytest.mark.asyncio
+async def test_latest_conflation_keeps_one_pending_tick_per_symbol():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=500))
+    laggard = broadcaster.subscribe_many(["BTC", "ETH"], conflation=CONFLATE_LATEST)
+    reader = broadcaster.subscribe("BTC")  # default queue policy, unaffected by the laggard
+
+    await asyncio.gather(*[feed.task for feed in laggard.feeds])
+    laggard_messages = await collect(laggard)
+    reader_messages = await collect(reader)
+
+    assert sorted(laggard_messages) == ["BTC-499", "ETH-499"]
+    assert laggard.stats() == {
+        "symbols": 2, "conflation": CONFLATE_LATEST, "queued": 0,
+        "delivered": 2, "dropped": 0, "conflated": 998,
+    }
+    assert reader_messages == [f"BTC-{i}" for i in range(500)]
+    assert reader.conflated == 0 and reader.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_subscription_stats_lists_live_subscribers():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=1_000_000), max_queue_size=5)
+    subscription = broadcaster.subscribe("BTC")
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+    [stats] = broadcaster.subscription_stats()
+    broadcaster.unsubscribe(subscription)
+
+    assert stats["queued"] == 5
+    assert stats["dropped"] > 0
+
+
+@pytest.fixture
+async def market_data_stub():
+    server = grpc.aio.server()
+    service = MarketDataService(tick_interval=0.01)
+    market_data_pb2_grpc.add_MarketDataServiceServicer_to_server(service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        yield market_data_pb2_grpc.MarketDataServiceStub(channel)
+
+    await server.stop(None)
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_grpc_server_handles_more_than_ten_streams(market_data_stub):
+    """The old ThreadPoolExecutor(max_workers=10) server hung on the 11th stream."""
+
+    async def first_ticks(symbol):
+        stream = market_data_stub.StreamMarketData(market_data_pb2.MarketDataRequest(symbol=symbol))
+        ticks = []
+        async for response in stream:
+            ticks.append(response)
+            if len(ticks) == 3:
+                stream.cancel()
+                return ticks
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*[first_ticks("BTC") for _ in range(50)]), timeout=10
+    )
+
+    assert all(len(ticks) == 3 for ticks in results)
+    assert {t.symbol for ticks in results for t in ticks} == {"BTC"}
+
+
+@pytest.mark.asyncio
+async def test_grpc_batch_stream_covers_many_symbols(market_data_stub):
+    symbols = [f"SYM{i}" for i in range(200)]
+    request = market_data_pb2.MultiSymbolRequest(symbols=symbols, coalesce_ms=50)
+
+    seen = set()
+    messages = 0
+    stream = market_data_stub.StreamMarketDataBatch(request)
+    async for batch in stream:
+        messages += 1
+        seen.update(tick.symbol for tick in batch.ticks)
+        if len(seen) == len(symbols):
+            stream.cancel()
+            break
+
+    assert seen == set(symbols)
+    assert messages < len(symbols)
+
+
+@pytest.mark.asyncio
+async def test_multi_symbol_subscription_coalesces_batches():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=4))
+    subscription = broadcaster.subscribe_many(["BTC", "ETH", "BTC"])
+
+    batches = []
+    while True:
+        try:
+            batches.append(await subscription.next_batch(window=0.01))
+        except StopAsyncIteration:
+            break
+
+    ticks = [label(tick) for batch in batches for tick in batch]
+    assert sorted(ticks) == sorted([f"{s}-{i}" for s in ("BTC", "ETH") for i in range(4)])
+    # Both feeds finish inside the first window: everything arrives in far fewer messages
+    assert len(batches) < len(ticks)
+
+
+@pytest.mark.asyncio
+async def test_multi_symbol_queue_scales_with_symbol_count():
+    """200 symbols x 10 ticks inside one window must not overflow a single-symbol queue size."""
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=10), max_queue_size=20)
+    subscription = broadcaster.subscribe_many([f"SYM{i}" for i in range(200)])
+
+    ticks = []
+    while True:
+        try:
+            ticks.extend(await subscription.next_batch(window=0.05, max_size=500))
+        except StopAsyncIteration:
+            break
+
+    assert len(ticks) == 2_000
+    assert subscription.dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_sequences_survive_feed_restarts():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=3))
+
+    first = broadcaster.subscribe("BTC")
+    first_run = [message.sequence async for message in first]
+    second = broadcaster.subscribe("BTC")
+    second_run = [message.sequence async for message in second]
+
+    assert first_run == [1, 2, 3]
+    assert second_run == [4, 5, 6]
+
+
+@pytest.mark.asyncio
+async def test_resume_from_sequence_replays_missed_ticks():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=1_000_000), history_size=100)
+    keeper = broadcaster.subscribe("BTC")  # keeps the feed alive while the client is away
+    for _ in range(20):
+        await asyncio.sleep(0)
+    last_seen = broadcaster.histories["BTC"].sequence - 5
+
+    resumed = broadcaster.subscribe("BTC", resume_from=last_seen)
+    try:
+        messages = [await resumed.__anext__() for _ in range(10)]
+    finally:
+        broadcaster.unsubscribe(keeper)
+        broadcaster.unsubscribe(resumed)
+
+    # Backlog then live, without gaps or duplicates, and no snapshot in between
+    assert [m.sequence for m in messages] == list(range(last_seen + 1, last_seen + 11))
+    assert not any(m.snapshot for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_unwatched_histories_are_pruned_after_the_grace_period():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=1_000_000), pin_ttl=0.05)
+    for i in range(50):
+        subscription = broadcaster.subscribe(f"SYM{i}")
+        await subscription.__anext__()
+        broadcaster.unsubscribe(subscription)
+    # Still there for a reconnecting client
+    assert len(broadcaster.histories) == 50
+
+    resumed = broadcaster.subscribe("SYM0", resume_from=1)
+    await asyncio.sleep(0.1)
+    assert list(broadcaster.histories) == ["SYM0"]
+
+    broadcaster.unsubscribe(resumed)
+    await asyncio.sleep(0.1)
+    assert broadcaster.histories == {}
+
+
+@pytest.mark.asyncio
+async def test_resume_outside_buffer_falls_back_to_snapshot():
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=50), history_size=10)
+    await collect(broadcaster.subscribe("ETH"))
+    history = broadcaster.histories["ETH"]
+
+    subscription = broadcaster.subscribe("ETH", resume_from=3)
+    first = await subscription.__anext__()
+
+    assert first.snapshot is True
+    assert first.sequence == history.sequence
+    # The buffered original is not mutated by the snapshot flag
+    assert history.recent[-1].snapshot is False
+    broadcaster.unsubscribe(subscription)
+
+
+@pytest.mark.asyncio
+async def test_resume_ahead_of_server_falls_back_to_snapshot():
+    """After a server restart the client's sequence can be ahead: never let it go backwards silently."""
+    broadcaster = MarketDataBroadcaster(CountingSource(ticks=5))
+    await collect(broadcaster.subscribe("ETH"))
+
+    subscription = broadcaster.subscribe("ETH", resume_from=1_000)
+    first = await subscription.__anext__()
+    broadcaster.unsubscribe(subscription)
+
+    assert first.snapshot is True
+    assert first.sequence == 5
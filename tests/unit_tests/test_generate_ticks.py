@@ -0,0 +1,59 @@
+import numpy as np
+
+from src.infrastructure.tick_archive import TickArchiveReader
+from src.scripts.generate_ticks import SyntheticTickGenerator, write_archive, write_csv
+
+
+def collect(seed):
+    generator = SyntheticTickGenerator(n_symbols=20, seed=seed)
+    chunks = list(generator.chunks(25_000, chunk_size=10_000))
+    return [np.concatenate(column) for column in zip(*chunks)]
+
+
+def test_same_seed_reproduces_ticks():
+    first = collect(seed=7)
+    second = collect(seed=7)
+    other = collect(seed=8)
+
+    for a, b in zip(first, second):
+        assert np.array_equal(a, b)
+    assert not np.array_equal(first[1], other[1])
+
+
+def test_ticks_are_time_ordered_and_positive():
+    symbols, prices, volumes, timestamps = collect(seed=1)
+
+    assert len(timestamps) == 25_000
+    assert np.all(np.diff(timestamps) >= 0)
+    assert np.all(prices > 0)
+    assert np.all(volumes > 0)
+    assert len(set(symbols.tolist())) == 20
+
+
+def test_archive_output_round_trips(tmp_path):
+    archive = tmp_path / "synthetic.cfta"
+    generator = SyntheticTickGenerator(n_symbols=5, seed=3)
+
+    written = write_archive(str(archive), generator.chunks(5_000, chunk_size=2_000))
+
+    blocks = list(TickArchiveReader(str(archive)).iter_blocks())
+    assert written == 5_000
+    assert sum(len(block) for block in blocks) == 5_000
+
+
+def test_vectorized_csv_matches_python_formatting(tmp_path):
+    generator = SyntheticTickGenerator(n_symbols=12, seed=5)
+    symbols, prices, volumes, timestamps = generator.generate_chunk(0, 3_000)
+    # Edge cases: zeros, values on digit-count boundaries, wide integers
+    prices[:4] = [0.0, 9.9999, 10.0, 123456.5]
+    volumes[:4] = [0.0, 1e-08, 99.99999999, 1.0]
+    timestamps[:4] = [0, 9, 999_999_999, 1_000_000_000]
+
+    output = tmp_path / "ticks.csv"
+    write_csv(str(output), [(symbols, prices, volumes, timestamps)], rows_per_write=1_000)
+
+    expected = "symbol,price,volume,timestamp\n" + "".join(
+        f"{s},{p:.4f},{v:.8f},{t}\n"
+        for s, p, v, t in zip(symbols.tolist(), prices.tolist(), volumes.tolist(), timestamps.tolist())
+    )
+    assert output.read_text() == expected
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from src.domain.exceptions import InsufficientLiquidityError
+from src.domain.matching_engine import BUY, SELL, LimitOrderBook, MatchingEngine
+from src.infrastructure.adapters.matching_engine_exchange import MatchingEngineExchange
+
+
+def test_fills_best_price_first_then_oldest_first():
+    book = LimitOrderBook("BTC")
+    book.submit("a1", SELL, 1.0, 101.0)
+    book.submit("a2", SELL, 2.0, 100.0)
+    book.submit("a3", SELL, 2.0, 100.0)
+
+    trades = book.submit("b1", BUY, 3.0, 101.0)
+
+    assert [(t.maker_order_id, t.price, t.quantity) for t in trades] == [
+        ("a2", 100.0, 2.0), ("a3", 100.0, 1.0),
+    ]
+    assert book.orders["a3"].quantity == 1.0
+    assert book.best_ask() == (100.0, 1.0)
+    assert book.last_price == 100.0
+
+
+def test_limit_remainder_rests_and_market_remainder_is_dropped():
+    book = LimitOrderBook("BTC")
+    book.submit("a1", SELL, 1.0, 100.0)
+
+    book.submit("b1", BUY, 3.0, 99.0)        # does not cross: rests
+    assert book.best_bid() == (99.0, 3.0)
+
+    trades = book.submit("b2", BUY, 5.0)     # market: takes the 1.0 available
+    assert [t.quantity for t in trades] == [1.0]
+    assert "b2" not in book.orders
+    assert book.best_ask() is None
+
+    trades = book.submit("a2", SELL, 4.0, 99.0)
+    assert [(t.maker_order_id, t.quantity) for t in trades] == [("b1", 3.0)]
+    assert book.depth() == ([], [(99.0, 1.0)])
+
+
+def test_cancel_removes_order_and_empty_level():
+    book = LimitOrderBook("BTC")
+    book.submit("b1", BUY, 1.0, 99.0)
+    book.submit("b2", BUY, 1.0, 98.0)
+
+    assert book.cancel("b1").order_id == "b1"
+    assert book.cancel("b1") is None
+    assert book.best_bid() == (98.0, 1.0)
+    assert book.submit("s1", SELL, 1.0, 98.0)[0].maker_order_id == "b2"
+
+    with pytest.raises(ValueError):
+        book.submit("b3", BUY, 0, 98.0)
+    with pytest.raises(ValueError):
+        book.submit("b4", "buy", 1.0, 98.0)
+
+
+def test_fractional_fills_leave_no_dust():
+    book = LimitOrderBook("BTC")
+    book.submit("a1", SELL, 0.1, 100.0)
+    book.submit("a2", SELL, 0.2, 100.0)
+    book.submit("a3", SELL, 0.7, 100.0)
+
+    trades = book.submit("b1", BUY, 0.3, 100.0)
+    assert [(t.maker_order_id, t.quantity) for t in trades] == [("a1", 0.1), ("a2", 0.2)]
+    assert "a2" not in book.orders
+    assert book.best_ask() == (100.0, 0.7)
+
+    trades = book.submit("b2", BUY, 0.7, 100.0)
+    assert [t.quantity for t in trades] == [0.7]
+    assert book.depth() == ([], [])
+
+
+def test_engine_streams_trades_per_symbol():
+    engine = MatchingEngine()
+    seen = []
+    engine.add_listener(seen.append)
+
+    engine.submit("btc", "a1", SELL, 1.0, 100.0)
+    engine.submit("ETH", "a1", SELL, 1.0, 10.0)   # IDs are per book
+    engine.submit("BTC", "b1", BUY, 1.0, 100.0)
+
+    assert [(t.symbol, t.taker_order_id) for t in seen] == [("BTC", "b1")]
+    assert engine.book("ETH").best_ask() == (10.0, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_exchange_adapter_prices_from_book_and_trades():
+    exchange = MatchingEngineExchange()
+    stream = exchange.trades()
+    next_trade = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    with pytest.raises(InsufficientLiquidityError):
+        await exchange.get_current_price("BTC")
+
+    await exchange.place_order("BTC", "b1", BUY, 1.0, 99.0)
+    await exchange.place_order("BTC", "a1", SELL, 2.0, 101.0)
+    assert await exchange.get_current_price("BTC") == 100.0
+
+    await exchange.place_order("BTC", "b2", BUY, 1.5, 101.0)
+    trade = await asyncio.wait_for(next_trade, 1)
+    await stream.aclose()
+
+    assert (trade.price, trade.quantity) == (101.0, 1.5)
+    assert await exchange.get_latest_prices(["BTC"]) == {"BTC": 101.0}
+    assert await exchange.get_price_history("btc") == [101.0]
+    assert exchange.subscribers == set()
+    assert await exchange.get_latest_prices(["BTC", "ETH"]) == {"BTC": 101.0}
+
+
+@pytest.mark.asyncio
+async def test_lagging_trade_subscriber_is_closed_not_skipped():
+    exchange = MatchingEngineExchange(subscriber_queue_size=2)
+    stream = exchange.trades()
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+
+    exchange.engine.submit("BTC", "a1", SELL, 5.0, 100.0)
+    for i in range(4):
+        exchange.engine.submit("BTC", f"b{i}", BUY, 1.0, 100.0)
+
+    # b0 and b1 filled the queue, so b2 closed the stream rather than going missing
+    assert (await first).taker_order_id == "b0"
+    assert (await stream.__anext__()).taker_order_id == "b1"
+    with pytest.raises(ConnectionError):
+        await stream.__anext__()
+    assert exchange.dropped_subscribers == 1
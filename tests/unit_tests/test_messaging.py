@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import pytest
+from aio_pika.exceptions import DeliveryError
+
+from src.domain.events import DomainEvent
+from src.infrastructure.messaging import EventPublisher
+from tests.factories.order_service_fakes import FakeChannelPool
+
+
+class SlowExchange:
+    """Confirms every message after a short delay and records the peak number awaiting a confirm."""
+
+    def __init__(self, active):
+        self.active = active
+        self.published = []
+
+    async def publish(self, message, routing_key):
+        self.active["now"] += 1
+        self.active["peak"] = max(self.active["peak"], self.active["now"])
+        await asyncio.sleep(0.001)
+        self.active["now"] -= 1
+        self.published.append((routing_key, message.message_id, json.loads(message.body)))
+
+
+def events(count):
+    return [DomainEvent("order.created", {"n": i}, event_id=i) for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_pipelined_across_pooled_channels():
+    active = {"now": 0, "peak": 0}
+    exchanges = [SlowExchange(active) for _ in range(4)]
+    publisher = EventPublisher(FakeChannelPool(exchanges))
+
+    await publisher.publish_batch(events(100))
+
+    assert [len(exchange.published) for exchange in exchanges] == [25, 25, 25, 25]
+    delivered = sorted(message_id for exchange in exchanges for _, message_id, _ in exchange.published)
+    assert delivered == sorted(str(i) for i in range(100))
+    # Not one confirm round-trip per message: they were all outstanding together
+    assert active["peak"] == 100
+
+    metrics = publisher.metrics()
+    assert metrics["published"] == 100 and metrics["in_flight"] == 0
+    assert metrics["confirm_latency_ms"]["p50"] >= 1.0
+
+
+@pytest.mark.asyncio
+async def test_in_flight_messages_are_bounded():
+    active = {"now": 0, "peak": 0}
+    publisher = EventPublisher(FakeChannelPool([SlowExchange(active) for _ in range(2)]), max_in_flight=10)
+
+    await publisher.publish_batch(events(200))
+
+    assert active["peak"] == 10
+    assert publisher.published == 200
+
+
+@pytest.mark.asyncio
+async def test_nack_fails_the_batch_and_is_counted():
+    class NackingExchange:
+        async def publish(self, message, routing_key):
+            if message.message_id == "3":
+                raise DeliveryError(None, None)
+
+    publisher = EventPublisher(FakeChannelPool([NackingExchange()]))
+
+    with pytest.raises(DeliveryError):
+        await publisher.publish_batch(events(5))
+
+    assert publisher.nacks == 1
+    assert publisher.published == 4
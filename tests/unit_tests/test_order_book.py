@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from src.domain.order_book import ASK, BID, OrderBook
+from src.generated import market_data_pb2
+from src.infrastructure.order_book_client import OrderBookGapError, OrderBookReplica
+from src.services.market_data_service.order_book_feed import SyntheticDepth
+from src.services.market_data_service.server import MarketDataService
+
+
+class FakeContext:
+    async def abort(self, code, details):
+        raise RuntimeError(details)
+
+
+def test_levels_stay_sorted_best_first():
+    book = OrderBook("BTC")
+    for price in [99.5, 100.0, 98.0, 99.0]:
+        book.apply(BID, price, 1.0)
+    for price in [101.0, 100.5, 103.0]:
+        book.apply(ASK, price, 2.0)
+
+    book.apply(BID, 99.0, 0)       # level removed
+    book.apply(ASK, 100.5, 7.0)    # quantity replaced
+
+    bids, asks = book.depth()
+    assert bids == [(100.0, 1.0), (99.5, 1.0), (98.0, 1.0)]
+    assert asks == [(100.5, 7.0), (101.0, 2.0), (103.0, 2.0)]
+    assert book.mid_price() == 100.25
+    assert book.depth(levels=1) == ([(100.0, 1.0)], [(100.5, 7.0)])
+
+
+def test_synthetic_depth_reports_only_changed_levels():
+    depth = SyntheticDepth("BTC", levels=10, churn=0.0, rng=random.Random(1))
+
+    bids, asks = depth.move_to(100.0)
+    assert len(bids) == len(asks) == 10
+
+    # Same price and no churn: nothing to send
+    assert depth.move_to(100.0) == ([], [])
+
+    # One tick up: one new level per side, one level falls off each side
+    bids, asks = depth.move_to(100.01)
+    assert sorted(q == 0 for _, q in bids) == [False, True]
+    assert sorted(q == 0 for _, q in asks) == [False, True]
+    assert len(depth.book.bids) == len(depth.book.asks) == 10
+
+
+def test_replica_rejects_gaps():
+    replica = OrderBookReplica("BTC")
+    update = market_data_pb2.OrderBookUpdate(symbol="BTC", sequence=5)
+
+    with pytest.raises(OrderBookGapError):
+        replica.apply(update)
+
+    replica.apply(market_data_pb2.OrderBookUpdate(symbol="BTC", sequence=4, snapshot=True))
+    replica.apply(update)
+    with pytest.raises(OrderBookGapError):
+        replica.apply(market_data_pb2.OrderBookUpdate(symbol="BTC", sequence=7))
+
+
+@pytest.mark.asyncio
+async def test_client_rebuilds_server_book_from_snapshot_and_deltas(tmp_path):
+    rows = [f"BTCUSD,{60000 + (i * 37) % 5},{i}" for i in range(200)]
+    csv_file = tmp_path / "ticks.csv"
+    csv_file.write_text("symbol,price,timestamp\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    service = MarketDataService(replay_file=str(csv_file), replay_speed=0, book_depth=15)
+
+    request = market_data_pb2.OrderBookRequest(symbol="BTCUSD")
+    replica = OrderBookReplica("BTCUSD")
+    server_book = None
+    updates = []
+    async for update in service.StreamOrderBook(request, FakeContext()):
+        server_book = server_book or service.order_books.get("BTCUSD")
+        updates.append(update)
+        replica.apply(update)
+
+    assert updates[0].snapshot and not any(u.snapshot for u in updates[1:])
+    assert [u.sequence for u in updates[1:]] == list(range(1, len(updates)))
+    # Deltas are much smaller than the full 2 x 15 levels
+    delta_levels = [len(u.bids) + len(u.asks) for u in updates[2:]]
+    assert sum(delta_levels) / len(delta_levels) < 15
+    assert replica.book.depth() == server_book.depth()
+    assert len(replica.book.bids) == 15
+
+
+@pytest.mark.asyncio
+async def test_live_book_follows_the_shared_tick_feed():
+    service = MarketDataService(tick_interval=0.001, book_depth=5)
+    book_stream = service.StreamOrderBook(market_data_pb2.OrderBookRequest(symbol="BTC"), FakeContext())
+    try:
+        await book_stream.__anext__()          # snapshot
+        for _ in range(3):
+            await book_stream.__anext__()
+        # One producer per symbol: the book is centred on the price the tick stream publishes
+        assert service.broadcaster.subscriber_count("BTC") == 1
+        book = service.order_books["BTC"]
+        bid, ask = book.best_bid()[0], book.best_ask()[0]
+        assert any(bid - 1e-9 <= tick.price <= ask for tick in service.broadcaster.histories["BTC"].recent)
+    finally:
+        await book_stream.aclose()
+        await service.close()
+    assert service.broadcaster.subscriber_count("BTC") == 0
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from src.domain.ids import ID_LENGTH, OrderIdGenerator, id_floor, id_timestamp_ms
+from src.infrastructure.repositories.memory import InMemoryOrderRepository
+from tests.factories import OrderFactory
+
+
+def test_ids_strictly_increase_and_encode_creation_time():
+    generator = OrderIdGenerator(node_id=7)
+    before = time.time_ns() // 1_000_000
+    ids = [generator.new_id() for _ in range(10_000)]
+    after = time.time_ns() // 1_000_000
+
+    assert ids == sorted(ids) and len(set(ids)) == len(ids)
+    assert all(len(order_id) == ID_LENGTH for order_id in ids)
+    assert before <= id_timestamp_ms(ids[0]) <= id_timestamp_ms(ids[-1]) <= after
+    assert id_floor(before) <= ids[0]
+
+
+def test_ids_stay_monotonic_when_clock_steps_back(monkeypatch):
+    clock = iter([2_000_000_000, 1_000_000_000, 1_000_000_000])
+    monkeypatch.setattr("src.domain.ids.time.time_ns", lambda: next(clock) * 1_000_000)
+    generator = OrderIdGenerator(node_id=1)
+
+    ids = [generator.new_id() for _ in range(3)]
+    assert ids == sorted(ids) and len(set(ids)) == 3
+    assert {id_timestamp_ms(order_id) for order_id in ids} == {2_000_000_000}
+
+
+def test_nodes_do_not_collide_within_a_millisecond(monkeypatch):
+    monkeypatch.setattr("src.domain.ids.time.time_ns", lambda: 1_700_000_000_000_000_000)
+    monkeypatch.setattr("src.domain.ids.random.getrandbits", lambda bits: 0)
+    a, b = OrderIdGenerator(node_id=1), OrderIdGenerator(node_id=2)
+    assert a.new_id() != b.new_id()
+
+    with pytest.raises(ValueError):
+        OrderIdGenerator(node_id=1 << 16)
+
+
+def test_repository_pages_by_id_range():
+    generator = OrderIdGenerator()
+    repo = InMemoryOrderRepository()
+    orders = [OrderFactory.build_entity(order_id=generator.new_id()) for _ in range(25)]
+    repo.add_many(reversed(orders))
+
+    pages, after = [], None
+    while page := repo.list_page(after_id=after, limit=10):
+        pages.append(page)
+        after = page[-1].order_id
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert [order for page in pages for order in page] == orders
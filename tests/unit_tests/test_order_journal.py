@@ -0,0 +1,160 @@
+import asyncio
+import json
+
+import pytest
+
+from src.domain.entities import Order
+from src.services.order_service.journal import OrderJournal
+from tests.factories.order_service_fakes import FakeDatabase, FakeUnitOfWork
+
+
+def make_orders(count, start=0):
+    return [Order(order_id=f"o-{i}", symbol="BTC", quantity=1, price=50_000.0, side="BUY")
+            for i in range(start, start + count)]
+
+
+def make_journal(path, database, **kwargs):
+    # Flusher effectively paused: tests call flush_once explicitly
+    return OrderJournal(str(path), database.unit_of_work, flush_interval=3600, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_appends_share_fsyncs_and_flush_in_bulk(tmp_path):
+    database = FakeDatabase()
+    journal = make_journal(tmp_path / "orders.journal", database, flush_batch=50)
+    await journal.open()
+
+    await asyncio.gather(*[journal.append([order]) for order in make_orders(100)])
+    assert journal.appended == 100 and journal.fsyncs < 100
+    assert database.orders == {}           # acknowledged before the database saw anything
+
+    assert await journal.flush_once() == 50
+    assert await journal.flush_once() == 50
+    assert len(database.orders) == 100 and len(database.outbox) == 100
+    assert database.bulk_inserts == 2 and journal.backlog == 0
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_recovery_replays_only_unflushed_orders(tmp_path):
+    path = tmp_path / "orders.journal"
+    database = FakeDatabase()
+    journal = make_journal(path, database, flush_batch=3)
+    await journal.open()
+    await journal.append(make_orders(5))
+    await journal.flush_once()             # o-0..o-2 flushed, marker written
+    journal.task.cancel()                  # "crash": o-3, o-4 only in the journal
+    with open(path, "ab") as f:
+        f.write(b'{"seq": 6, "ord')        # torn write
+
+    recovered = make_journal(path, database)
+    await recovered.open()
+    assert recovered.recovered == 2
+    await recovered.append(make_orders(1, start=5))
+    await recovered.close()
+
+    assert sorted(database.orders) == [f"o-{i}" for i in range(6)]
+    assert len(database.outbox) == 6
+
+
+@pytest.mark.asyncio
+async def test_recovery_skips_orders_committed_without_marker(tmp_path):
+    path = tmp_path / "orders.journal"
+    database = FakeDatabase()
+    journal = make_journal(path, database)
+    await journal.open()
+    await journal.append(make_orders(3))
+    # Committed, but the process died before the flushed marker was written
+    async with database.unit_of_work() as uow:
+        await uow.orders.add_many(make_orders(2))
+    journal.task.cancel()
+
+    recovered = make_journal(path, database)
+    await recovered.open()
+    assert recovered.recovered == 1
+    assert database.id_lookups == 1        # one bulk query, not one per order
+    await recovered.close()
+    assert sorted(database.orders) == ["o-0", "o-1", "o-2"]
+
+
+@pytest.mark.asyncio
+async def test_backlog_limit_and_failed_flush(tmp_path, monkeypatch):
+    database = FakeDatabase()
+    journal = make_journal(tmp_path / "orders.journal", database, max_backlog=3)
+    await journal.open()
+    await journal.append(make_orders(3))
+    with pytest.raises(ValueError, match="backlog"):
+        await journal.append(make_orders(1, start=3))
+
+    async def database_down(self):
+        raise ConnectionError("database down")
+
+    monkeypatch.setattr(FakeUnitOfWork, "commit", database_down)
+    with pytest.raises(ConnectionError):
+        await journal.flush_once()
+    assert journal.backlog == 3 and database.orders == {}   # kept for the next attempt
+
+    monkeypatch.undo()
+    await journal.close()
+    assert len(database.orders) == 3
+
+
+@pytest.mark.asyncio
+async def test_poison_order_is_set_aside_without_blocking_the_rest(tmp_path, monkeypatch):
+    database = FakeDatabase()
+    path = tmp_path / "orders.journal"
+    journal = OrderJournal(str(path), database.unit_of_work, flush_interval=0.001, flush_batch=8, retry_delay=0)
+    commit = FakeUnitOfWork.commit
+
+    async def reject_o4(self):
+        if any(order.order_id == "o-4" for order in self.session.pending):
+            raise ValueError("value too long for type character varying")
+        await commit(self)
+
+    monkeypatch.setattr(FakeUnitOfWork, "commit", reject_o4)
+    await journal.open()
+    await journal.append(make_orders(10))
+    for _ in range(200):
+        if journal.backlog == 0:
+            break
+        await asyncio.sleep(0.005)
+
+    assert sorted(database.orders) == sorted(f"o-{i}" for i in range(10) if i != 4)
+    assert journal.rejected == 1 and journal.stats()["rejected"] == 1
+    rejected = [json.loads(line) for line in (tmp_path / "orders.journal.rejected").read_text().splitlines()]
+    assert [record["order"]["order_id"] for record in rejected] == ["o-4"]
+    assert "too long" in rejected[0]["error"]
+    await journal.close()
+
+    # Nothing is replayed: the rejected order counts as flushed
+    reopened = make_journal(path, FakeDatabase())
+    await reopened.open()
+    assert reopened.recovered == 0
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_orders_are_kept_while_the_database_is_down(tmp_path, monkeypatch):
+    database = FakeDatabase()
+    journal = OrderJournal(str(tmp_path / "orders.journal"), database.unit_of_work, flush_interval=0.001,
+                           retry_delay=0.001)
+
+    async def database_down(self):
+        raise ConnectionError("database down")
+
+    # Writes and the health probe both fail: an outage, not a bad order
+    monkeypatch.setattr(FakeUnitOfWork, "commit", database_down)
+    monkeypatch.setattr(FakeUnitOfWork, "__aenter__", database_down)
+    await journal.open()
+    await journal.append(make_orders(4))
+    while journal.flush_failures < 20:
+        await asyncio.sleep(0.001)
+    assert journal.rejected == 0 and journal.backlog == 4
+
+    monkeypatch.undo()
+    for _ in range(200):
+        if journal.backlog == 0:
+            break
+        await asyncio.sleep(0.005)
+    assert len(database.orders) == 4
+    await journal.close()
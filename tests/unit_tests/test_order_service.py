@@ -0,0 +1,441 @@
+import asyncio
+
+import grpc
+import pytest
+
+from src.domain.entities import Order
+from src.domain.risk import RiskEngine, RiskLimits
+from src.generated import market_data_pb2, order_pb2, order_pb2_grpc
+from src.infrastructure.messaging import EventPublisher
+from src.infrastructure.outbox import OutboxRelay
+from src.services.order_service.actors import SymbolActors
+from src.services.order_service.group_commit import GroupCommitter
+from src.services.order_service.price_cache import PriceCache
+from src.services.order_service.server import OrderService
+from src.services.order_service.validation import validate_orders
+from tests.factories.order_service_fakes import (
+    FakeChannelPool, FakeDatabase, FakeExchange, FakeMarketStub, FakeOrderRepository, FakeUnitOfWork,
+)
+
+
+class AbortError(Exception):
+    pass
+
+
+class FakeContext:
+    async def abort(self, code, details):
+        raise AbortError(code, details)
+
+
+@pytest.fixture
+def database():
+    return FakeDatabase()
+
+
+def make_service(database, **kwargs):
+    # No limits unless a test sets them: accepted orders count towards exposure
+    kwargs.setdefault("risk", RiskEngine(RiskLimits()))
+    service = OrderService(uow_factory=database.unit_of_work, **kwargs)
+    service.market_channel = object()  # skip lazy connections
+    service.market_stub = FakeMarketStub({"BTC": 50_000.0, "ETH": 3_000.0})
+    service.events = EventPublisher(FakeChannelPool([FakeExchange()]))
+    # Not started: tests drain the outbox explicitly
+    service.outbox_relay = OutboxRelay(database.unit_of_work, service.events, topic_prefix="order.")
+    return service
+
+
+@pytest.fixture
+def order_service(database):
+    return make_service(database)
+
+
+def test_validate_orders_reports_first_broken_rule_per_order():
+    requests = [
+        order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY"),
+        order_pb2.OrderRequest(symbol="", quantity=-1, side="HOLD"),
+        order_pb2.OrderRequest(symbol="ETH", quantity=float("nan"), side="SELL"),
+        order_pb2.OrderRequest(symbol="ETH", quantity=1, price=-5, side="SELL"),
+        order_pb2.OrderRequest(symbol="ETH", quantity=1, price=5, side="buy"),
+    ]
+
+    assert validate_orders(requests) == [
+        None,
+        "Symbol is required",
+        "Quantity must be positive",
+        "Price must be zero (market) or positive",
+        "Side must be BUY or SELL",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_place_orders_persists_batch_in_one_transaction(order_service, database):
+    request = order_pb2.OrderBatchRequest(orders=[
+        order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY"),
+        order_pb2.OrderRequest(symbol="ETH", quantity=0, side="SELL"),
+        order_pb2.OrderRequest(symbol="ETH", quantity=2, price=2_900.0, side="SELL"),
+        order_pb2.OrderRequest(symbol="DOGE", quantity=5, side="BUY"),
+    ] * 50)
+
+    response = await order_service.PlaceOrders(request, FakeContext())
+
+    statuses = [result.status for result in response.results]
+    assert statuses == ["ACCEPTED", "REJECTED", "ACCEPTED", "REJECTED"] * 50
+    assert response.results[1].message == "Quantity must be positive"
+    assert response.results[3].message == "Could not fetch price for DOGE"
+
+    assert database.commits == 1 and database.bulk_inserts == 1
+    assert len(database.orders) == 100
+    assert database.orders[response.results[0].order_id].price == 50_000.0  # market order
+    assert database.orders[response.results[2].order_id].price == 2_900.0  # limit price kept
+    # One price lookup for the whole batch, one event per accepted order
+    assert order_service.market_stub.calls == 1
+    assert len(database.outbox) == 100
+
+
+@pytest.mark.asyncio
+async def test_place_orders_rejects_oversized_batch(order_service, database, monkeypatch):
+    monkeypatch.setattr("src.services.order_service.server.ORDER_BATCH_MAX_SIZE", 3)
+    request = order_pb2.OrderBatchRequest(orders=[order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY")] * 4)
+
+    with pytest.raises(AbortError) as error:
+        await order_service.PlaceOrders(request, FakeContext())
+
+    assert error.value.args[0] == grpc.StatusCode.INVALID_ARGUMENT
+    assert database.commits == 0
+
+
+@pytest.fixture
+async def order_stub(order_service):
+    server = grpc.aio.server()
+    order_pb2_grpc.add_OrderServiceServicer_to_server(order_service, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        yield order_pb2_grpc.OrderServiceStub(channel)
+
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_stream_orders_acknowledges_every_order_by_client_id(database, order_stub):
+    def requests():
+        for i in range(2_000):
+            yield order_pb2.OrderRequest(symbol="BTC" if i % 10 else "DOGE", quantity=1, side="BUY",
+                                         client_order_id=f"c{i}")
+
+    acks = {}
+    async for ack in order_stub.StreamOrders(requests()):
+        acks[ack.client_order_id] = ack
+
+    assert set(acks) == {f"c{i}" for i in range(2_000)}
+    rejected = {cid for cid, ack in acks.items() if ack.status == "REJECTED"}
+    assert rejected == {f"c{i}" for i in range(0, 2_000, 10)}
+    assert acks["c0"].message == "Could not fetch price for DOGE"
+    assert len(database.orders) == 1_800
+
+
+@pytest.mark.asyncio
+async def test_stream_orders_bounds_in_flight_orders(order_service, database, monkeypatch):
+    monkeypatch.setattr("src.services.order_service.server.ORDER_STREAM_MAX_IN_FLIGHT", 8)
+    repository_add = FakeOrderRepository.add
+
+    async def slow_add(self, order):
+        await asyncio.sleep(0.001)
+        await repository_add(self, order)
+
+    monkeypatch.setattr(FakeOrderRepository, "add", slow_add)
+
+    async def requests():
+        for i in range(200):
+            yield order_pb2.OrderRequest(symbol="BTC", quantity=1, side="SELL", client_order_id=str(i))
+
+    acks = [ack async for ack in order_service.StreamOrders(requests(), FakeContext())]
+
+    assert len(acks) == 200 and all(ack.status == "ACCEPTED" for ack in acks)
+    # Concurrent, but never more than the configured slots
+    assert 1 < database.peak_sessions <= 8
+
+
+class FakeBatchStream:
+    def __init__(self, request):
+        self.request = request
+        self.batches = asyncio.Queue()
+        self.cancelled = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.batches.get()
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeStreamingStub:
+    def __init__(self):
+        self.streams = []
+
+    def StreamMarketDataBatch(self, request):
+        self.streams.append(FakeBatchStream(request))
+        return self.streams[-1]
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def batch(**prices):
+    return market_data_pb2.MarketDataBatch(ticks=[
+        market_data_pb2.MarketDataResponse(symbol=symbol, price=price) for symbol, price in prices.items()
+    ])
+
+
+@pytest.mark.asyncio
+async def test_price_cache_follows_background_subscription():
+    stub = FakeStreamingStub()
+    cache = PriceCache(max_age=60)
+    cache.start(stub)
+    try:
+        cache.put("btc", 100.0)  # e.g. from a remote fallback: cached and watched from now on
+        await settle()
+        [first] = stub.streams
+        assert list(first.request.symbols) == ["BTC"]
+        assert first.request.conflation == market_data_pb2.LATEST
+
+        first.batches.put_nowait(batch(BTC=101.0))
+        await settle()
+        assert cache.get("BTC") == 101.0
+
+        # A new symbol widens the subscription
+        cache.watch(["ETH"])
+        await settle()
+        assert first.cancelled
+        assert list(stub.streams[-1].request.symbols) == ["BTC", "ETH"]
+    finally:
+        await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_order_path_reads_cached_price_until_stale(order_service):
+    order_service.prices.max_age = 0.05
+    market = order_service.market_stub
+
+    assert await order_service._get_current_price("BTC") == 50_000.0
+    assert await order_service._get_current_price("BTC") == 50_000.0
+    assert market.calls == 1
+
+    await asyncio.sleep(0.06)
+    market.prices["BTC"] = 51_000.0
+    assert await order_service._get_current_price("BTC") == 51_000.0
+    assert market.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_orders_each_get_their_own_unit_of_work(database):
+    """A single shared UoW swapped its session under in-flight orders, losing or double-committing them."""
+    service = make_service(database, max_concurrent_transactions=10)
+
+    requests = [order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY") for _ in range(500)]
+    responses = await asyncio.gather(*[service.PlaceOrder(request, FakeContext()) for request in requests])
+
+    assert {response.order_id for response in responses} == set(database.orders)
+    assert len(database.orders) == database.commits == 500
+    # Many transactions overlapped, never more than the configured limit
+    assert 1 < database.peak_sessions <= 10
+
+
+@pytest.mark.asyncio
+async def test_group_commit_batches_concurrent_orders(database):
+    service = make_service(database, group_commit=True)
+    requests = [order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY") for _ in range(500)]
+
+    responses = await asyncio.gather(*[service.PlaceOrder(request, FakeContext()) for request in requests])
+
+    assert {response.order_id for response in responses} == set(database.orders)
+    stats = service.group_commit.stats()
+    assert stats["committed"] == 500
+    # One order went out alone (nothing in flight yet), the rest queued behind it
+    assert database.commits == stats["batches"] < 10
+    assert stats["largest_batch"] > 100
+
+
+@pytest.mark.asyncio
+async def test_group_commit_does_not_delay_a_lone_order(database):
+    committer = GroupCommitter(database.unit_of_work, max_wait=10.0)
+    order = Order(order_id="o-1", symbol="BTC", quantity=1, price=1.0, side="BUY")
+
+    await asyncio.wait_for(committer.submit(order), timeout=1)
+
+    assert database.orders == {"o-1": order}
+
+
+@pytest.mark.asyncio
+async def test_group_commit_failure_reaches_every_caller_in_batch(database):
+    class FailingUnitOfWork(FakeUnitOfWork):
+        async def commit(self):
+            raise RuntimeError("disk full")
+
+    committer = GroupCommitter(lambda: FailingUnitOfWork(database))
+    orders = [Order(order_id=f"o-{i}", symbol="BTC", quantity=1, price=1.0, side="BUY") for i in range(5)]
+
+    results = await asyncio.gather(*[committer.submit(order) for order in orders], return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert database.orders == {}
+
+
+@pytest.mark.asyncio
+async def test_orders_commit_without_the_broker_and_relay_drains_outbox(order_service, database):
+    order_service.events = None  # any use of the broker on the order path would fail
+
+    requests = [order_pb2.OrderRequest(symbol="ETH", quantity=1, side="SELL") for _ in range(3)]
+    responses = [await order_service.PlaceOrder(request, FakeContext()) for request in requests]
+
+    assert len(database.outbox) == 3
+
+    exchange = FakeExchange()
+    relay = OutboxRelay(database.unit_of_work, EventPublisher(FakeChannelPool([exchange])),
+                        topic_prefix="order.", batch_size=2)
+    assert await relay.drain_once() == 2
+    assert await relay.drain_once() == 1
+
+    assert database.outbox == {}
+    assert [body["order_id"] for _, body in exchange.published] == [r.order_id for r in responses]
+    assert {key for key, _ in exchange.published} == {"order.created"}
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_keeps_events_for_retry(order_service, database):
+    await order_service.PlaceOrder(order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY"), FakeContext())
+
+    class BrokerDown:
+        async def publish_batch(self, events):
+            raise ConnectionError("broker unreachable")
+
+    relay = OutboxRelay(database.unit_of_work, BrokerDown(), retry_delay=0)
+    with pytest.raises(ConnectionError):
+        await relay.drain_once()
+
+    assert len(database.outbox) == 1
+    assert await order_service.outbox_relay.drain_once() == 1
+    assert database.outbox == {}
+
+
+@pytest.mark.asyncio
+async def test_risk_limits_reject_before_persistence(database):
+    service = make_service(database, risk=RiskEngine(RiskLimits(max_order_quantity=5, price_band=0.1)))
+
+    with pytest.raises(AbortError) as error:
+        await service.PlaceOrder(order_pb2.OrderRequest(symbol="BTC", quantity=6, side="BUY"), FakeContext())
+    assert error.value.args[0] == grpc.StatusCode.FAILED_PRECONDITION
+
+    response = await service.PlaceOrders(order_pb2.OrderBatchRequest(orders=[
+        order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY", account_id="acct-1"),
+        order_pb2.OrderRequest(symbol="ETH", quantity=1, price=4_000.0, side="SELL"),  # 33% off the last price
+    ]), FakeContext())
+    assert [result.status for result in response.results] == ["ACCEPTED", "REJECTED"]
+    assert "from the last price" in response.results[1].message
+
+    assert len(database.orders) == 1 and len(database.outbox) == 1
+    assert service.risk.rejections == 2
+
+
+@pytest.mark.asyncio
+async def test_accepted_orders_hold_exposure_until_persisting_fails(database, monkeypatch):
+    service = make_service(database, risk=RiskEngine(RiskLimits(max_position=3)))
+    buy = order_pb2.OrderRequest(symbol="BTC", quantity=2, side="BUY", account_id="acct-1")
+
+    await service.PlaceOrder(buy, FakeContext())
+    # Nothing has filled, but the open order counts: 2 + 2 is over the limit
+    with pytest.raises(AbortError) as error:
+        await service.PlaceOrder(buy, FakeContext())
+    assert error.value.args[0] == grpc.StatusCode.FAILED_PRECONDITION
+
+    async def database_down(self):
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(FakeUnitOfWork, "commit", database_down)
+    with pytest.raises(AbortError):
+        await service.PlaceOrder(order_pb2.OrderRequest(symbol="BTC", quantity=2, side="SELL",
+                                                        account_id="acct-1"), FakeContext())
+    with pytest.raises(AbortError):
+        await service.PlaceOrders(order_pb2.OrderBatchRequest(orders=[
+            order_pb2.OrderRequest(symbol="BTC", quantity=1, side="SELL", account_id="acct-1"),
+        ]), FakeContext())
+
+    assert len(database.orders) == 1
+    assert service.risk.open_quantity == {("acct-1", "BTC"): 2}
+
+
+@pytest.mark.asyncio
+async def test_symbol_actors_serialize_per_symbol_and_run_symbols_in_parallel():
+    running = {}
+    peak = {}
+    order = []
+
+    async def handler(actor, value):
+        running[actor.symbol] = running.get(actor.symbol, 0) + 1
+        peak[actor.symbol] = max(peak.get(actor.symbol, 0), running[actor.symbol])
+        peak["ALL"] = max(peak.get("ALL", 0), sum(running.values()))
+        await asyncio.sleep(0.001)
+        running[actor.symbol] -= 1
+        if value == "bad":
+            raise ValueError(value)
+        order.append((actor.symbol, value, actor.sequence))
+        return value
+
+    actors = SymbolActors(handler)
+    results = await asyncio.gather(
+        *[actors.ask("btc" if i % 2 else "ETH", i) for i in range(10)],
+        actors.ask("BTC", "bad"),
+        return_exceptions=True,
+    )
+
+    assert results[:10] == list(range(10)) and isinstance(results[10], ValueError)
+    assert peak["BTC"] == peak["ETH"] == 1 and peak["ALL"] == 2
+    assert [value for symbol, value, _ in order if symbol == "BTC"] == [1, 3, 5, 7, 9]
+    assert [sequence for symbol, _, sequence in order if symbol == "ETH"] == [1, 2, 3, 4, 5]
+
+    metrics = actors.metrics()
+    assert metrics["BTC"]["processed"] == 5 and metrics["BTC"]["failed"] == 1
+    assert metrics["BTC"]["max_mailbox_depth"] >= 5 and metrics["BTC"]["mailbox_depth"] == 0
+    assert metrics["ETH"]["latency_ms"]["max"] >= metrics["ETH"]["latency_ms"]["p50"] > 0
+    await actors.close()
+    assert actors.actors == {}
+
+
+@pytest.mark.asyncio
+async def test_idle_actors_are_reaped_and_unpriced_symbols_get_none(order_service):
+    order_service.actors.idle_timeout = 0.02
+    await order_service.PlaceOrder(order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY"), FakeContext())
+    with pytest.raises(AbortError):
+        await order_service.PlaceOrder(order_pb2.OrderRequest(symbol="DOGE", quantity=1, side="BUY"), FakeContext())
+    assert list(order_service.actors.actors) == ["BTC"]
+
+    await asyncio.sleep(0.1)
+    assert order_service.actors.actors == {} and order_service.actors.reaped == 1
+
+    # A new order starts a new actor
+    await order_service.PlaceOrder(order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY"), FakeContext())
+    assert list(order_service.actors.actors) == ["BTC"]
+    await order_service.actors.close()
+
+
+@pytest.mark.asyncio
+async def test_order_service_acks_from_journal(database, tmp_path, monkeypatch):
+    monkeypatch.setattr("src.services.order_service.server.ORDER_JOURNAL_FLUSH_INTERVAL_MS", 3_600_000)
+    service = make_service(database, journal_path=str(tmp_path / "orders.journal"))
+    await service.journal.open()
+
+    response = await service.PlaceOrder(order_pb2.OrderRequest(symbol="BTC", quantity=1, side="BUY"), FakeContext())
+    batch = await service.PlaceOrders(order_pb2.OrderBatchRequest(orders=[
+        order_pb2.OrderRequest(symbol="ETH", quantity=2, side="SELL")] * 3), FakeContext())
+    assert response.status == "ACCEPTED" and all(r.status == "ACCEPTED" for r in batch.results)
+    assert database.commits == 0 and service.journal.backlog == 4
+
+    await service.journal.close()
+    assert response.order_id in database.orders and len(database.orders) == 4
+    assert database.commits == 1 and len(database.outbox) == 4
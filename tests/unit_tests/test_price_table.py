@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.generated import market_data_pb2
+from src.services.market_data_service.price_table import LastPriceTable
+from src.services.market_data_service.server import MarketDataService
+
+
+class FakeContext:
+    def __init__(self):
+        self.aborted = None
+
+    async def abort(self, code, details):
+        self.aborted = (code, details)
+        raise RuntimeError(details)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_resolves_on_first_update():
+    table = LastPriceTable()
+
+    waiter = asyncio.create_task(table.wait_for("BTC", timeout=1))
+    await asyncio.sleep(0)
+    table.update("BTC", "tick-1")
+
+    assert await waiter == "tick-1"
+    assert table.get("BTC") == "tick-1"
+    assert await table.wait_for("ETH", timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_get_price_starts_feed_then_serves_from_table():
+    service = MarketDataService(tick_interval=0.01)
+    request = market_data_pb2.MarketDataRequest(symbol="btc")
+
+    first = await service.GetPrice(request, FakeContext())
+    assert first.symbol == "BTC"
+
+    # The pinned feed keeps running without subscribers and refreshes the table
+    published = service.broadcaster.feeds["BTC"].messages_published
+    await asyncio.sleep(0.05)
+    second = await service.GetPrice(request, FakeContext())
+    assert second.timestamp > first.timestamp
+    assert service.broadcaster.feeds["BTC"].messages_published > published
+
+    await service.broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_get_prices_returns_requested_symbols():
+    service = MarketDataService(tick_interval=0.01)
+    request = market_data_pb2.MultiSymbolRequest(symbols=["BTC", "ETH", "SOL"])
+
+    batch = await service.GetPrices(request, FakeContext())
+
+    assert [tick.symbol for tick in batch.ticks] == ["BTC", "ETH", "SOL"]
+    await service.broadcaster.close()
+
+
+@pytest.mark.asyncio
+async def test_unused_price_pins_expire():
+    service = MarketDataService(tick_interval=0.01, price_pin_ttl=0.1)
+    await service.GetPrice(market_data_pb2.MarketDataRequest(symbol="JUNK"), FakeContext())
+    await service.GetPrice(market_data_pb2.MarketDataRequest(symbol="BTC"), FakeContext())
+    junk = service.broadcaster.feeds["JUNK"]
+
+    # BTC keeps being looked up, JUNK does not
+    for _ in range(6):
+        await asyncio.sleep(0.04)
+        await service.GetPrice(market_data_pb2.MarketDataRequest(symbol="BTC"), FakeContext())
+
+    assert "JUNK" not in service.broadcaster.feeds
+    assert junk.task.cancelled()
+    assert service.broadcaster.last_prices.get("JUNK") is None
+    assert "BTC" in service.broadcaster.feeds
+
+    await service.broadcaster.close()
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from src.services.market_data_service.replay import ReplayClock
+from src.services.market_data_service.server import MarketDataService
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the test sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def replay_delays(speed, timestamps):
+    """Delays the clock asks for when every wait is slept exactly."""
+    clock = FakeClock()
+    replay_clock = ReplayClock(speed, monotonic=clock.monotonic)
+    for timestamp in timestamps:
+        delay = replay_clock.delay_for(timestamp)
+        if delay > 0:
+            clock.sleep(delay)
+    return clock.sleeps
+
+
+def test_real_time_preserves_inter_tick_gaps():
+    assert replay_delays(1.0, [1_000, 1_500, 3_500]) == [0.5, 2.0]
+
+
+def test_speed_multiple_compresses_gaps():
+    assert replay_delays(10.0, [1_000, 1_100, 1_500, 3_500]) == [0.01, 0.04, 0.2]
+
+
+def test_as_fast_as_possible_never_sleeps():
+    assert replay_delays(0, [1_000, 1_100, 1_500, 3_500]) == []
+    assert replay_delays(float("inf"), [1_000, 1_100]) == []
+
+
+def test_schedule_absorbs_slow_consumers():
+    """If the consumer was late, the next delay shrinks instead of drifting."""
+    clock = FakeClock()
+    replay_clock = ReplayClock(speed=1.0, monotonic=clock.monotonic)
+
+    replay_clock.delay_for(0)
+    clock.now = 1.5  # consumer took 1.5s to handle the first tick
+
+    assert replay_clock.delay_for(1_000) == 0.0
+    assert replay_clock.delay_for(2_000) == 0.5
+
+
+@pytest.mark.asyncio
+async def test_service_replays_recorded_ticks(tmp_path):
+    csv_file = tmp_path / "ticks.csv"
+    csv_file.write_text(
+        "symbol,price,timestamp\n"
+        "BTCUSD,60000,12:00:01\n"
+        "ETHUSD,3000,12:00:01\n"
+        "BTCUSD,60001,12:00:02\n",
+        encoding="utf-8",
+    )
+    service = MarketDataService(replay_file=str(csv_file), replay_speed=0)
+
+    subscription = service.broadcaster.subscribe("BTC/USD")
+    responses = [response async for response in subscription]
+
+    assert [r.price for r in responses] == [60000.0, 60001.0]
+    assert responses[1].timestamp - responses[0].timestamp == 1000
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_many_symbols_from_one_pass(tmp_path):
+    """Feeds share one reader: 60 symbols must not wait on 60 executor threads."""
+    symbols = [f"SYM{i}" for i in range(60)]
+    rows = [f"{s},100,12:00:00" for s in symbols] + [f"{s},101,12:00:30" for s in symbols]
+    csv_file = tmp_path / "ticks.csv"
+    csv_file.write_text("symbol,price,timestamp\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    service = MarketDataService(replay_file=str(csv_file), replay_speed=1.0)
+
+    subscriptions = [service.broadcaster.subscribe(symbol) for symbol in symbols]
+    first = await asyncio.wait_for(
+        asyncio.gather(*[subscription.__anext__() for subscription in subscriptions]), timeout=3
+    )
+
+    assert [tick.symbol for tick in first] == symbols
+    assert service._replay.ticks_routed == 60
+    await service.broadcaster.close()
+    assert service._replay.finished
+
+
+@pytest.mark.asyncio
+async def test_replay_restarts_after_it_ends(tmp_path):
+    csv_file = tmp_path / "ticks.csv"
+    csv_file.write_text("symbol,price,timestamp\nBTCUSD,1,0\nBTCUSD,2,1\n", encoding="utf-8")
+    service = MarketDataService(replay_file=str(csv_file), replay_speed=0)
+
+    first = [r.price async for r in service.broadcaster.subscribe("BTCUSD")]
+    again = [r.price async for r in service.broadcaster.subscribe("BTCUSD")]
+
+    assert first == again == [1.0, 2.0]
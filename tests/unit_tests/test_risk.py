@@ -0,0 +1,63 @@
+import pytest
+
+from src.domain.exceptions import RiskLimitExceededError
+from src.domain.risk import RiskEngine, RiskLimits
+
+
+@pytest.fixture
+def risk():
+    return RiskEngine(
+        RiskLimits(max_order_quantity=10, max_position=15, max_notional=1_000_000, price_band=0.05),
+        symbol_limits={"ETH": RiskLimits(max_order_quantity=100)},
+    )
+
+
+def test_accepts_order_within_limits(risk):
+    risk.check("acct-1", "BTC", "BUY", 10, 50_000.0, last_price=50_500.0)
+    assert risk.checks == 1 and risk.rejections == 0
+
+
+@pytest.mark.parametrize("side, quantity, price, match", [
+    ("BUY", 11, 50_000.0, "Order quantity"),
+    ("BUY", 1, 56_000.0, "from the last price"),       # fat finger: 12% above
+    ("SELL", 1, 44_000.0, "from the last price"),
+])
+def test_rejects_order_size_and_price_band(risk, side, quantity, price, match):
+    with pytest.raises(RiskLimitExceededError, match=match):
+        risk.check("acct-1", "BTC", side, quantity, price, last_price=50_000.0)
+    assert risk.rejections == 1
+
+
+def test_position_and_exposure_follow_fills_per_account(risk):
+    risk.on_fill("acct-1", "btc", "BUY", 8, 50_000.0)
+    risk.on_fill("acct-1", "BTC", "SELL", 2, 51_000.0)
+    assert risk.position("acct-1", "BTC") == 6
+    assert risk.exposure("acct-1", "BTC") == 8 * 50_000.0 - 2 * 51_000.0
+
+    with pytest.raises(RiskLimitExceededError, match="Position"):
+        risk.check("acct-1", "BTC", "BUY", 10, 50_000.0)
+    # Reducing the position is fine, and other accounts are unaffected
+    risk.check("acct-1", "BTC", "SELL", 10, 50_000.0)
+    risk.check("acct-2", "BTC", "BUY", 10, 50_000.0)
+
+    with pytest.raises(RiskLimitExceededError, match="Exposure"):
+        risk.check("acct-1", "BTC", "BUY", 9, 150_000.0)
+
+
+def test_symbol_limits_override_defaults(risk):
+    risk.check("acct-1", "ETH", "BUY", 50, 3_000.0, last_price=1_000.0)   # no band or position limit for ETH
+    with pytest.raises(RiskLimitExceededError):
+        risk.check("acct-1", "ETH", "BUY", 101, 3_000.0)
+
+
+def test_open_orders_count_until_released(risk):
+    risk.check("acct-1", "BTC", "BUY", 10, 50_000.0)
+    risk.reserve("acct-1", "BTC", "BUY", 10, 50_000.0)
+    assert risk.open_exposure("acct-1", "btc") == 500_000.0
+
+    with pytest.raises(RiskLimitExceededError, match="Position"):
+        risk.check("acct-1", "BTC", "BUY", 6, 50_000.0)
+
+    risk.release("acct-1", "BTC", "BUY", 10, 50_000.0)
+    risk.check("acct-1", "BTC", "BUY", 6, 50_000.0)
+    assert risk.open_quantity == {} and risk.open_notional == {}
@@ -0,0 +1,59 @@
+from collections import Counter
+
+import pytest
+
+from src.infrastructure.grpc_client import GrpcClientManager
+from src.infrastructure.sharding import ConsistentHashRing, parse_shard_map
+
+SYMBOLS = [f"SYM{i}" for i in range(2_000)]
+
+
+def test_parse_shard_map():
+    assert parse_shard_map(" a=host1:50052, b=host2:50053 ,") == {"a": "host1:50052", "b": "host2:50053"}
+    for spec in ["", "a", "a=", "=host:1"]:
+        with pytest.raises(ValueError):
+            parse_shard_map(spec)
+
+
+def test_ring_spreads_symbols_and_is_deterministic():
+    ring = ConsistentHashRing(["a", "b", "c", "d"])
+    counts = Counter(ring.get(symbol) for symbol in SYMBOLS)
+
+    assert set(counts) == {"a", "b", "c", "d"}
+    assert min(counts.values()) > len(SYMBOLS) / 4 * 0.6
+    # Placement depends only on shard names: another gateway agrees
+    assert all(ConsistentHashRing(["d", "c", "b", "a"]).get(s) == ring.get(s) for s in SYMBOLS)
+
+
+def test_adding_a_shard_only_moves_symbols_to_it():
+    ring = ConsistentHashRing(["a", "b", "c", "d"])
+    before = {symbol: ring.get(symbol) for symbol in SYMBOLS}
+
+    ring.add("e")
+    moved = [symbol for symbol in SYMBOLS if ring.get(symbol) != before[symbol]]
+    assert all(ring.get(symbol) == "e" for symbol in moved)
+    assert 0.1 < len(moved) / len(SYMBOLS) < 0.3
+
+    ring.remove("e")
+    assert {symbol: ring.get(symbol) for symbol in SYMBOLS} == before
+    assert ring.shards == ["a", "b", "c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_client_manager_routes_each_symbol_to_one_shard(monkeypatch):
+    monkeypatch.setattr("src.infrastructure.grpc_client.ORDER_SERVICE_SHARDS",
+                        "a=localhost:50061,b=localhost:50062,c=localhost:50063")
+    manager = object.__new__(GrpcClientManager)
+    manager.order_channels, manager.order_stubs, manager.order_ring = {}, {}, None
+    manager.market_channel = manager.market_stub = None
+
+    with pytest.raises(RuntimeError):
+        manager.get_order_stub("BTC")
+
+    await manager.initialize()
+    try:
+        assert set(manager.order_stubs) == {"a", "b", "c"}
+        assert manager.get_order_stub("btc") is manager.order_stubs[manager.order_ring.get("BTC")]
+        assert len({id(manager.get_order_stub(symbol)) for symbol in SYMBOLS[:100]}) == 3
+    finally:
+        await manager.close()
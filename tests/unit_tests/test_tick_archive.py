@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.infrastructure.tick_archive import (
+    TickArchiveReader,
+    TickArchiveWriter,
+    convert_csv_to_archive,
+    decode_varints,
+    encode_varints,
+    zigzag_decode,
+    zigzag_encode,
+)
+
+
+def test_varint_and_zigzag_round_trip():
+    values = np.array([0, 1, 127, 128, 300, 2**35, 2**63 - 1], dtype=np.uint64)
+    assert decode_varints(encode_varints(values)).tolist() == values.tolist()
+
+    signed = np.array([0, -1, 1, -64, 64, -(2**40)], dtype=np.int64)
+    assert zigzag_decode(zigzag_encode(signed)).tolist() == signed.tolist()
+
+
+def test_archive_round_trip_across_blocks(tmp_path):
+    """Interleaved symbols survive per-symbol delta encoding and block splits."""
+    archive = tmp_path / "ticks.cfta"
+    ticks = [
+        ("BTC", 60000.1234, 0.5, 1_700_000_000_000),
+        ("ETH", 3000.5, 2.25, 1_700_000_000_003),
+        ("BTC", 59999.9, 0.00000001, 1_700_000_000_003),
+        ("SOL", 150.0, 10.0, 1_700_000_000_010),
+        ("ETH", 3001.0, 1.0, 1_700_000_000_011),
+    ]
+
+    with TickArchiveWriter(str(archive), block_size=2) as writer:
+        for tick in ticks:
+            writer.write(*tick)
+
+    reader = TickArchiveReader(str(archive))
+    assert len(reader) == 3  # 2 + 2 + 1
+
+    rows = list(reader.start_stream())
+    assert [r["symbol"] for r in rows] == [t[0] for t in ticks]
+    assert [r["timestamp"] for r in rows] == [t[3] for t in ticks]
+    assert [r["price"] for r in rows] == pytest.approx([t[1] for t in ticks])
+    assert [r["volume"] for r in rows] == pytest.approx([t[2] for t in ticks])
+
+    # Blocks are independent: decoding in parallel yields the same columns
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        parallel = list(reader.iter_blocks(executor=pool))
+    assert sum(len(block) for block in parallel) == len(ticks)
+    assert parallel[1].symbols == ["BTC", "SOL"]
+
+
+def test_convert_csv_to_archive(tmp_path):
+    csv_file = tmp_path / "ticks.csv"
+    csv_file.write_text(
+        "symbol,price,timestamp\n"
+        "BTCUSD,60000,12:00:01\n"
+        "BTCUSD,60001,12:00:02\n",
+        encoding="utf-8",
+    )
+    archive = tmp_path / "ticks.cfta"
+
+    assert convert_csv_to_archive(str(csv_file), str(archive)) == 2
+
+    ticks = list(TickArchiveReader(str(archive)).stream_ticks())
+    assert [t.price for t in ticks] == [60000.0, 60001.0]
+    assert ticks[1].timestamp - ticks[0].timestamp == 1000